@@ -25,10 +25,10 @@ In this example, the spreadsheet's checksum would be 8 + 4 + 6 = 18.
 What is the checksum for the spreadsheet in your puzzle input?
 """
 
-from parse import parse
+from collections.abc import Iterable
 
 
-def run_checksum(sheet: list[list[int]]) -> int:
+def run_checksum(sheet: Iterable[list[int]]) -> int:
     checksum = 0
 
     for row in sheet:
@@ -42,9 +42,14 @@ def run_checksum(sheet: list[list[int]]) -> int:
     return checksum
 
 
+def _parse_row(raw_row: str) -> list[int]:
+    return list(map(int, raw_row.split()))
+
+
+assert _parse_row("5\t1\t9\t5\n") == [5, 1, 9, 5]
+
 assert run_checksum([[5, 1, 9, 5], [7, 5, 3], [2, 4, 6, 8]]) == 18
 
 
 with open("2017/02_corruption_checksum/input.txt") as f:
-    sheet = [parse("{:\t<d}" * 16, line.strip()).fixed for line in f]
-    print(run_checksum(sheet))
+    print(run_checksum(map(_parse_row, f)))
@@ -30,24 +30,48 @@ In this example, the sum of the results would be 4 + 3 + 2 = 9.
 What is the sum of each row's result in your puzzle input?
 """
 
-from itertools import combinations
+from collections import Counter
+from collections.abc import Iterable, Iterator
 
-from parse import parse
 
+def run_checksum(sheet: Iterable[list[int]]) -> int:
+    return sum(sum(_find_quotients(row)) for row in sheet)
 
-def run_checksum(sheet: list[list[int]]) -> int:
-    checksum = 0
 
-    for row in sheet:
-        for a, b in combinations(sorted(row), 2):
-            if b % a == 0:
-                checksum += b // a
+def _find_quotients(row: list[int]) -> Iterator[int]:
+    counts = Counter(row)
+    values = sorted(counts)
+    largest = values[-1]
 
-    return checksum
+    for i, a in enumerate(values):
+        a_count = counts[a]
+        yield a_count * (a_count - 1) // 2
 
+        # walk the multiples of a only while there are fewer of them
+        # than values left to test
+        if largest // a < len(values):
+            for quotient, b in enumerate(range(2 * a, largest + 1, a), start=2):
+                if b in counts:
+                    yield quotient * a_count * counts[b]
+        else:
+            for b in values[i + 1 :]:
+                if b % a == 0:
+                    yield b // a * a_count * counts[b]
+
+
+def _parse_row(raw_row: str) -> list[int]:
+    return list(map(int, raw_row.split()))
+
+
+assert _parse_row("5\t9\t2\t8\n") == [5, 9, 2, 8]
+
+assert sum(_find_quotients([5, 9, 2, 8])) == 4
+assert sum(_find_quotients([3, 3, 3, 6])) == 3 + 2 * 3
+assert sum(_find_quotients([3, 7, 30_000_001])) == 0
+assert sum(_find_quotients([2, 4_000_000_000])) == 2_000_000_000
+assert sum(_find_quotients([2, 3, 4, 5, 6, 7, 8])) == 2 + 3 + 4 + 2 + 2
 
 assert run_checksum([[5, 9, 2, 8], [9, 4, 7, 3], [3, 8, 6, 5]]) == 9
 
 with open("2017/02_corruption_checksum/input.txt") as f:
-    sheet = [parse("{:\t<d}" * 16, line.strip()).fixed for line in f]
-    print(run_checksum(sheet))
+    print(run_checksum(map(_parse_row, f)))
@@ -32,21 +32,69 @@ How many steps are required to carry the data
 from the square identified in your puzzle input all the way to the access port?
 """
 
-from itertools import count
+from collections.abc import Iterable, Iterator
+from math import isqrt
+from typing import NamedTuple
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
 
 
 def solve(square: int) -> int:
-    for circle in count(1):
-        side = (circle - 1) * 2 + 1
-        if side**2 > square:
-            break
+    x, y = index_to_xy(square)
+    return abs(x) + abs(y)
+
+
+def index_to_xy(index: int) -> Point:
+    if index == 1:
+        return Point(0, 0)
+
+    ring = (isqrt(index - 1) + 1) // 2
+    side = 2 * ring
+    steps_back = (side + 1) ** 2 - index
+
+    if steps_back <= side:
+        return Point(ring - steps_back, -ring)
+    if steps_back <= 2 * side:
+        return Point(-ring, -ring + steps_back - side)
+    if steps_back <= 3 * side:
+        return Point(-ring + steps_back - 2 * side, ring)
+    return Point(ring, ring - steps_back + 3 * side)
+
+
+def xy_to_index(x: int, y: int) -> int:
+    ring = max(abs(x), abs(y))
+    side = 2 * ring
+
+    if y == -ring:
+        steps_back = ring - x
+    elif x == -ring:
+        steps_back = side + y + ring
+    elif y == ring:
+        steps_back = 2 * side + x + ring
+    else:
+        steps_back = 3 * side + ring - y
+
+    return (side + 1) ** 2 - steps_back
+
+
+def indices_to_xy(indices: Iterable[int]) -> Iterator[Point]:
+    return map(index_to_xy, indices)
 
-    radials = [side**2 - (side - 1) / 2 - i * (side - 1) for i in range(4)]
-    steps_to_radial = min(abs(square - radial) for radial in radials)
 
-    return steps_to_radial + circle - 1
+assert index_to_xy(1) == (0, 0)
+assert index_to_xy(2) == (1, 0)
+assert index_to_xy(5) == (-1, 1)
+assert index_to_xy(9) == (1, -1)
+assert index_to_xy(10) == (2, -1)
+assert index_to_xy(23) == (0, -2)
 
+assert all(xy_to_index(*index_to_xy(i)) == i for i in range(1, 1_000))
+assert list(indices_to_xy([1, 2, 3])) == [(0, 0), (1, 0), (1, 1)]
 
+assert solve(1) == 0
 assert solve(12) == 3
 assert solve(23) == 2
 assert solve(1024) == 31
@@ -0,0 +1,104 @@
+"""
+As a stress test on the system,
+the programs here clear the grid and then store the value 1 in square 1.
+Then, in the same allocation order as shown above,
+they store the sum of the values in all adjacent squares, including diagonals.
+
+So, the first few squares' values are chosen as follows:
+
+- Square 1 starts with the value 1.
+- Square 2 has only one adjacent filled square (with value 1), so it also stores 1.
+- Square 3 has both of the above squares as neighbors
+  and stores the sum of their values, 2.
+- Square 4 has all three of the aforementioned squares as neighbors
+  and stores the sum of their values, 4.
+- Square 5 only has the first and fourth squares as neighbors, so it gets the value 5.
+
+Once a square is written, its value does not change.
+Therefore, the first few squares would receive the following values:
+
+147  142  133  122   59
+304    5    4    2   57
+330   10    1    1   54
+351   11   23   25   26
+362  747  806--->   ...
+
+What is the first value written that is larger than your puzzle input?
+"""
+
+from collections.abc import Iterator
+from itertools import count, product
+from math import isqrt
+from typing import NamedTuple
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+NEIGHBOURS = [(dx, dy) for dx, dy in product((-1, 0, 1), repeat=2) if dx or dy]
+
+# values written so far, square N is stored at position N - 1
+_written: list[int] = [1]
+
+
+def solve(limit: int) -> int:
+    return next(value for value in neighbour_sums() if value > limit)
+
+
+def neighbour_sums() -> Iterator[int]:
+    for index in count(1):
+        if index > len(_written):
+            _written.append(_get_neighbour_sum(index))
+        yield _written[index - 1]
+
+
+def _get_neighbour_sum(index: int) -> int:
+    x, y = index_to_xy(index)
+    neighbours = (xy_to_index(x + dx, y + dy) for dx, dy in NEIGHBOURS)
+    return sum(_written[neighbour - 1] for neighbour in neighbours if neighbour < index)
+
+
+def index_to_xy(index: int) -> Point:
+    if index == 1:
+        return Point(0, 0)
+
+    ring = (isqrt(index - 1) + 1) // 2
+    side = 2 * ring
+    steps_back = (side + 1) ** 2 - index
+
+    if steps_back <= side:
+        return Point(ring - steps_back, -ring)
+    if steps_back <= 2 * side:
+        return Point(-ring, -ring + steps_back - side)
+    if steps_back <= 3 * side:
+        return Point(-ring + steps_back - 2 * side, ring)
+    return Point(ring, ring - steps_back + 3 * side)
+
+
+def xy_to_index(x: int, y: int) -> int:
+    ring = max(abs(x), abs(y))
+    side = 2 * ring
+
+    if y == -ring:
+        steps_back = ring - x
+    elif x == -ring:
+        steps_back = side + y + ring
+    elif y == ring:
+        steps_back = 2 * side + x + ring
+    else:
+        steps_back = 3 * side + ring - y
+
+    return (side + 1) ** 2 - steps_back
+
+
+sums = neighbour_sums()
+assert [next(sums) for _ in range(12)] == [1, 1, 2, 4, 5, 10, 11, 23, 25, 26, 54, 57]
+assert _written[:5] == [1, 1, 2, 4, 5]
+
+assert solve(1) == 2
+assert solve(59) == 122
+assert solve(747) == 806
+
+print(solve(277_678))
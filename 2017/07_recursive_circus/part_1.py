@@ -67,43 +67,63 @@ Before you're ready to help them, you need to make sure your information is corr
 What is the name of the bottom program?
 """
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 
-from parse import parse
-
-type Disc = list[Tower]
 type Name = str
+type Id = int
 
 
 @dataclass
 class Tower:
-    name: str
+    name: Name
     weight: int
     children: list[Name]
 
 
+@dataclass
+class TowerTree:
+    names: list[Name]
+    weights: list[int]
+    children: list[list[Id]]
+    bottom: Id
+
+
 def find_bottom(raw_towers: list[str]) -> Name:
-    towers = list(map(_parse_tower, raw_towers))
-    parents = {}
+    tree = build_tree(map(_parse_tower, raw_towers))
+    return tree.names[tree.bottom]
 
-    for tower in towers:
-        for child in tower.children:
-            parents[child] = tower.name
+
+def build_tree(towers: Iterable[Tower]) -> TowerTree:
+    ids: dict[Name, Id] = {}
+    weights: list[int] = []
+    children: list[list[Id]] = []
+
+    def intern(name: Name) -> Id:
+        if name not in ids:
+            ids[name] = len(ids)
+            weights.append(0)
+            children.append([])
+        return ids[name]
 
     for tower in towers:
-        if not parents.get(tower.name):
-            return tower.name
+        id_ = intern(tower.name)
+        weights[id_] = tower.weight
+        children[id_] = [intern(child) for child in tower.children]
 
-    raise ValueError
+    has_parent = bytearray(len(ids))
+    for child_ids in children:
+        for child in child_ids:
+            has_parent[child] = 1
 
+    return TowerTree(list(ids), weights, children, has_parent.index(0))
 
-def _parse_tower(raw_tower: str) -> Tower:
-    desc, *raw_children = raw_tower.split(" -> ")
-    name, weight = parse("{:w} ({:d})", desc).fixed
 
-    children = raw_children[0].split(", ") if raw_children else []
+def _parse_tower(raw_tower: str) -> Tower:
+    name, raw_weight, *raw_children = raw_tower.split(maxsplit=3)
+    children = raw_children[1].split(", ") if raw_children else []
 
-    return Tower(name, weight, children)
+    return Tower(name, int(raw_weight[1:-1]), children)
 
 
 assert _parse_tower("pbga (66)") == Tower("pbga", 66, [])
@@ -113,6 +133,9 @@ assert _parse_tower("padx (45) -> pbga, havc, qoyq") == Tower(
     ["pbga", "havc", "qoyq"],
 )
 
+tree = build_tree([Tower("padx", 45, ["pbga", "havc"]), Tower("pbga", 66, [])])
+assert tree == TowerTree(["padx", "pbga", "havc"], [45, 66, 0], [[1, 2], [], []], 0)
+
 towers = [
     "pbga (66)",
     "xhth (57)",
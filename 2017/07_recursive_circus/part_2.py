@@ -0,0 +1,166 @@
+"""
+The programs explain the situation: they can't get down.
+Rather, they could get down, if they weren't expending all of their energy
+trying to keep the tower balanced.
+Apparently, one program has the wrong weight,
+and until it's fixed, they're stuck here.
+
+For any program holding a disc,
+each program standing on that disc forms a sub-tower.
+Each of those sub-towers are supposed to be the same weight,
+or the disc itself isn't balanced.
+The weight of a tower is the sum of the weights of the programs in that tower.
+
+In the example above, this means that for ugml's disc to be balanced,
+gyxo, ebii, and jptl must all have the same weight, and they do: 61.
+
+However, for tknk to be balanced,
+each of the programs standing on its disc and all programs above it must each match.
+This means that the following sums must all be the same:
+
+- ugml + (gyxo + ebii + jptl) = 68 + (61 + 61 + 61) = 251
+- padx + (pbga + havc + qoyq) = 45 + (66 + 66 + 66) = 243
+- fwft + (ktlj + cntj + xhth) = 72 + (57 + 57 + 57) = 243
+
+As you can see, tknk's disc is unbalanced:
+ugml's stack is heavier than the other two.
+Even though the nodes above ugml are balanced, ugml itself is too heavy:
+it needs to be 8 units lighter for its stack to weigh 243
+and keep the towers balanced. If this change were made, its weight would be 60.
+
+Given that exactly one program is the wrong weight,
+what would its weight need to be to balance the entire tower?
+"""
+
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+type Name = str
+type Id = int
+
+
+@dataclass
+class Tower:
+    name: Name
+    weight: int
+    children: list[Name]
+
+
+@dataclass
+class TowerTree:
+    names: list[Name]
+    weights: list[int]
+    children: list[list[Id]]
+    bottom: Id
+
+
+def find_correct_weight(raw_towers: list[str]) -> tuple[Name, int]:
+    tree = build_tree(map(_parse_tower, raw_towers))
+    totals = tree.weights.copy()
+
+    # every node comes after all of its descendants,
+    # so the first unbalanced disc has only balanced sub-towers above it
+    for node in reversed(_get_preorder(tree)):
+        children = tree.children[node]
+
+        if odd_child := _find_odd_child(children, totals):
+            child, expected = odd_child
+            return tree.names[child], tree.weights[child] + expected - totals[child]
+
+        totals[node] += sum(totals[child] for child in children)
+
+    msg = "The tower is already balanced"
+    raise ValueError(msg)
+
+
+def build_tree(towers: Iterable[Tower]) -> TowerTree:
+    ids: dict[Name, Id] = {}
+    weights: list[int] = []
+    children: list[list[Id]] = []
+
+    def intern(name: Name) -> Id:
+        if name not in ids:
+            ids[name] = len(ids)
+            weights.append(0)
+            children.append([])
+        return ids[name]
+
+    for tower in towers:
+        id_ = intern(tower.name)
+        weights[id_] = tower.weight
+        children[id_] = [intern(child) for child in tower.children]
+
+    has_parent = bytearray(len(ids))
+    for child_ids in children:
+        for child in child_ids:
+            has_parent[child] = 1
+
+    return TowerTree(list(ids), weights, children, has_parent.index(0))
+
+
+def _get_preorder(tree: TowerTree) -> list[Id]:
+    order = []
+    stack = [tree.bottom]
+
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        stack.extend(tree.children[node])
+
+    return order
+
+
+def _find_odd_child(children: list[Id], totals: list[int]) -> tuple[Id, int] | None:
+    counts = Counter(totals[child] for child in children)
+    if len(counts) < 2:
+        return None
+
+    (expected, _), (odd, odd_count) = counts.most_common(2)
+    if odd_count > 1 or len(counts) > 2:
+        msg = "More than one program has the wrong weight"
+        raise ValueError(msg)
+
+    return next(child for child in children if totals[child] == odd), expected
+
+
+def _parse_tower(raw_tower: str) -> Tower:
+    name, raw_weight, *raw_children = raw_tower.split(maxsplit=3)
+    children = raw_children[1].split(", ") if raw_children else []
+
+    return Tower(name, int(raw_weight[1:-1]), children)
+
+
+towers = [
+    "pbga (66)",
+    "xhth (57)",
+    "ebii (61)",
+    "havc (66)",
+    "ktlj (57)",
+    "fwft (72) -> ktlj, cntj, xhth",
+    "qoyq (66)",
+    "padx (45) -> pbga, havc, qoyq",
+    "tknk (41) -> ugml, padx, fwft",
+    "jptl (61)",
+    "ugml (68) -> gyxo, ebii, jptl",
+    "gyxo (61)",
+    "cntj (57)",
+]
+tree = build_tree(map(_parse_tower, towers))
+assert _get_preorder(tree)[0] == tree.bottom
+assert len(_get_preorder(tree)) == len(towers)
+
+assert _find_odd_child([0, 1, 2], [1, 1, 1]) is None
+assert _find_odd_child([0, 1, 2], [1, 2, 1]) == (1, 1)
+
+assert find_correct_weight(towers) == ("ugml", 60)
+
+# deep chain that would blow the recursion limit
+chain = [f"p{i} (1) -> p{i + 1}" for i in range(100_000)]
+chain += ["p100000 (1) -> a, b, c", "a (1)", "b (1)", "c (2)"]
+assert find_correct_weight(chain) == ("c", 1)
+
+
+with open("2017/07_recursive_circus/input.txt") as f:
+    lines = [line.strip() for line in f]
+    print(find_correct_weight(lines)[1])
@@ -40,6 +40,7 @@ the highest value ever held was 10
 """
 
 from collections import defaultdict
+from collections.abc import Callable, Iterable
 from enum import StrEnum, auto
 from operator import eq, ge, gt, le, lt, ne
 from typing import NamedTuple
@@ -48,6 +49,7 @@ type Registers = dict[Register, Value]
 type Register = str
 type Value = int
 type Arg = str
+type Slot = int
 
 
 class Condition(StrEnum):
@@ -58,6 +60,20 @@ class Condition(StrEnum):
     LTE = "<="
     GTE = ">="
 
+    @property
+    def operator(self) -> Callable[[Value, Value], bool]:
+        return CONDITION_OPERATORS[self]
+
+
+CONDITION_OPERATORS = {
+    Condition.EQ: eq,
+    Condition.NEQ: ne,
+    Condition.LT: lt,
+    Condition.GT: gt,
+    Condition.LTE: le,
+    Condition.GTE: ge,
+}
+
 
 class Op(StrEnum):
     INC = auto()
@@ -71,47 +87,60 @@ class Command(NamedTuple):
     condition: Condition
     args: tuple[Register, Value]
 
+    @property
+    def delta(self) -> Value:
+        return self.value if self.op == Op.INC else -self.value
+
     def check(self, registers):
         register, value = self.args
-        register_value = registers[register]
-
-        match self.condition:
-            case Condition.EQ:
-                cond = eq
-            case Condition.NEQ:
-                cond = ne
-            case Condition.LT:
-                cond = lt
-            case Condition.GT:
-                cond = gt
-            case Condition.LTE:
-                cond = le
-            case Condition.GTE:
-                cond = ge
-
-        return cond(register_value, value)
+        return self.condition.operator(registers[register], value)
 
     def run(self, registers):
-        match self.op:
-            case Op.INC:
-                registers[self.register] += self.value
-            case Op.DEC:
-                registers[self.register] -= self.value
+        registers[self.register] += self.delta
         return registers
 
 
+class CompiledCommand(NamedTuple):
+    slot: Slot
+    delta: Value
+    cond: Callable[[Value, Value], bool]
+    arg_slot: Slot
+    arg_value: Value
+
+
 def run(raw_commands: list[str]) -> tuple[Registers, Value]:
-    registers = defaultdict(int)
+    names, program = compile_commands(map(_parse_command, raw_commands))
+    slots = [0] * len(names)
     max_value = 0
 
-    for raw_command in raw_commands:
-        command = _parse_command(raw_command)
+    for slot, delta, cond, arg_slot, arg_value in program:
+        if cond(slots[arg_slot], arg_value):
+            value = slots[slot] + delta
+            slots[slot] = value
+            max_value = max(max_value, value)
 
-        if command.check(registers):
-            registers = command.run(registers)
-            max_value = max(max_value, *registers.values())
+    return dict(zip(names, slots)), max_value
 
-    return registers, max_value
+
+def compile_commands(
+    commands: Iterable[Command],
+) -> tuple[list[Register], list[CompiledCommand]]:
+    slots: dict[Register, Slot] = {}
+    program = []
+
+    for command in commands:
+        arg_register, arg_value = command.args
+        program.append(
+            CompiledCommand(
+                slots.setdefault(command.register, len(slots)),
+                command.delta,
+                command.condition.operator,
+                slots.setdefault(arg_register, len(slots)),
+                arg_value,
+            )
+        )
+
+    return list(slots), program
 
 
 def _parse_command(raw_command: str) -> Command:
@@ -130,6 +159,16 @@ assert command.check({"a": 2}) is True
 assert command.run(defaultdict(int)) == {"b": 5}
 assert command.run({"b": 1}) == {"b": 6}
 
+assert Command("b", Op.DEC, 5, Condition.GT, ("a", 1)).delta == -5
+
+assert compile_commands([command, command._replace(register="a")]) == (
+    ["b", "a"],
+    [
+        CompiledCommand(0, 5, gt, 1, 1),
+        CompiledCommand(1, 5, gt, 1, 1),
+    ],
+)
+
 commands = [
     "b inc 5 if a > 1",
     "a inc 1 if b < 5",
@@ -34,10 +34,16 @@ For example:
 - se,sw,se,sw,sw is 3 steps away (s,s,sw).
 """
 
+from collections.abc import Iterator
 from enum import StrEnum, auto
 from itertools import accumulate
+from typing import NamedTuple
 
-type Step = tuple[int, int, int]
+
+class Hex(NamedTuple):
+    x: int
+    y: int
+    z: int
 
 
 class Dir(StrEnum):
@@ -49,38 +55,85 @@ class Dir(StrEnum):
     NW = auto()
 
 
-AXIAL_COORD_MAP: dict[Dir, Step] = {
-    Dir.N: (0, 1, -1),
-    Dir.S: (0, -1, 1),
-    Dir.NE: (1, 0, -1),
-    Dir.SW: (-1, 0, 1),
-    Dir.NW: (-1, 1, 0),
-    Dir.SE: (1, -1, 0),
+CUBE_COORD_MAP: dict[Dir, Hex] = {
+    Dir.N: Hex(0, 1, -1),
+    Dir.S: Hex(0, -1, 1),
+    Dir.NE: Hex(1, 0, -1),
+    Dir.SW: Hex(-1, 0, 1),
+    Dir.NW: Hex(-1, 1, 0),
+    Dir.SE: Hex(1, -1, 0),
 }
 
+# walking a ring counter-clockwise from its south-western corner
+RING_WALK = [Dir.SE, Dir.NE, Dir.N, Dir.NW, Dir.SW, Dir.S]
+
+ORIGIN = Hex(0, 0, 0)
+
 
 def solve(raw_steps: str) -> tuple[int, int]:
     steps = _parse_steps(raw_steps)
 
-    sum_steps = _move(*steps)
-    distances = accumulate(steps, _move)
+    path = zip(*(accumulate(axis) for axis in zip(*steps)))
+    max_dist = 0
+    position = ORIGIN
+
+    for position in path:
+        max_dist = max(max_dist, *map(abs, position))
+
+    return distance(Hex(*position)), max_dist
+
+
+def distance(hex_: Hex, other: Hex = ORIGIN) -> int:
+    return max(abs(hex_.x - other.x), abs(hex_.y - other.y), abs(hex_.z - other.z))
+
+
+def neighbours(hex_: Hex) -> list[Hex]:
+    return [_move(hex_, step) for step in CUBE_COORD_MAP.values()]
+
+
+def hex_range(center: Hex, radius: int) -> Iterator[Hex]:
+    for x in range(-radius, radius + 1):
+        for y in range(max(-radius, -x - radius), min(radius, -x + radius) + 1):
+            yield _move(center, Hex(x, y, -x - y))
+
+
+def ring(center: Hex, radius: int) -> list[Hex]:
+    if radius == 0:
+        return [center]
+
+    hex_ = _move(center, CUBE_COORD_MAP[Dir.SW], times=radius)
+    res = []
+
+    for direction in RING_WALK:
+        for _ in range(radius):
+            res.append(hex_)
+            hex_ = _move(hex_, CUBE_COORD_MAP[direction])
 
-    return _get_axial_dist(sum_steps), max(map(_get_axial_dist, distances))
+    return res
 
 
-def _move(*steps: Step) -> Step:
-    return tuple(map(sum, zip(*steps)))  # type: ignore[invalid-return-value]
+def _move(hex_: Hex, step: Hex, times: int = 1) -> Hex:
+    x, y, z = step
+    return Hex(hex_.x + x * times, hex_.y + y * times, hex_.z + z * times)
 
 
-def _get_axial_dist(step: Step) -> int:
-    return sum(map(abs, step)) / 2
+def _parse_steps(raw_steps: str) -> list[Hex]:
+    return [CUBE_COORD_MAP[Dir(step)] for step in raw_steps.strip().split(",")]
 
 
-def _parse_steps(raw_steps: str) -> list[Step]:
-    return [AXIAL_COORD_MAP[Dir(step)] for step in raw_steps.split(",")]
+assert _move(Hex(0, 1, -1), Hex(0, 1, -1)) == (0, 2, -2)
+assert _move(ORIGIN, Hex(0, 1, -1), times=3) == (0, 3, -3)
 
+assert distance(Hex(2, -1, -1)) == 2
+assert distance(Hex(2, -1, -1), Hex(1, -1, 0)) == 1
 
-assert _move((0, 1, -1), (0, 1, -1)) == (0, 2, -2)
+assert sorted(neighbours(ORIGIN)) == sorted(CUBE_COORD_MAP.values())
+assert len(list(hex_range(ORIGIN, 2))) == 19
+assert all(distance(hex_) <= 2 for hex_ in hex_range(ORIGIN, 2))
+assert ring(ORIGIN, 0) == [ORIGIN]
+assert sorted(ring(ORIGIN, 1)) == sorted(neighbours(ORIGIN))
+assert len(set(ring(ORIGIN, 3))) == 18
+assert all(distance(hex_) == 3 for hex_ in ring(ORIGIN, 3))
 
 
 assert solve("ne,ne,ne") == (3, 3)
@@ -111,8 +111,13 @@ Predict the path of the guard.
 How many distinct positions will the guard visit before leaving the mapped area?
 """
 
+from bisect import bisect_left
 from enum import StrEnum, auto
+from itertools import pairwise
 from textwrap import dedent
+from typing import NamedTuple
+
+type Position = tuple[int, int]
 
 
 class Direction(StrEnum):
@@ -122,23 +127,63 @@ class Direction(StrEnum):
     RIGHT = auto()
 
 
+class Lab(NamedTuple):
+    height: int
+    width: int
+    start: Position
+    rows: list[list[int]]  # sorted obstacle columns of every row
+    cols: list[list[int]]  # sorted obstacle rows of every column
+
+
 class NoStartError(Exception):
     pass
 
 
 def mark_routes(map_: list[list[str]]) -> list[str]:
-    position = find_start_position(map_)
-    direction = Direction.UP
+    lab = parse_lab(map_)
+    turns, _ = patrol(lab)
+    visited = mark_path(lab, turns)
+
+    for i, row in enumerate(map_):
+        for j in range(len(row)):
+            if visited[i * lab.width + j]:
+                row[j] = "X"
+
+    return map_
+
+
+def parse_lab(map_: list[list[str]]) -> Lab:
+    height, width = len(map_), len(map_[0])
+    rows = [[] for _ in range(height)]
+    cols = [[] for _ in range(width)]
+
+    for i, row in enumerate(map_):
+        for j, cell in enumerate(row):
+            if cell == "#":
+                rows[i].append(j)
+                cols[j].append(i)
+
+    return Lab(height, width, find_start_position(map_), rows, cols)
+
+
+def patrol(lab: Lab, extra: Position | None = None) -> tuple[list[Position], bool]:
+    # returns the points where the guard turns or leaves and whether it is a loop
+    position, direction = lab.start, Direction.UP
+    turns = [position]
+    seen = set()
 
     while True:
-        position = go_until_obstacle(position, direction, map_)
+        position, is_out = go_until_obstacle(position, direction, lab, extra)
+        turns.append(position)
 
-        if position is None:
-            break
+        if is_out:
+            return turns, False
 
-        direction = get_next_direction(direction)
+        if (position, direction) in seen:
+            return turns, True
 
-    return map_
+        seen.add((position, direction))
+        direction = get_next_direction(direction)
 
 
 def find_start_position(map_: list[list[str]]) -> tuple[int, int]:
@@ -153,35 +198,52 @@ def find_start_position(map_: list[list[str]]) -> tuple[int, int]:
     raise NoStartError
 
 
-def go_until_obstacle(position, direction, map_) -> tuple[int, int] | None:
+def go_until_obstacle(
+    position: Position,
+    direction: Direction,
+    lab: Lab,
+    extra: Position | None = None,
+) -> tuple[Position, bool]:
+    # jumps along the row or column straight to the next obstacle or the border
     i, j = position
-    while True:
-        map_[i][j] = "X"
 
-        next_i, next_j = get_next_position(i, j, direction)
-        if not check_borders(next_i, next_j, map_):
-            return None
+    if direction in {Direction.UP, Direction.DOWN}:
+        obstacles, pos, other, limit = lab.cols[j], i, j, lab.height
+    else:
+        obstacles, pos, other, limit = lab.rows[i], j, i, lab.width
 
-        if map_[next_i][next_j] == "#":
-            return (i, j)
+    k = bisect_left(obstacles, pos)
 
-        i, j = next_i, next_j
+    if direction in {Direction.UP, Direction.LEFT}:
+        stop = obstacles[k - 1] if k > 0 else -1
+    else:
+        stop = obstacles[k] if k < len(obstacles) else limit
 
+    if extra is not None:
+        extra_pos, extra_other = (
+            extra if direction in {Direction.UP, Direction.DOWN} else extra[::-1]
+        )
+        if extra_other == other and min(pos, stop) < extra_pos < max(pos, stop):
+            stop = extra_pos
 
-def check_borders(i, j, map_):
-    return 0 <= i < len(map_) and 0 <= j < len(map_[i])
+    is_out = stop in {-1, limit}
+    stop += 1 if direction in {Direction.UP, Direction.LEFT} else -1
 
+    if direction in {Direction.UP, Direction.DOWN}:
+        return (stop, j), is_out
+    return (i, stop), is_out
 
-def get_next_position(i, j, direction):
-    match direction:
-        case Direction.UP:
-            return (i - 1, j)
-        case Direction.DOWN:
-            return (i + 1, j)
-        case Direction.LEFT:
-            return (i, j - 1)
-        case Direction.RIGHT:
-            return (i, j + 1)
+
+def mark_path(lab: Lab, turns: list[Position]) -> bytearray:
+    visited = bytearray(lab.height * lab.width)
+
+    for (i1, j1), (i2, j2) in pairwise(turns):
+        start = min(i1, i2) * lab.width + min(j1, j2)
+        end = max(i1, i2) * lab.width + max(j1, j2) + 1
+        step = 1 if i1 == i2 else lab.width
+        visited[start:end:step] = b"\x01" * len(range(start, end, step))
+
+    return visited
 
 
 def get_next_direction(direction: Direction) -> Direction:
@@ -303,3 +365,4 @@ assert count_visits(marked) == 41
 
 with open("2024/06_guard_gallivant/input.txt") as f:
     marked_map = mark_routes(_to_array(f.read()))
+    print(count_visits(marked_map))
@@ -0,0 +1,220 @@
+"""
+While The Historians begin working around the guard's patrol route,
+you borrow their fancy device and step outside the lab.
+From the safety of a supply closet, you time travel through the last few months
+and record the nightly status of the lab's guard post on the walls of the closet.
+
+Returning after what seems like only a few seconds to The Historians,
+they explain that the guard's patrol area is simply too large
+for them to safely search the lab without getting caught.
+
+Fortunately, they are pretty sure that adding a single new obstruction
+won't cause a time paradox. They'd like to place the new obstruction
+in such a way that the guard will get stuck in a loop,
+making the rest of the lab safe to search.
+
+To have the lowest chance of creating a time paradox,
+The Historians would like to know all of the possible positions for such an obstruction.
+The new obstruction can't be placed at the guard's starting position -
+the guard is there right now and would notice.
+
+In the above example, there are only 6 different positions
+where a new obstruction would cause the guard to get stuck in a loop.
+
+You need to get the guard stuck in a loop by adding a single new obstruction.
+How many different positions could you choose for this obstruction?
+"""
+
+from bisect import bisect_left
+from collections.abc import Iterable
+from enum import StrEnum, auto
+from itertools import pairwise
+from textwrap import dedent
+from typing import NamedTuple
+
+type Position = tuple[int, int]
+
+
+class Direction(StrEnum):
+    UP = auto()
+    DOWN = auto()
+    LEFT = auto()
+    RIGHT = auto()
+
+
+class Lab(NamedTuple):
+    height: int
+    width: int
+    start: Position
+    rows: list[list[int]]  # sorted obstacle columns of every row
+    cols: list[list[int]]  # sorted obstacle rows of every column
+
+
+class NoStartError(Exception):
+    pass
+
+
+def find_loop_obstructions(
+    lab: Lab,
+    candidates: Iterable[Position] | None = None,
+) -> list[Position]:
+    if candidates is None:
+        candidates = get_route_cells(lab)
+
+    return [
+        candidate
+        for candidate in candidates
+        if candidate != lab.start and patrol(lab, extra=candidate)[1]
+    ]
+
+
+def get_route_cells(lab: Lab) -> list[Position]:
+    # an obstruction off the original route never meets the guard
+    turns, _ = patrol(lab)
+    visited = mark_path(lab, turns)
+    return [divmod(cell, lab.width) for cell, flag in enumerate(visited) if flag]
+
+
+def parse_lab(map_: list[list[str]]) -> Lab:
+    height, width = len(map_), len(map_[0])
+    rows = [[] for _ in range(height)]
+    cols = [[] for _ in range(width)]
+
+    for i, row in enumerate(map_):
+        for j, cell in enumerate(row):
+            if cell == "#":
+                rows[i].append(j)
+                cols[j].append(i)
+
+    return Lab(height, width, find_start_position(map_), rows, cols)
+
+
+def patrol(lab: Lab, extra: Position | None = None) -> tuple[list[Position], bool]:
+    # returns the points where the guard turns or leaves and whether it is a loop
+    position, direction = lab.start, Direction.UP
+    turns = [position]
+    seen = set()
+
+    while True:
+        position, is_out = go_until_obstacle(position, direction, lab, extra)
+        turns.append(position)
+
+        if is_out:
+            return turns, False
+
+        if (position, direction) in seen:
+            return turns, True
+
+        seen.add((position, direction))
+        direction = get_next_direction(direction)
+
+
+def find_start_position(map_: list[list[str]]) -> tuple[int, int]:
+    for i in range(len(map_)):
+        try:
+            j = map_[i].index("^")
+        except ValueError:
+            continue
+        else:
+            return (i, j)
+
+    raise NoStartError
+
+
+def go_until_obstacle(
+    position: Position,
+    direction: Direction,
+    lab: Lab,
+    extra: Position | None = None,
+) -> tuple[Position, bool]:
+    # jumps along the row or column straight to the next obstacle or the border
+    i, j = position
+
+    if direction in {Direction.UP, Direction.DOWN}:
+        obstacles, pos, other, limit = lab.cols[j], i, j, lab.height
+    else:
+        obstacles, pos, other, limit = lab.rows[i], j, i, lab.width
+
+    k = bisect_left(obstacles, pos)
+
+    if direction in {Direction.UP, Direction.LEFT}:
+        stop = obstacles[k - 1] if k > 0 else -1
+    else:
+        stop = obstacles[k] if k < len(obstacles) else limit
+
+    if extra is not None:
+        extra_pos, extra_other = (
+            extra if direction in {Direction.UP, Direction.DOWN} else extra[::-1]
+        )
+        if extra_other == other and min(pos, stop) < extra_pos < max(pos, stop):
+            stop = extra_pos
+
+    is_out = stop in {-1, limit}
+    stop += 1 if direction in {Direction.UP, Direction.LEFT} else -1
+
+    if direction in {Direction.UP, Direction.DOWN}:
+        return (stop, j), is_out
+    return (i, stop), is_out
+
+
+def mark_path(lab: Lab, turns: list[Position]) -> bytearray:
+    visited = bytearray(lab.height * lab.width)
+
+    for (i1, j1), (i2, j2) in pairwise(turns):
+        start = min(i1, i2) * lab.width + min(j1, j2)
+        end = max(i1, i2) * lab.width + max(j1, j2) + 1
+        step = 1 if i1 == i2 else lab.width
+        visited[start:end:step] = b"\x01" * len(range(start, end, step))
+
+    return visited
+
+
+def get_next_direction(direction: Direction) -> Direction:
+    match direction:
+        case Direction.UP:
+            return Direction.RIGHT
+        case Direction.DOWN:
+            return Direction.LEFT
+        case Direction.LEFT:
+            return Direction.UP
+        case Direction.RIGHT:
+            return Direction.DOWN
+
+
+def _to_array(s):
+    return [list(l) for l in dedent(s).strip().splitlines()]
+
+
+lab = parse_lab(
+    _to_array(
+        """
+        ....#.....
+        .........#
+        ..........
+        ..#.......
+        .......#..
+        ..........
+        .#..^.....
+        ........#.
+        #.........
+        ......#...
+        """,
+    ),
+)
+assert len(get_route_cells(lab)) == 41
+assert patrol(lab)[1] is False
+assert patrol(lab, extra=(6, 3))[1] is True
+assert patrol(lab, extra=(0, 0))[1] is False
+assert sorted(find_loop_obstructions(lab)) == [
+    (6, 3),
+    (7, 6),
+    (7, 7),
+    (8, 1),
+    (8, 3),
+    (9, 7),
+]
+assert find_loop_obstructions(lab, [(6, 3), (0, 0), (6, 4)]) == [(6, 3)]
+
+with open("2024/06_guard_gallivant/input.txt") as f:
+    lab = parse_lab(_to_array(f.read()))
+    print(len(find_loop_obstructions(lab)))
@@ -57,10 +57,9 @@ Determine which equations could possibly be true.
 What is their total calibration result?
 """
 
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from enum import StrEnum
-from itertools import chain, product, starmap, zip_longest
-from operator import add, mul
+from itertools import chain, product, zip_longest
 
 
 class Operation(StrEnum):
@@ -70,50 +69,62 @@ class Operation(StrEnum):
 
 type Equation = list[int | Operation]
 
+OPERATIONS = list(Operation)
+
 
 def find_correct_equations(
     total: int,
     operands: list[int],
 ) -> tuple[int, list[Equation]]:
-    operations = get_possible_operations(n=len(operands) - 1)
-    equations = interleave(operands, operations)
-    return total, [eq for eq in equations if check_equation(total, eq)]
+    solutions = sorted(_solve(total, operands), key=_get_operations_order)
+    return total, list(interleave(operands, solutions))
+
+
+def has_correct_equation(total: int, operands: list[int]) -> bool:
+    return next(_solve(total, operands), None) is not None
+
 
+def _solve(total: int, operands: list[int]) -> Iterator[list[Operation]]:
+    # operators are evaluated left to right,
+    # so the last operand is peeled off the total by undoing the last operation
+    *rest, last = operands
 
-def check_equation(total: int, equation: Equation) -> bool:
-    acc = 0
-    last_operation = add
+    if not rest:
+        if total == last:
+            yield []
+        return
 
-    for el in equation:
-        match el:
-            case int():
-                acc = last_operation(acc, el)
-            case Operation.ADD:
-                last_operation = add
-            case Operation.MUL:
-                last_operation = mul
+    if total >= last:
+        for ops in _solve(total - last, rest):
+            yield [*ops, Operation.ADD]
 
-        if acc > total:
-            break
+    for ops in _undo_mul(total, rest, last):
+        yield [*ops, Operation.MUL]
 
-    return acc == total
 
+def _undo_mul(total: int, rest: list[int], last: int) -> Iterator[list[Operation]]:
+    if not last:
+        # anything times zero is zero, whatever comes before it
+        if not total:
+            yield from map(list, product(OPERATIONS, repeat=len(rest) - 1))
+        return
 
-def get_possible_operations(
-    n: int,
-    operations: Operation = (Operation.ADD, Operation.MUL),
-) -> Iterator[list[Operation]]:
-    return product(operations, repeat=n)
+    if total % last == 0:
+        yield from _solve(total // last, rest)
 
 
 def interleave(
     operands: list[int],
-    operations: Iterator[list[Operation]],
+    operations: Iterable[list[Operation]],
 ) -> Iterator[list[Equation]]:
     for ops in operations:
         yield list(chain.from_iterable(zip_longest(operands, ops)))
 
 
+def _get_operations_order(ops: list[Operation]) -> list[int]:
+    return list(map(OPERATIONS.index, ops))
+
+
 def pp(equations_with_total: tuple[int, list[Equation]]) -> tuple[int, list[str]]:
     total, equations = equations_with_total
     return total, ["".join(map(str, filter(bool, eq))) for eq in equations]
@@ -123,7 +134,6 @@ def join_chars(strs):
     return ["".join(chars) for chars in strs]
 
 
-assert join_chars(get_possible_operations(2, "AB")) == ["AA", "AB", "BA", "BB"]
 assert join_chars(interleave("AB", ["CD", "EF"])) == ["ACBD", "AEBF"]
 
 assert pp(find_correct_equations(190, (10, 19))) == (190, ["10*19"])
@@ -138,6 +148,16 @@ assert find_correct_equations(161011, (16, 10, 13)) == (161011, [])
 assert find_correct_equations(192, (17, 8, 14)) == (192, [])
 assert find_correct_equations(21037, (9, 7, 18, 13)) == (21037, [])
 assert pp(find_correct_equations(292, (11, 6, 16, 20))) == (292, ["11+6*16+20"])
+assert has_correct_equation(0, [5, 0]) is True
+assert list(_solve(0, [3, 4, 0])) == [
+    [Operation.ADD, Operation.MUL],
+    [Operation.MUL, Operation.MUL],
+]
+
+assert has_correct_equation(292, [11, 6, 16, 20]) is True
+assert has_correct_equation(83, [17, 5]) is False
+assert has_correct_equation(2 * 3**19, [2, *[3] * 19]) is True
+assert has_correct_equation(2 * 3**19 + 1, [2, *[3] * 19]) is False
 
 
 def parse(raw_str):
@@ -147,5 +167,11 @@ def parse(raw_str):
 
 
 with open("2024/07_bridge_repair/input.txt") as f:
-    correct_equations = starmap(find_correct_equations, map(parse, f))
-    print(sum(res for res, equations in correct_equations if equations))
+    equations = map(parse, f)
+    print(
+        sum(
+            total
+            for total, operands in equations
+            if has_correct_equation(total, operands)
+        )
+    )
@@ -27,10 +27,9 @@ determine which equations could possibly be true.
 What is their total calibration result?
 """
 
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from enum import StrEnum
-from itertools import chain, product, starmap, zip_longest
-from operator import add, mul
+from itertools import chain, product, zip_longest
 
 
 class Operation(StrEnum):
@@ -41,56 +40,76 @@ class Operation(StrEnum):
 
 type Equation = list[int | Operation]
 
+OPERATIONS = list(Operation)
+
 
 def find_correct_equations(
     total: int,
     operands: list[int],
 ) -> tuple[int, list[Equation]]:
-    operations = combine_operations(n=len(operands) - 1)
-    equations = interleave(operands, operations)
-    return total, [eq for eq in equations if check_equation(total, eq)]
+    solutions = sorted(_solve(total, operands), key=_get_operations_order)
+    return total, list(interleave(operands, solutions))
+
+
+def has_correct_equation(total: int, operands: list[int]) -> bool:
+    return next(_solve(total, operands), None) is not None
 
 
-def check_equation(total: int, equation: Equation) -> bool:
-    acc = 0
-    last_operation = add
+def _solve(total: int, operands: list[int]) -> Iterator[list[Operation]]:
+    # operators are evaluated left to right,
+    # so the last operand is peeled off the total by undoing the last operation
+    *rest, last = operands
 
-    for el in equation:
-        match el:
-            case int():
-                acc = last_operation(acc, el)
-            case Operation.ADD:
-                last_operation = add
-            case Operation.MUL:
-                last_operation = mul
-            case Operation.CONCAT:
-                last_operation = concat
+    if not rest:
+        if total == last:
+            yield []
+        return
 
-        if acc > total:
-            break
+    if total >= last:
+        for ops in _solve(total - last, rest):
+            yield [*ops, Operation.ADD]
 
-    return acc == total
+    for ops in _undo_mul(total, rest, last):
+        yield [*ops, Operation.MUL]
 
+    power = get_power(last)
+    if total >= last and total % power == last:
+        for ops in _solve(total // power, rest):
+            yield [*ops, Operation.CONCAT]
 
-def combine_operations(
-    n: int,
-    operations: Operation = None,
-) -> Iterator[list[Operation]]:
-    if operations is None:
-        operations = list(Operation)
-    return product(operations, repeat=n)
+
+def _undo_mul(total: int, rest: list[int], last: int) -> Iterator[list[Operation]]:
+    if not last:
+        # anything times zero is zero, whatever comes before it
+        if not total:
+            yield from map(list, product(OPERATIONS, repeat=len(rest) - 1))
+        return
+
+    if total % last == 0:
+        yield from _solve(total // last, rest)
 
 
 def interleave(
     operands: list[int],
-    operations: Iterator[list[Operation]],
+    operations: Iterable[list[Operation]],
 ) -> Iterator[list[Equation]]:
     for ops in operations:
         yield list(chain.from_iterable(zip_longest(operands, ops)))
 
 
-def concat(a, b):
-    return int(f"{a}{b}")
+def concat(a: int, b: int) -> int:
+    return a * get_power(b) + b
+
+
+def get_power(n: int) -> int:
+    power = 10
+    while power <= n:
+        power *= 10
+    return power
+
+
+def _get_operations_order(ops: list[Operation]) -> list[int]:
+    return list(map(OPERATIONS.index, ops))
 
 
 def pp(equations_with_total: tuple[int, list[Equation]]) -> tuple[int, list[str]]:
@@ -102,20 +121,14 @@ def join_chars(strs):
     return ["".join(chars) for chars in strs]
 
 
-assert join_chars(combine_operations(2, "AB")) == ["AA", "AB", "BA", "BB"]
-assert join_chars(combine_operations(2, "ABC")) == [
-    "AA",
-    "AB",
-    "AC",
-    "BA",
-    "BB",
-    "BC",
-    "CA",
-    "CB",
-    "CC",
-]
 assert join_chars(interleave("AB", ["CD", "EF"])) == ["ACBD", "AEBF"]
 
+assert get_power(0) == 10
+assert get_power(9) == 10
+assert get_power(10) == 100
+assert concat(12, 345) == 12345
+assert concat(12, 0) == 120
+
 assert pp(find_correct_equations(190, (10, 19))) == (190, ["10*19"])
 assert pp(find_correct_equations(3267, (81, 40, 27))) == (
     3267,
@@ -128,6 +141,14 @@ assert find_correct_equations(161011, (16, 10, 13)) == (161011, [])
 assert pp(find_correct_equations(192, (17, 8, 14))) == (192, ["17|8+14"])
 assert find_correct_equations(21037, (9, 7, 18, 13)) == (21037, [])
 assert pp(find_correct_equations(292, (11, 6, 16, 20))) == (292, ["11+6*16+20"])
+assert has_correct_equation(0, [5, 0]) is True
+assert len(list(_solve(0, [3, 4, 0]))) == 3
+assert list(_solve(5, [0, 5])) == [[Operation.ADD], [Operation.CONCAT]]
+
+assert has_correct_equation(292, [11, 6, 16, 20]) is True
+assert has_correct_equation(83, [17, 5]) is False
+assert has_correct_equation(2 * 3**19, [2, *[3] * 19]) is True
+assert has_correct_equation(2 * 3**19 + 1, [2, *[3] * 19]) is False
 
 
 def parse(raw_str):
@@ -137,5 +158,11 @@ def parse(raw_str):
 
 
 with open("2024/07_bridge_repair/input.txt") as f:
-    correct_equations = starmap(find_correct_equations, map(parse, f))
-    print(sum(res for res, equations in correct_equations if equations))
+    equations = map(parse, f)
+    print(
+        sum(
+            total
+            for total, operands in equations
+            if has_correct_equation(total, operands)
+        )
+    )
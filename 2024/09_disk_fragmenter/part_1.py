@@ -82,91 +82,115 @@ Compact the amphipod's hard drive using the process he requested.
 What is the resulting filesystem checksum?
 """
 
-from itertools import count
+from array import array
 from typing import NamedTuple
 
-type DiskMap = list[Cell]
 
+class Extent(NamedTuple):
+    id: int
+    start: int
+    length: int
 
-class Cell(NamedTuple):
-    id: int | None
 
-    @property
-    def is_empty(self):
-        return self.id is None
+class DiskLayout(NamedTuple):
+    file_starts: array
+    file_lengths: array
+    gap_starts: array
+    gap_lengths: array
 
 
-def defragment(disk_map: DiskMap) -> DiskMap:
-    curr_pos, shift_pos = 0, len(disk_map) - 1
+def defragment(layout: DiskLayout) -> list[Extent]:
+    starts, lengths = layout.file_starts, layout.file_lengths
+    extents = []
+    right = len(lengths) - 1
+    right_left = lengths[right]
 
-    while _has_cells(disk_map[curr_pos:]):
-        curr_cell = disk_map[curr_pos]
+    for left in range(len(lengths)):
+        if left > right:
+            break
+        if left == right:
+            extents.append(Extent(left, starts[left], right_left))
+            break
 
-        if curr_cell.is_empty:
-            while disk_map[shift_pos].is_empty:
-                shift_pos -= 1
+        extents.append(Extent(left, starts[left], lengths[left]))
+        gap_start, gap_left = layout.gap_starts[left], layout.gap_lengths[left]
 
-            _swap_cells(disk_map, curr_pos, shift_pos)
-            shift_pos -= 1
+        while gap_left and right > left:
+            moved = min(gap_left, right_left)
+            if moved:
+                extents.append(Extent(right, gap_start, moved))
+            gap_start += moved
+            gap_left -= moved
+            right_left -= moved
 
-        curr_pos += 1
+            if not right_left:
+                right -= 1
+                right_left = lengths[right]
 
-    return _strip_disk_map(disk_map)
+    return extents
 
 
-def checksum(disk_map: DiskMap) -> int:
-    return sum(i * c.id for i, c in enumerate(disk_map))
+def checksum(extents: list[Extent]) -> int:
+    # sum of position * id over the consecutive blocks of every extent
+    return sum(
+        id_ * (length * start + length * (length - 1) // 2)
+        for id_, start, length in extents
+    )
 
 
-def _has_cells(disk_map: DiskMap) -> bool:
-    return any(c.id is not None for c in disk_map)
-
-
-def _swap_cells(disk_map: DiskMap, from_: int, to_: int) -> bool:
-    disk_map[from_], disk_map[to_] = disk_map[to_], disk_map[from_]
-
-
-def _strip_disk_map(disk_map: DiskMap) -> DiskMap:
-    for i, c in enumerate(disk_map):
-        if c.is_empty:
-            return disk_map[:i]
-    return disk_map
-
+def _parse_disk_map(s: str) -> DiskLayout:
+    layout = DiskLayout(array("q"), array("q"), array("q"), array("q"))
+    is_file = True
+    pos = 0
+
+    for raw_length in s:
+        length = int(raw_length)
+        if is_file:
+            layout.file_starts.append(pos)
+            layout.file_lengths.append(length)
+        else:
+            layout.gap_starts.append(pos)
+            layout.gap_lengths.append(length)
+        pos += length
+        is_file = not is_file
 
-def _to_str(disk_map: DiskMap) -> str:
-    return "".join(str("." if c.is_empty else c.id) for c in disk_map)
+    return layout
 
 
-def _to_array(s: str) -> DiskMap:
-    is_file = True
+def _to_str(extents: list[Extent]) -> str:
     res = []
-    id_generator = count()
-
-    for length in s:
-        new_id = next(id_generator) if is_file else None
-        res.extend([Cell(id=new_id)] * int(length))
-        is_file = not is_file
-
-    return res
+    pos = 0
 
+    for id_, start, length in sorted(extents, key=lambda extent: extent.start):
+        res.append("." * (start - pos) + str(id_) * length)
+        pos = start + length
 
-def _to_array_from_ids(s: str) -> DiskMap:
-    return [Cell(id=int(new_id)) for new_id in s]
+    return "".join(res)
 
 
 def _pp_defragment(s):
-    return _to_str(defragment(_to_array(s)))
+    return _to_str(defragment(_parse_disk_map(s)))
 
 
-assert _to_array("111") == [Cell(id=0), Cell(id=None), Cell(id=1)]
-assert _to_str(_to_array("12345")) == "0..111....22222"
+assert _parse_disk_map("12345") == (
+    array("q", [0, 3, 10]),
+    array("q", [1, 3, 5]),
+    array("q", [1, 6]),
+    array("q", [2, 4]),
+)
+assert _to_str([Extent(0, 0, 1), Extent(1, 3, 3), Extent(2, 10, 5)]) == (
+    "0..111....22222"
+)
 
 assert _pp_defragment("12345") == "022111222"
 assert _pp_defragment("2333133121414131402") == "0099811188827773336446555566"
+assert _pp_defragment("10101") == "012"
+assert _pp_defragment("1") == "0"
 
-assert checksum(_to_array_from_ids("022111222")) == 60
-assert checksum(_to_array_from_ids("0099811188827773336446555566")) == 1928
+extents = [Extent(0, 0, 1), Extent(2, 1, 2), Extent(1, 3, 3), Extent(2, 6, 3)]
+assert checksum(extents) == 60
+assert checksum(defragment(_parse_disk_map("2333133121414131402"))) == 1928
 
 
 with open("2024/09_disk_fragmenter/input.txt") as f:
-    print(checksum(defragment(_to_array(f.readline().strip()))))
+    print(checksum(defragment(_parse_disk_map(f.readline().strip()))))
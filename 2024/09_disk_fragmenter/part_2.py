@@ -0,0 +1,142 @@
+"""
+Upon completion, two things immediately become clear.
+First, the disk definitely has a lot more contiguous free space,
+just like the amphipod hoped.
+Second, the computer is running much more slowly!
+Maybe introducing all of that file system fragmentation was a bad idea?
+
+The eager amphipod already has a new plan:
+rather than move individual blocks,
+he'd like to try compacting the files on his disk by moving whole files instead.
+
+This time, attempt to move whole files
+to the leftmost span of free space blocks that could fit the file.
+Attempt to move each file exactly once in order of decreasing file ID number
+starting with the file with the highest file ID number.
+If there is no span of free space to the left of a file
+that is large enough to fit the file, the file does not move.
+
+The first example from above now proceeds differently:
+
+00...111...2...333.44.5555.6666.777.888899
+0099.111...2...333.44.5555.6666.777.8888..
+0099.1117772...333.44.5555.6666.....8888..
+0099.111777244.333....5555.6666.....8888..
+00992111777.44.333....5555.6666.....8888..
+
+The process of updating the filesystem checksum is the same;
+now, this example's checksum would be 2858.
+
+Start over, now compacting the amphipod's hard drive using this new method instead.
+What is the resulting filesystem checksum?
+"""
+
+from array import array
+from heapq import heapify, heappop, heappush
+from typing import NamedTuple
+
+
+class Extent(NamedTuple):
+    id: int
+    start: int
+    length: int
+
+
+class DiskLayout(NamedTuple):
+    file_starts: array
+    file_lengths: array
+    gap_starts: array
+    gap_lengths: array
+
+
+MAX_LENGTH = 9
+
+
+def defragment(layout: DiskLayout) -> list[Extent]:
+    # gaps[n] holds starts of the gaps exactly n blocks long, leftmost on top
+    gaps: list[list[int]] = [[] for _ in range(MAX_LENGTH + 1)]
+    for gap_start, gap_length in zip(layout.gap_starts, layout.gap_lengths):
+        gaps[gap_length].append(gap_start)
+    for heap in gaps:
+        heapify(heap)
+
+    extents = []
+
+    for id_ in range(len(layout.file_lengths) - 1, -1, -1):
+        start, length = layout.file_starts[id_], layout.file_lengths[id_]
+        gap_length = _find_leftmost_gap(gaps, length, before=start)
+
+        if gap_length is not None:
+            start = heappop(gaps[gap_length])
+            if gap_length > length:
+                heappush(gaps[gap_length - length], start + length)
+
+        extents.append(Extent(id_, start, length))
+
+    return extents
+
+
+def _find_leftmost_gap(gaps: list[list[int]], length: int, before: int) -> int | None:
+    res = None
+
+    for gap_length in range(length, MAX_LENGTH + 1):
+        heap = gaps[gap_length]
+        if heap and heap[0] < before:
+            before = heap[0]
+            res = gap_length
+
+    return res
+
+
+def checksum(extents: list[Extent]) -> int:
+    # sum of position * id over the consecutive blocks of every extent
+    return sum(
+        id_ * (length * start + length * (length - 1) // 2)
+        for id_, start, length in extents
+    )
+
+
+def _parse_disk_map(s: str) -> DiskLayout:
+    layout = DiskLayout(array("q"), array("q"), array("q"), array("q"))
+    is_file = True
+    pos = 0
+
+    for raw_length in s:
+        length = int(raw_length)
+        if is_file:
+            layout.file_starts.append(pos)
+            layout.file_lengths.append(length)
+        else:
+            layout.gap_starts.append(pos)
+            layout.gap_lengths.append(length)
+        pos += length
+        is_file = not is_file
+
+    return layout
+
+
+def _to_str(extents: list[Extent]) -> str:
+    res = []
+    pos = 0
+
+    for id_, start, length in sorted(extents, key=lambda extent: extent.start):
+        res.append("." * (start - pos) + str(id_) * length)
+        pos = start + length
+
+    return "".join(res)
+
+
+def _pp_defragment(s):
+    return _to_str(defragment(_parse_disk_map(s)))
+
+
+assert _pp_defragment("12345") == "0..111....22222"
+assert _pp_defragment("2333133121414131402") == (
+    "00992111777.44.333....5555.6666.....8888"
+)
+
+assert checksum(defragment(_parse_disk_map("2333133121414131402"))) == 2858
+
+
+with open("2024/09_disk_fragmenter/input.txt") as f:
+    print(checksum(defragment(_parse_disk_map(f.readline().strip()))))
@@ -99,101 +99,81 @@ The reindeer gleefully carries over a protractor and adds it to the pile.
 What is the sum of the scores of all trailheads on your topographic map?
 """
 
-from collections import deque
-from collections.abc import Iterable
+from collections.abc import Iterator
 from textwrap import dedent
 from typing import NamedTuple
 
 type TopoMap = list[str]
+type Cell = int
 
+SUMMIT = 9
 
-class Coordinate(NamedTuple):
-    x: int
-    y: int
 
-
-class Point(NamedTuple):
-    coord: Coordinate
-    value: int
-    moves: list[Point]
+class Grid(NamedTuple):
+    width: int
+    heights: list[int]
+    levels: list[list[Cell]]  # cells of every height from 0 to 9
 
 
 def get_sum_score(topo_map: TopoMap) -> int:
-    res = 0
-
-    for i, row in enumerate(topo_map):
-        for j, c in enumerate(row):
-            if c == "0":
-                res += _get_trailhead_score(topo_map, Coordinate(i, j))
-
-    return res
+    grid = parse_grid(topo_map)
+    summits = _get_reachable_summits(grid)
+    return sum(summits[cell].bit_count() for cell in grid.levels[0])
 
 
-def _get_trailhead_score(topo_map: TopoMap, coord: Coordinate) -> int:
-    p = Point(coord=coord, value=0, moves=[])
-    tracker = deque([p])
-    res = set()
+def _get_reachable_summits(grid: Grid) -> list[int]:
+    # bit N of summits[cell] is set when the N-th summit is reachable from cell
+    summits = [0] * len(grid.heights)
 
-    while tracker:
-        p = tracker.pop()
+    for i, cell in enumerate(grid.levels[SUMMIT]):
+        summits[cell] = 1 << i
 
-        if p.value == 9:
-            res.add(p.coord)
-            # _draw_moves(topo_map, p)
-            continue
+    for height in range(SUMMIT - 1, -1, -1):
+        for cell in grid.levels[height]:
+            for neighbour in _get_neighbours(grid, cell):
+                if grid.heights[neighbour] == height + 1:
+                    summits[cell] |= summits[neighbour]
 
-        tracker.extend(_get_next_moves(topo_map, p))
+    return summits
 
-    return len(res)
 
+def parse_grid(topo_map: TopoMap) -> Grid:
+    width = len(topo_map[0])
+    # "." placeholders in map are never part of a trail
+    heights = [int(c) if c.isdigit() else -1 for row in topo_map for c in row]
+    levels = [[] for _ in range(SUMMIT + 1)]
 
-def _get_next_moves(topo_map: TopoMap, p: Point) -> list[Point]:
-    return [qp for qp in _get_quadrant_points(topo_map, p) if qp.value == p.value + 1]
+    for cell, height in enumerate(heights):
+        if height >= 0:
+            levels[height].append(cell)
 
+    return Grid(width, heights, levels)
 
-def _get_quadrant_points(topo_map: TopoMap, p: Point) -> Iterable[Point]:
-    if p.coord.x - 1 >= 0:
-        yield _build_point(topo_map, p.coord.x - 1, p.coord.y, p)  # top
 
-    if p.coord.x + 1 < len(topo_map):
-        yield _build_point(topo_map, p.coord.x + 1, p.coord.y, p)  # bottom
+def _get_neighbours(grid: Grid, cell: Cell) -> Iterator[Cell]:
+    row, col = divmod(cell, grid.width)
 
-    if p.coord.y - 1 >= 0:
-        yield _build_point(topo_map, p.coord.x, p.coord.y - 1, p)  # left
+    if row > 0:
+        yield cell - grid.width  # top
 
-    if p.coord.y + 1 < len(topo_map[p.coord.x]):
-        yield _build_point(topo_map, p.coord.x, p.coord.y + 1, p)  # right
+    if cell + grid.width < len(grid.heights):
+        yield cell + grid.width  # bottom
 
+    if col > 0:
+        yield cell - 1  # left
 
-def _build_point(topo_map: TopoMap, x: int, y: int, previous_point: Point) -> Point:
-    try:
-        value = int(topo_map[x][y])
-    except ValueError:
-        value = -1  # for "." placeholders in map
-
-    return Point(
-        coord=Coordinate(x, y),
-        value=value,
-        moves=[*previous_point.moves, previous_point],
-    )
+    if col + 1 < grid.width:
+        yield cell + 1  # right
 
 
 def _to_array(s: str) -> list[str]:
     return dedent(s).strip().splitlines()
 
 
-def _draw_moves(topo_map, p: Point):
-    moves = {move.coord for move in p.moves} | {p.coord}
-
-    for i in range(len(topo_map)):
-        for j in range(len(topo_map[i])):
-            if (i, j) in moves:
-                print(topo_map[i][j], end="")
-            else:
-                print(".", end="")
-        print()
-    print()
-
+grid = parse_grid(["0.", "19"])
+assert grid == Grid(2, [0, -1, 1, 9], [[0], [2], [], [], [], [], [], [], [], [3]])
+assert list(_get_neighbours(grid, 0)) == [2, 1]
+assert list(_get_neighbours(grid, 3)) == [1, 2]
 
 s = _to_array(
     """
@@ -69,101 +69,119 @@ and is using them to mark trailheads on your topographic map.
 What is the sum of the ratings of all trailheads?
 """
 
-from collections import deque
-from collections.abc import Iterable
+from collections.abc import Iterator
 from textwrap import dedent
 from typing import NamedTuple
 
 type TopoMap = list[str]
+type Cell = int
 
+SUMMIT = 9
 
-class Coordinate(NamedTuple):
-    x: int
-    y: int
 
-
-class Point(NamedTuple):
-    coord: Coordinate
-    value: int
-    moves: list[Point]
+class Grid(NamedTuple):
+    width: int
+    heights: list[int]
+    levels: list[list[Cell]]  # cells of every height from 0 to 9
 
 
 def get_sum_rating(topo_map: TopoMap) -> int:
-    res = 0
+    grid = parse_grid(topo_map)
+    trails = _count_trails(grid)
+    return sum(trails[cell] for cell in grid.levels[0])
 
-    for i, row in enumerate(topo_map):
-        for j, c in enumerate(row):
-            if c == "0":
-                res += _get_trailhead_rating(topo_map, Coordinate(i, j))
 
-    return res
+def iter_trails(grid: Grid, start: Cell) -> Iterator[list[Cell]]:
+    trails = _count_trails(grid)
+    stack = [[start]] if trails[start] else []
 
+    while stack:
+        trail = stack.pop()
+        cell = trail[-1]
 
-def _get_trailhead_rating(topo_map: TopoMap, coord: Coordinate) -> int:
-    p = Point(coord=coord, value=0, moves=[])
-    tracker = deque([p])
-    res = []
+        if grid.heights[cell] == SUMMIT:
+            yield trail
+            continue
 
-    while tracker:
-        p = tracker.pop()
+        stack.extend(
+            [*trail, neighbour]
+            for neighbour in _get_neighbours(grid, cell)
+            if grid.heights[neighbour] == grid.heights[cell] + 1 and trails[neighbour]
+        )
 
-        if p.value == 9:
-            res.append(p.coord)
-            # _draw_moves(topo_map, p)
-            continue
 
-        tracker.extend(_get_next_moves(topo_map, p))
+def _count_trails(grid: Grid) -> list[int]:
+    # trails[cell] is the number of distinct hiking trails from cell to any summit
+    trails = [0] * len(grid.heights)
 
-    return len(res)
+    for cell in grid.levels[SUMMIT]:
+        trails[cell] = 1
 
+    for height in range(SUMMIT - 1, -1, -1):
+        for cell in grid.levels[height]:
+            for neighbour in _get_neighbours(grid, cell):
+                if grid.heights[neighbour] == height + 1:
+                    trails[cell] += trails[neighbour]
 
-def _get_next_moves(topo_map: TopoMap, p: Point) -> list[Point]:
-    return [qp for qp in _get_quadrant_points(topo_map, p) if qp.value == p.value + 1]
+    return trails
 
 
-def _get_quadrant_points(topo_map: TopoMap, p: Point) -> Iterable[Point]:
-    if p.coord.x - 1 >= 0:
-        yield _build_point(topo_map, p.coord.x - 1, p.coord.y, p)  # top
+def parse_grid(topo_map: TopoMap) -> Grid:
+    width = len(topo_map[0])
+    # "." placeholders in map are never part of a trail
+    heights = [int(c) if c.isdigit() else -1 for row in topo_map for c in row]
+    levels = [[] for _ in range(SUMMIT + 1)]
 
-    if p.coord.x + 1 < len(topo_map):
-        yield _build_point(topo_map, p.coord.x + 1, p.coord.y, p)  # bottom
+    for cell, height in enumerate(heights):
+        if height >= 0:
+            levels[height].append(cell)
 
-    if p.coord.y - 1 >= 0:
-        yield _build_point(topo_map, p.coord.x, p.coord.y - 1, p)  # left
+    return Grid(width, heights, levels)
 
-    if p.coord.y + 1 < len(topo_map[p.coord.x]):
-        yield _build_point(topo_map, p.coord.x, p.coord.y + 1, p)  # right
 
+def _get_neighbours(grid: Grid, cell: Cell) -> Iterator[Cell]:
+    row, col = divmod(cell, grid.width)
 
-def _build_point(topo_map: TopoMap, x: int, y: int, previous_point: Point) -> Point:
-    try:
-        value = int(topo_map[x][y])
-    except ValueError:
-        value = -1  # for "." placeholders in map
+    if row > 0:
+        yield cell - grid.width  # top
 
-    return Point(
-        coord=Coordinate(x, y),
-        value=value,
-        moves=[*previous_point.moves, previous_point],
-    )
+    if cell + grid.width < len(grid.heights):
+        yield cell + grid.width  # bottom
 
+    if col > 0:
+        yield cell - 1  # left
 
-def _to_array(s: str) -> list[str]:
-    return dedent(s).strip().splitlines()
+    if col + 1 < grid.width:
+        yield cell + 1  # right
 
 
-def _draw_moves(topo_map, p: Point):
-    moves = {move.coord for move in p.moves} | {p.coord}
+def _to_array(s: str) -> list[str]:
+    return dedent(s).strip().splitlines()
 
-    for i in range(len(topo_map)):
-        for j in range(len(topo_map[i])):
-            if (i, j) in moves:
-                print(topo_map[i][j], end="")
-            else:
-                print(".", end="")
-        print()
-    print()
 
+grid = parse_grid(["0.", "19"])
+assert grid == Grid(2, [0, -1, 1, 9], [[0], [2], [], [], [], [], [], [], [], [3]])
+assert list(_get_neighbours(grid, 0)) == [2, 1]
+assert list(_get_neighbours(grid, 3)) == [1, 2]
+
+grid = parse_grid(
+    _to_array(
+        """
+        .....0.
+        ..4321.
+        ..5..2.
+        ..6543.
+        ..7..4.
+        ..8765.
+        ..9....
+        """,
+    ),
+)
+trails = list(iter_trails(grid, grid.levels[0][0]))
+assert len(trails) == 3
+assert all(
+    [grid.heights[cell] for cell in trail] == list(range(10)) for trail in trails
+)
 
 s = _to_array(
     """
@@ -5,7 +5,21 @@ To be fair, the infinite corridors are very large.
 How many stones would you have after blinking a total of 75 times?
 """
 
+from bisect import bisect_right
 from collections import defaultdict
+from collections.abc import Iterable
+
+POWERS_OF_TEN = [10**i for i in range(1, 64)]
+
+# transition table over every stone value seen so far,
+# each value's children are always in the table too
+_values: list[int] = []
+_ids: dict[int, int] = {}
+_left: list[int] = []
+_right: list[int] = []  # -1 points to the zero sentinel at the end of a layer
+
+# _layers[n][i] is the number of stones _values[i] turns into after n blinks
+_layers: dict[int, list[int]] = {}
 
 
 def blink(*stones: int, n: int = 1) -> dict[int, int]:
@@ -15,25 +29,102 @@ def blink(*stones: int, n: int = 1) -> dict[int, int]:
     return cached_stones
 
 
+def count_after(seeds: Iterable[int], n: int) -> int:
+    ids = list(map(_intern, seeds))
+    layer = _get_layer(n)
+    return sum(layer[id_] for id_ in ids)
+
+
+def split_stone(stone: int) -> tuple[int, ...]:
+    if stone == 0:
+        return (1,)
+
+    num_of_digits = count_digits(stone)
+
+    if num_of_digits % 2 == 0:
+        return divmod(stone, POWERS_OF_TEN[num_of_digits // 2 - 1])
+
+    return (stone * 2024,)
+
+
+def count_digits(n: int) -> int:
+    # stones only ever grow, so the table is extended on demand
+    while n >= POWERS_OF_TEN[-1]:
+        POWERS_OF_TEN.append(POWERS_OF_TEN[-1] * 10)
+    return bisect_right(POWERS_OF_TEN, n) + 1
+
+
 def _update_stones(stones: dict[int, int]) -> dict[int, int]:
     cached_stones = defaultdict(int)
 
     for s, n in stones.items():
-        if s == 0:
-            cached_stones[1] += n
-            continue
+        for child in split_stone(s):
+            cached_stones[child] += n
 
-        num_of_digits = len(str(s))
+    return cached_stones
 
-        if num_of_digits % 2 == 0:
-            half = num_of_digits // 2
-            cached_stones[s // 10**half] += n
-            cached_stones[s % 10**half] += n
-        else:
-            cached_stones[s * 2024] += n
 
-    return cached_stones
+def _intern(stone: int) -> int:
+    if stone in _ids:
+        return _ids[stone]
+
+    queue = [stone]
+    _add_value(stone)
 
+    while queue:
+        value = queue.pop()
+        children = []
+
+        for child in split_stone(value):
+            if child not in _ids:
+                _add_value(child)
+                queue.append(child)
+            children.append(_ids[child])
+
+        id_ = _ids[value]
+        _left[id_] = children[0]
+        _right[id_] = children[1] if len(children) == 2 else -1
+
+    # new values are missing from every computed layer
+    _layers.clear()
+
+    return _ids[stone]
+
+
+def _add_value(stone: int) -> None:
+    _ids[stone] = len(_values)
+    _values.append(stone)
+    _left.append(-1)
+    _right.append(-1)
+
+
+def _get_layer(n: int) -> list[int]:
+    if not _layers:
+        _layers[0] = [1] * len(_values) + [0]
+
+    start = max(k for k in _layers if k <= n)
+    layer = _layers[start]
+
+    for _i in range(start, n):
+        layer = [layer[l] + layer[r] for l, r in zip(_left, _right)]
+        layer.append(0)
+
+    _layers[n] = layer
+    return layer
+
+
+assert count_digits(0) == 1
+assert count_digits(9) == 1
+assert count_digits(10) == 2
+assert count_digits(999_999) == 6
+assert count_digits(10**20) == 21
+assert count_digits(10**70) == 71
+assert count_digits(10**70 - 1) == 70
+assert split_stone(10**79 + 7) == (10**39, 7)
+
+assert split_stone(0) == (1,)
+assert split_stone(1000) == (10, 0)
+assert split_stone(1) == (2024,)
 
 assert blink(0) == {1: 1}
 assert blink(12) == {1: 1, 2: 1}
@@ -42,4 +133,9 @@ assert blink(1) == {2024: 1}
 
 assert sum(blink(125, 17, n=25).values()) == 55312
 
-print(sum(blink(0, 89741, 316108, 7641, 756, 9, 7832357, 91, n=75).values()))
+assert count_after([125, 17], 6) == 22
+assert count_after([125, 17], 25) == 55312
+assert count_after([17], 25) + count_after([125], 25) == 55312
+assert count_after([0], 40) == sum(blink(0, n=40).values())
+
+print(count_after([0, 89741, 316108, 7641, 756, 9, 7832357, 91], 75))
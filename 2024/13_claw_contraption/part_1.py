@@ -77,6 +77,7 @@ What is the fewest tokens you would have to spend to win all possible prizes?
 """
 
 import re
+from collections.abc import Iterable
 from typing import NamedTuple
 
 
@@ -91,13 +92,79 @@ class Move(NamedTuple):
     price_in_tokens: int
 
 
+class Machine(NamedTuple):
+    a: Move
+    b: Move
+    target: Target
+
+
+def compute_all_moves(machines: Iterable[Machine]) -> int:
+    return sum(compute_moves(*machine) or 0 for machine in machines)
+
+
 def compute_moves(a: Move, b: Move, target: Target) -> int | None:
-    b_clicks = (target.y * a.x - target.x * a.y) / (a.x * b.y - a.y * b.x)
-    a_clicks = (target.x - b.x * b_clicks) / a.x
+    # Cramer's rule, kept in integers so huge targets stay exact
+    det = a.x * b.y - a.y * b.x
+    if det == 0:
+        return _compute_parallel_moves(a, b, target)
+
+    a_clicks, a_rest = divmod(target.x * b.y - target.y * b.x, det)
+    b_clicks, b_rest = divmod(a.x * target.y - a.y * target.x, det)
+
+    if a_rest or b_rest or a_clicks < 0 or b_clicks < 0:
+        return None
+    return a_clicks * a.price_in_tokens + b_clicks * b.price_in_tokens
+
+
+def _compute_parallel_moves(a: Move, b: Move, target: Target) -> int | None:
+    for move in (a, b):
+        if move.x * target.y - move.y * target.x:
+            return None  # target is off the line both buttons move along
+
+    # on a shared line one axis is enough, unless the line is vertical
+    if a.x or b.x:
+        return _solve_line(a.x, b.x, target.x, a.price_in_tokens, b.price_in_tokens)
+    return _solve_line(a.y, b.y, target.y, a.price_in_tokens, b.price_in_tokens)
+
 
-    if a_clicks.is_integer() and b_clicks.is_integer():
-        return int(a_clicks * a.price_in_tokens + b_clicks * b.price_in_tokens)
-    return None
+def _solve_line(a: int, b: int, target: int, a_price: int, b_price: int) -> int | None:
+    # cheapest non-negative a_clicks * a + b_clicks * b == target
+    if not a or not b:
+        step, price = (a, a_price) if a else (b, b_price)
+        if not step:
+            return 0 if target == 0 else None
+        clicks, rest = divmod(target, step)
+        return None if rest or clicks < 0 else clicks * price
+
+    g, x, y = _extended_gcd(a, b)
+    if target % g:
+        return None
+
+    # every solution is (a0 + k * b_step, b0 - k * a_step),
+    # its price is linear in k so the cheapest one sits on a bound of k
+    a0, b0 = x * (target // g), y * (target // g)
+    a_step, b_step = a // g, b // g
+    k_min = -(a0 // b_step)
+    k_max = b0 // a_step
+    if k_min > k_max:
+        return None
+
+    k = k_min if a_price * b_step >= b_price * a_step else k_max
+    return (a0 + k * b_step) * a_price + (b0 - k * a_step) * b_price
+
+
+def _extended_gcd(a: int, b: int) -> tuple[int, int, int]:
+    old_r, r = a, b
+    old_x, x = 1, 0
+    old_y, y = 0, 1
+
+    while r:
+        q = old_r // r
+        old_r, r = r, old_r - q * r
+        old_x, x = x, old_x - q * x
+        old_y, y = y, old_y - q * y
+
+    return old_r, old_x, old_y
 
 
 def _pp_compute(a, b, target):
@@ -108,6 +175,20 @@ assert _pp_compute(a=(94, 34), b=(22, 67), target=(8400, 5400)) == 280
 assert _pp_compute(a=(26, 66), b=(67, 21), target=(12748, 12176)) is None
 assert _pp_compute(a=(17, 86), b=(84, 37), target=(7870, 6450)) == 200
 assert _pp_compute(a=(69, 23), b=(27, 71), target=(18641, 10279)) is None
+assert _extended_gcd(240, 46) == (2, -9, 47)
+
+assert _solve_line(2, 3, 7, 3, 1) == 3 * 2 + 1 * 1
+assert _solve_line(2, 4, 8, 3, 1) == 2
+assert _solve_line(2, 4, 8, 1, 3) == 4
+assert _solve_line(4, 6, 7, 3, 1) is None
+assert _solve_line(0, 5, 10, 3, 1) == 2
+assert _solve_line(0, 0, 0, 3, 1) == 0
+
+assert _pp_compute(a=(2, 2), b=(3, 3), target=(7, 7)) == 7
+assert _pp_compute(a=(2, 2), b=(4, 4), target=(8, 8)) == 2
+assert _pp_compute(a=(2, 2), b=(4, 4), target=(8, 9)) is None
+assert _pp_compute(a=(0, 2), b=(0, 1), target=(0, 4)) == 4
+assert _pp_compute(a=(1, 0), b=(0, 1), target=(10**30, 10**30 + 1)) == (4 * 10**30 + 1)
 
 
 def _parse_moves_block(block: str, price: int) -> Move:
@@ -121,16 +202,13 @@ def _parse_prize_block(block: str) -> Target:
 
 
 with open("2024/13_claw_contraption/input.txt") as f:
-    all_tokens = 0
-    splitted_by_block = f.read().split("\n\n")
+    machines = []
 
-    for block in splitted_by_block:
+    for block in f.read().split("\n\n"):
         button_a, button_b, prize = block.splitlines()
         button_a_moves = _parse_moves_block(button_a, price=3)
         button_b_moves = _parse_moves_block(button_b, price=1)
         prize_target = _parse_prize_block(prize)
+        machines.append(Machine(button_a_moves, button_b_moves, prize_target))
 
-        tokens = compute_moves(button_a_moves, button_b_moves, prize_target)
-        all_tokens += tokens or 0
-
-    print(all_tokens)
+    print(compute_all_moves(machines))
@@ -152,7 +152,8 @@ What will the safety factor be after exactly 100 seconds have elapsed?
 """
 
 import re
-from collections import Counter, defaultdict
+from collections import Counter
+from collections.abc import Iterable
 from functools import reduce
 from itertools import count, starmap
 from operator import mul
@@ -179,57 +180,65 @@ class Map(NamedTuple):
     y: int
 
 
-class Quadrant(NamedTuple):
-    from_: Coordinate
-    to_: Coordinate
+class Swarm(NamedTuple):
+    xs: list[int]
+    ys: list[int]
+    moves_x: list[int]
+    moves_y: list[int]
+
+
+def to_swarm(robots: Iterable[Robot]) -> Swarm:
+    swarm = Swarm([], [], [], [])
+
+    for robot in robots:
+        swarm.xs.append(robot.start.x)
+        swarm.ys.append(robot.start.y)
+        swarm.moves_x.append(robot.moves.x)
+        swarm.moves_y.append(robot.moves.y)
+
+    return swarm
+
+
+def advance(swarm: Swarm, tile_map: Map, seconds: int = 1) -> Swarm:
+    return swarm._replace(
+        xs=_shift(swarm.xs, swarm.moves_x, tile_map.x, seconds),
+        ys=_shift(swarm.ys, swarm.moves_y, tile_map.y, seconds),
+    )
 
 
 def move_robots(robots: list[Robot], tile_map: Map, seconds: int) -> list[Coordinate]:
-    return sorted(move_robot(robot, tile_map, seconds) for robot in robots)
+    swarm = advance(to_swarm(robots), tile_map, seconds)
+    return sorted(map(Coordinate, swarm.xs, swarm.ys))
 
 
 def move_robot(robot: Robot, tile_map: Map, seconds: int) -> Coordinate:
-    shifted = (
-        robot.start.x + robot.moves.x * seconds,
-        robot.start.y + robot.moves.y * seconds,
-    )
-    return Coordinate(shifted[0] % tile_map.x, shifted[1] % tile_map.y)
+    return move_robots([robot], tile_map, seconds)[0]
 
 
 def find_safety_factor(positions: list[Coordinate], tile_map: Map) -> int:
-    quadrants = _get_quadrants(tile_map)
-    safety_by_quadrants = defaultdict(int)
+    quadrants = Counter(_get_quadrant(p, tile_map) for p in positions)
+    return reduce(mul, (quadrants[q] for q in range(4) if quadrants[q]), 1)
 
-    for p in positions:
-        for i, q in enumerate(quadrants):
-            if q.from_.x <= p.x < q.to_.x and q.from_.y <= p.y < q.to_.y:
-                safety_by_quadrants[i] += 1
 
-    return reduce(mul, safety_by_quadrants.values(), 1)
+def _shift(
+    positions: list[int],
+    moves: list[int],
+    size: int,
+    seconds: int,
+) -> list[int]:
+    return [(p + m * seconds) % size for p, m in zip(positions, moves)]
 
 
-def _get_quadrants(tile_map: Map):
-    skip_x, skip_y = tile_map.x % 2, tile_map.y % 2
+def _get_quadrant(position: Coordinate, tile_map: Map) -> int | None:
+    # 0 - top left, 1 - top right, 2 - bottom left, 3 - bottom right
     half_x, half_y = tile_map.x // 2, tile_map.y // 2
-    return [
-        # top left
-        Quadrant(from_=Coordinate(0, 0), to_=Coordinate(half_x, half_y)),
-        # top right
-        Quadrant(
-            from_=Coordinate(half_x + skip_x, 0),
-            to_=Coordinate(tile_map.x, half_y),
-        ),
-        # bottom left
-        Quadrant(
-            from_=Coordinate(0, half_y + skip_y),
-            to_=Coordinate(half_x, tile_map.y),
-        ),
-        # bottom right
-        Quadrant(
-            from_=Coordinate(half_x + skip_x, half_y + skip_y),
-            to_=Coordinate(tile_map.x, tile_map.y),
-        ),
-    ]
+
+    if tile_map.x % 2 and position.x == half_x:
+        return None
+    if tile_map.y % 2 and position.y == half_y:
+        return None
+
+    return (position.x >= half_x) + 2 * (position.y >= half_y)
 
 
 def _gen_move(start, moves, tile_map):
@@ -249,14 +258,6 @@ def _draw_positions(positions: list[Coordinate], tile_map: Map):
         print()
 
 
-def _draw_robots(robots: list[Robot], tile_map: Map):
-    robot_positions = Counter(r.start for r in robots)
-    for j in range(tile_map.y):
-        for i in range(tile_map.x):
-            print(robot_positions[(i, j)] or ".", end="")
-        print()
-
-
 robot = _gen_move((2, 4), (2, -3), (11, 7))
 assert next(robot) == (4, 1)
 assert next(robot) == (6, 5)
@@ -297,24 +298,21 @@ assert move_robots(robots, Map(11, 7), seconds=100) == [
     (6, 6),
     (9, 0),
 ]
-assert _get_quadrants(Map(3, 3)) == [
-    ((0, 0), (1, 1)),  # top left
-    ((2, 0), (3, 1)),  # top right
-    ((0, 2), (1, 3)),  # bottom left
-    ((2, 2), (3, 3)),  # bottom right
-]
-assert _get_quadrants(Map(4, 3)) == [
-    ((0, 0), (2, 1)),  # top left
-    ((2, 0), (4, 1)),  # top right
-    ((0, 2), (2, 3)),  # bottom left
-    ((2, 2), (4, 3)),  # bottom right
-]
-assert _get_quadrants(Map(3, 4)) == [
-    ((0, 0), (1, 2)),  # top left
-    ((2, 0), (3, 2)),  # top right
-    ((0, 2), (1, 4)),  # bottom left
-    ((2, 2), (3, 4)),  # bottom right
-]
+assert _get_quadrant(Coordinate(0, 0), Map(3, 3)) == 0
+assert _get_quadrant(Coordinate(2, 0), Map(3, 3)) == 1
+assert _get_quadrant(Coordinate(0, 2), Map(3, 3)) == 2
+assert _get_quadrant(Coordinate(2, 2), Map(3, 3)) == 3
+assert _get_quadrant(Coordinate(1, 0), Map(3, 3)) is None
+assert _get_quadrant(Coordinate(0, 1), Map(3, 3)) is None
+assert _get_quadrant(Coordinate(1, 0), Map(4, 3)) == 0
+assert _get_quadrant(Coordinate(2, 0), Map(4, 3)) == 1
+assert _get_quadrant(Coordinate(0, 1), Map(3, 4)) == 0
+assert _get_quadrant(Coordinate(0, 2), Map(3, 4)) == 2
+
+swarm = to_swarm(robots)
+assert advance(swarm, Map(11, 7), seconds=5) == advance(
+    advance(swarm, Map(11, 7), seconds=2), Map(11, 7), seconds=3
+)
 
 positions = move_robots(robots, Map(11, 7), seconds=100)
 assert find_safety_factor(positions, Map(11, 7)) == 12
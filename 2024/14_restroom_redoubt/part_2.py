@@ -10,7 +10,7 @@ for the robots to display the Easter egg?
 """
 
 import re
-from collections import Counter, defaultdict
+from collections import Counter
 from collections.abc import Iterable
 from functools import reduce
 from itertools import count, starmap
@@ -38,67 +38,101 @@ class Map(NamedTuple):
     y: int
 
 
-class Quadrant(NamedTuple):
-    from_: Coordinate
-    to_: Coordinate
+class Swarm(NamedTuple):
+    xs: list[int]
+    ys: list[int]
+    moves_x: list[int]
+    moves_y: list[int]
+
+
+def to_swarm(robots: Iterable[Robot]) -> Swarm:
+    swarm = Swarm([], [], [], [])
+
+    for robot in robots:
+        swarm.xs.append(robot.start.x)
+        swarm.ys.append(robot.start.y)
+        swarm.moves_x.append(robot.moves.x)
+        swarm.moves_y.append(robot.moves.y)
+
+    return swarm
+
+
+def advance(swarm: Swarm, tile_map: Map, seconds: int = 1) -> Swarm:
+    return swarm._replace(
+        xs=_shift(swarm.xs, swarm.moves_x, tile_map.x, seconds),
+        ys=_shift(swarm.ys, swarm.moves_y, tile_map.y, seconds),
+    )
 
 
 def move_robots(robots: list[Robot], tile_map: Map, seconds: int) -> list[Coordinate]:
-    return sorted(move_robot(robot, tile_map, seconds) for robot in robots)
+    swarm = advance(to_swarm(robots), tile_map, seconds)
+    return sorted(map(Coordinate, swarm.xs, swarm.ys))
 
 
 def move_robot(robot: Robot, tile_map: Map, seconds: int) -> Coordinate:
-    shifted = (
-        robot.start.x + robot.moves.x * seconds,
-        robot.start.y + robot.moves.y * seconds,
-    )
-    return Coordinate(shifted[0] % tile_map.x, shifted[1] % tile_map.y)
+    return move_robots([robot], tile_map, seconds)[0]
 
 
 def find_safety_factor(positions: list[Coordinate], tile_map: Map) -> int:
-    quadrants = _get_quadrants(tile_map)
-    safety_by_quadrants = defaultdict(int)
+    quadrants = Counter(_get_quadrant(p, tile_map) for p in positions)
+    return reduce(mul, (quadrants[q] for q in range(4) if quadrants[q]), 1)
 
-    for p in positions:
-        for i, q in enumerate(quadrants):
-            if q.from_.x <= p.x < q.to_.x and q.from_.y <= p.y < q.to_.y:
-                safety_by_quadrants[i] += 1
 
-    return reduce(mul, safety_by_quadrants.values(), 1)
+def _shift(
+    positions: list[int],
+    moves: list[int],
+    size: int,
+    seconds: int,
+) -> list[int]:
+    return [(p + m * seconds) % size for p, m in zip(positions, moves)]
 
 
-def _get_quadrants(tile_map: Map):
-    skip_x, skip_y = tile_map.x % 2, tile_map.y % 2
+def _get_quadrant(position: Coordinate, tile_map: Map) -> int | None:
+    # 0 - top left, 1 - top right, 2 - bottom left, 3 - bottom right
     half_x, half_y = tile_map.x // 2, tile_map.y // 2
-    return [
-        # top left
-        Quadrant(from_=Coordinate(0, 0), to_=Coordinate(half_x, half_y)),
-        # top right
-        Quadrant(
-            from_=Coordinate(half_x + skip_x, 0),
-            to_=Coordinate(tile_map.x, half_y),
-        ),
-        # bottom left
-        Quadrant(
-            from_=Coordinate(0, half_y + skip_y),
-            to_=Coordinate(half_x, tile_map.y),
-        ),
-        # bottom right
-        Quadrant(
-            from_=Coordinate(half_x + skip_x, half_y + skip_y),
-            to_=Coordinate(tile_map.x, tile_map.y),
-        ),
-    ]
 
+    if tile_map.x % 2 and position.x == half_x:
+        return None
+    if tile_map.y % 2 and position.y == half_y:
+        return None
+
+    return (position.x >= half_x) + 2 * (position.y >= half_y)
+
+
+def find_xmas_tree(robots: list[Robot], tile_map: Map) -> int:
+    # x and y repeat independently with periods of the map width and height,
+    # so the tree frame is where both axes are most bunched up at once
+    swarm = to_swarm(robots)
+    x_seconds = _find_densest_second(swarm.xs, swarm.moves_x, tile_map.x)
+    y_seconds = _find_densest_second(swarm.ys, swarm.moves_y, tile_map.y)
+    return _combine_periods(x_seconds, tile_map.x, y_seconds, tile_map.y)
+
+
+def _find_densest_second(positions: list[int], moves: list[int], size: int) -> int:
+    best_seconds, best_variance = 0, _get_scaled_variance(positions)
+
+    for seconds in range(1, size):
+        positions = _shift(positions, moves, size, seconds=1)
+        variance = _get_scaled_variance(positions)
+        if variance < best_variance:
+            best_seconds, best_variance = seconds, variance
+
+    return best_seconds
+
+
+def _get_scaled_variance(positions: list[int]) -> int:
+    # variance multiplied by len(positions) ** 2, exact and enough to compare
+    return len(positions) * sum(p * p for p in positions) - sum(positions) ** 2
 
-def _gen_move_robot(start, moves, tile_map):
-    for i in count(1):
-        yield move_robot(_gen_robot(start, moves), Map(*tile_map), seconds=i)
 
+def _combine_periods(a: int, size_a: int, b: int, size_b: int) -> int:
+    # chinese remainder theorem for seconds = a mod size_a = b mod size_b
+    return a + size_a * ((b - a) * pow(size_a, -1, size_b) % size_b)
 
-def _gen_move_robots(robots, tile_map):
+
+def _gen_move_robot(start, moves, tile_map):
     for i in count(1):
-        yield move_robots(robots, Map(*tile_map), seconds=i)
+        yield move_robot(_gen_robot(start, moves), Map(*tile_map), seconds=i)
 
 
 def _gen_robot(start, moves):
@@ -113,25 +147,6 @@ def _draw_positions(positions: list[Coordinate], tile_map: Map):
         print()
 
 
-def _draw_robots(robots: list[Robot], tile_map: Map):
-    robot_positions = Counter(r.start for r in robots)
-    for j in range(tile_map.y):
-        for i in range(tile_map.x):
-            print(robot_positions[(i, j)] or ".", end="")
-        print()
-
-
-def _find_xmas_tree(positions_generator: Iterable[Coordinate], tile_map: Map) -> bool:
-    lowest_safety_factor = find_safety_factor(next(positions_generator), tile_map)
-
-    for i, positions in enumerate(positions_generator, 2):
-        safety_factor = find_safety_factor(positions, tile_map)
-        if safety_factor < lowest_safety_factor:
-            lowest_safety_factor = safety_factor
-            print(i)
-            yield positions
-
-
 robot = _gen_move_robot((2, 4), (2, -3), (11, 7))
 
 assert next(robot) == (4, 1)
@@ -173,36 +188,41 @@ assert move_robots(robots, Map(11, 7), seconds=100) == [
     (6, 6),
     (9, 0),
 ]
-assert _get_quadrants(Map(3, 3)) == [
-    ((0, 0), (1, 1)),  # top left
-    ((2, 0), (3, 1)),  # top right
-    ((0, 2), (1, 3)),  # bottom left
-    ((2, 2), (3, 3)),  # bottom right
-]
-assert _get_quadrants(Map(4, 3)) == [
-    ((0, 0), (2, 1)),  # top left
-    ((2, 0), (4, 1)),  # top right
-    ((0, 2), (2, 3)),  # bottom left
-    ((2, 2), (4, 3)),  # bottom right
-]
-assert _get_quadrants(Map(3, 4)) == [
-    ((0, 0), (1, 2)),  # top left
-    ((2, 0), (3, 2)),  # top right
-    ((0, 2), (1, 4)),  # bottom left
-    ((2, 2), (3, 4)),  # bottom right
-]
+assert _get_quadrant(Coordinate(0, 0), Map(3, 3)) == 0
+assert _get_quadrant(Coordinate(2, 0), Map(3, 3)) == 1
+assert _get_quadrant(Coordinate(0, 2), Map(3, 3)) == 2
+assert _get_quadrant(Coordinate(2, 2), Map(3, 3)) == 3
+assert _get_quadrant(Coordinate(1, 0), Map(3, 3)) is None
+assert _get_quadrant(Coordinate(0, 1), Map(3, 3)) is None
+assert _get_quadrant(Coordinate(1, 0), Map(4, 3)) == 0
+assert _get_quadrant(Coordinate(2, 0), Map(4, 3)) == 1
+assert _get_quadrant(Coordinate(0, 1), Map(3, 4)) == 0
+assert _get_quadrant(Coordinate(0, 2), Map(3, 4)) == 2
+
+swarm = to_swarm(robots)
+assert advance(swarm, Map(11, 7), seconds=5) == advance(
+    advance(swarm, Map(11, 7), seconds=2), Map(11, 7), seconds=3
+)
 
 positions = move_robots(robots, Map(11, 7), seconds=100)
 assert find_safety_factor(positions, Map(11, 7)) == 12
 
+assert _get_scaled_variance([3, 3, 3]) == 0
+assert _get_scaled_variance([1, 3]) == 2 * (1 + 9) - 4**2
+assert _combine_periods(3, 11, 5, 7) == 47
+
+# every robot meets at (5, 3) after 40 seconds
+moves = [(1, 2), (2, 5), (3, 1), (4, 3), (5, 6), (6, 4), (-1, -2), (-3, 2)]
+robots = [
+    _gen_robot(((5 - mx * 40) % 11, (3 - my * 40) % 7), (mx, my)) for mx, my in moves
+]
+assert set(move_robots(robots, Map(11, 7), seconds=40)) == {(5, 3)}
+assert find_xmas_tree(robots, Map(11, 7)) == 40
+
 robots = []
 with open("2024/14_restroom_redoubt/input.txt") as f:
     for line in f:
         start_x, start_y, moves_x, moves_y = map(int, re.findall(r"[\d-]+", line))
         robots.append(_gen_robot((start_x, start_y), (moves_x, moves_y)))
 
-mover = _gen_move_robots(robots, Map(101, 103))
-for positions in _find_xmas_tree(mover, Map(101, 103)):
-    _draw_positions(positions, Map(101, 103))
-    input("continue?")
-    print()
+print(find_xmas_tree(robots, Map(101, 103)))
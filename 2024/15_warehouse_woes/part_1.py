@@ -279,18 +279,13 @@ Predict the motion of the robot and boxes in the warehouse.
 After the robot is finished moving, what is the sum of all boxes' GPS coordinates?
 """
 
+from dataclasses import dataclass
 from enum import StrEnum
 from textwrap import dedent
-from typing import NamedTuple
 
 from pytest import mark
 
-type WareHouse = list[list[str]]
-
-
-class Point(NamedTuple):
-    x: int
-    y: int
+ROBOT, BOX, WALL, EMPTY = b"@O#."
 
 
 class Direction(StrEnum):
@@ -300,141 +295,61 @@ class Direction(StrEnum):
     DOWN = "v"
 
 
-def move(warehouse: WareHouse, directions: list[Direction]) -> WareHouse:
-    for direction in directions:
-        start = _find_start(warehouse)
-        match direction:
-            case Direction.LEFT:
-                warehouse = _move_left(warehouse, start)
-            case Direction.RIGHT:
-                warehouse = _move_right(warehouse, start)
-            case Direction.UP:
-                warehouse = _move_up(warehouse, start)
-            case Direction.DOWN:
-                warehouse = _move_down(warehouse, start)
-
-    return warehouse
-
-
-def sum_coordinates(warehouse: WareHouse) -> int:
-    res = 0
-
-    for i in range(len(warehouse)):
-        for j in range(len(warehouse[i])):
-            if warehouse[i][j] == "O":
-                res += 100 * i + j
-
-    return res
-
-
-def _find_start(warehouse: WareHouse) -> Point:
-    for i in range(len(warehouse)):
-        for j in range(len(warehouse[i])):
-            if warehouse[i][j] == "@":
-                return Point(i, j)
-
-    msg = "No start"
-    raise ValueError(msg)
-
-
-def _move_left(warehouse: WareHouse, point: Point) -> WareHouse:
-    moving_to = _get_left_shift_to(warehouse, point)
-
-    if moving_to is None:
-        return warehouse
-
-    warehouse[point.x][point.y] = "."
-    warehouse[point.x][moving_to.y] = warehouse[point.x][moving_to.y + 1]
-    warehouse[point.x][point.y - 1] = "@"
-
-    return warehouse
-
-
-def _get_left_shift_to(warehouse: WareHouse, point: Point) -> Point | None:
-    for j in range(point.y - 1, 0, -1):
-        if warehouse[point.x][j] == ".":
-            return Point(point.x, j)
+@dataclass
+class Warehouse:
+    cells: bytearray  # rows glued together, a cell below is width cells further
+    width: int
+    robot: int
 
-        if warehouse[point.x][j] == "#":
-            break
 
-    return None
+def move(warehouse: Warehouse, directions: str) -> Warehouse:
+    steps = {
+        Direction.LEFT: -1,
+        Direction.RIGHT: 1,
+        Direction.UP: -warehouse.width,
+        Direction.DOWN: warehouse.width,
+    }
 
-
-def _move_right(warehouse: WareHouse, point: Point) -> WareHouse:
-    moving_to = _get_right_shift_to(warehouse, point)
-
-    if moving_to is None:
-        return warehouse
-
-    warehouse[point.x][point.y] = "."
-    warehouse[point.x][moving_to.y] = warehouse[point.x][moving_to.y - 1]
-    warehouse[point.x][point.y + 1] = "@"
-
-    return warehouse
-
-
-def _get_right_shift_to(warehouse: WareHouse, point: Point) -> Point | None:
-    for j in range(point.y + 1, len(warehouse[point.x])):
-        if warehouse[point.x][j] == ".":
-            return Point(point.x, j)
-
-        if warehouse[point.x][j] == "#":
-            break
-
-    return None
-
-
-def _move_up(warehouse: WareHouse, point: Point) -> WareHouse:
-    moving_to = _get_up_shift_to(warehouse, point)
-
-    if moving_to is None:
-        return warehouse
-
-    warehouse[point.x][point.y] = "."
-    warehouse[moving_to.x][point.y] = warehouse[moving_to.x + 1][point.y]
-    warehouse[point.x - 1][point.y] = "@"
+    for direction in directions:
+        if step := steps.get(direction):
+            _move_robot(warehouse, step)
 
     return warehouse
 
 
-def _get_up_shift_to(warehouse: WareHouse, point: Point) -> Point | None:
-    for i in range(point.x - 1, 0, -1):
-        if warehouse[i][point.y] == ".":
-            return Point(i, point.y)
-
-        if warehouse[i][point.y] == "#":
-            break
-
-    return None
-
-
-def _move_down(warehouse: WareHouse, point: Point) -> WareHouse:
-    moving_to = _get_down_shift_to(warehouse, point)
+def sum_coordinates(warehouse: Warehouse) -> int:
+    res = 0
+    cell = warehouse.cells.find(BOX)
 
-    if moving_to is None:
-        return warehouse
+    while cell != -1:
+        row, col = divmod(cell, warehouse.width)
+        res += 100 * row + col
+        cell = warehouse.cells.find(BOX, cell + 1)
 
-    warehouse[point.x][point.y] = "."
-    warehouse[moving_to.x][point.y] = warehouse[moving_to.x - 1][point.y]
-    warehouse[point.x + 1][point.y] = "@"
+    return res
 
-    return warehouse
 
+def parse_warehouse(raw_map: str) -> Warehouse:
+    rows = dedent(raw_map).strip().splitlines()
+    cells = bytearray("".join(rows), "ascii")
+    return Warehouse(cells, len(rows[0]), cells.index(ROBOT))
 
-def _get_down_shift_to(warehouse: WareHouse, point: Point) -> Point | None:
-    for i in range(point.x + 1, len(warehouse)):
-        if warehouse[i][point.y] == ".":
-            return Point(i, point.y)
 
-        if warehouse[i][point.y] == "#":
-            break
+def _move_robot(warehouse: Warehouse, step: int) -> None:
+    cells, robot = warehouse.cells, warehouse.robot
+    target = robot + step
 
-    return None
+    while cells[target] == BOX:
+        target += step
 
+    if cells[target] == WALL:
+        return
 
-def _to_array(s: str):
-    return [list(l) for l in dedent(s).strip().splitlines()]
+    # the whole chain of boxes shifts by one, so only its ends change
+    cells[target] = cells[robot + step]
+    cells[robot + step] = ROBOT
+    cells[robot] = EMPTY
+    warehouse.robot = robot + step
 
 
 @mark.parametrize(
@@ -449,9 +364,7 @@ def _to_array(s: str):
     ],
 )
 def test_move_left(from_, to_):
-    from_as_array = _to_array(from_)
-    start = _find_start(from_as_array)
-    assert _move_left(from_as_array, start) == _to_array(to_)
+    assert move(parse_warehouse(from_), "<") == parse_warehouse(to_)
 
 
 @mark.parametrize(
@@ -466,9 +379,7 @@ def test_move_left(from_, to_):
     ],
 )
 def test_move_right(from_, to_):
-    from_as_array = _to_array(from_)
-    start = _find_start(from_as_array)
-    assert _move_right(from_as_array, start) == _to_array(to_)
+    assert move(parse_warehouse(from_), ">") == parse_warehouse(to_)
 
 
 @mark.parametrize(
@@ -561,9 +472,7 @@ def test_move_right(from_, to_):
     ],
 )
 def test_move_up(from_, to_):
-    from_as_array = _to_array(from_)
-    start = _find_start(from_as_array)
-    assert _move_up(from_as_array, start) == _to_array(to_)
+    assert move(parse_warehouse(from_), "^") == parse_warehouse(to_)
 
 
 @mark.parametrize(
@@ -656,12 +565,10 @@ def test_move_up(from_, to_):
     ],
 )
 def test_move_down(from_, to_):
-    from_as_array = _to_array(from_)
-    start = _find_start(from_as_array)
-    assert _move_down(from_as_array, start) == _to_array(to_)
+    assert move(parse_warehouse(from_), "v") == parse_warehouse(to_)
 
 
-s = _to_array(
+s = parse_warehouse(
     """
     ########
     #..O.O.#
@@ -673,7 +580,7 @@ s = _to_array(
     ########
     """,
 )
-assert move(s, "<^^>>>vv<v>>v<<") == _to_array(
+assert move(s, "<^^>>>vv<v>>v<<") == parse_warehouse(
     """
     ########
     #....OO#
@@ -686,7 +593,7 @@ assert move(s, "<^^>>>vv<v>>v<<") == _to_array(
     """,
 )
 
-s = _to_array(
+s = parse_warehouse(
     """
     ##########
     #..O..O.O#
@@ -712,7 +619,7 @@ directions = (
     "^^>vv<^v^v<vv>^<><v<^v>^^^>>>^^vvv^>vvv<>>>^<^>>>>>^<<^v>^vvv<>^<><<v>"
     "v^^>>><<^^<>>^v^<v^vv<>v^<<>^<^v^v><^<<<><<^<v><v<>vv>>v><v^<vv<>v^<<^"
 )
-assert move(s, directions) == _to_array(
+assert move(s, directions) == parse_warehouse(
     """
     ##########
     #.O.O.OOO#
@@ -727,7 +634,7 @@ assert move(s, directions) == _to_array(
     """,
 )
 
-s = _to_array(
+s = parse_warehouse(
     """
     ########
     #....OO#
@@ -741,7 +648,7 @@ s = _to_array(
 )
 assert sum_coordinates(s) == 2028
 
-s = _to_array(
+s = parse_warehouse(
     """
     ##########
     #.O.O.OOO#
@@ -758,7 +665,7 @@ s = _to_array(
 assert sum_coordinates(s) == 10092
 
 with open("2024/15_warehouse_woes/input_map.txt") as f:
-    warehouse = _to_array(f.read())
+    warehouse = parse_warehouse(f.read())
 
 with open("2024/15_warehouse_woes/input_moves.txt") as f:
     directions = f.read()
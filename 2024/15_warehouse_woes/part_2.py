@@ -0,0 +1,288 @@
+"""
+The lanternfish use your information to find a safe moment to swim in
+and turn off the malfunctioning robot!
+Just as they start preparing a festival in your honor,
+reports start coming in that a second warehouse's robot is also malfunctioning.
+
+This warehouse's layout is surprisingly similar to the one you just helped.
+There is one key difference: everything except the robot is twice as wide!
+The robot's list of movements doesn't change.
+
+To get the wider warehouse's map, start with your original map and,
+for each tile, make the following changes:
+
+- If the tile is #, the new map contains ## instead.
+- If the tile is O, the new map contains [] instead.
+- If the tile is ., the new map contains .. instead.
+- If the tile is @, the new map contains @. instead.
+
+This will produce a new warehouse map which is twice as wide
+and with wide boxes that are represented by [].
+(The robot does not change size.)
+
+Because boxes are now twice as wide but the robot is still the same size and speed,
+boxes can be aligned such that they directly push two other boxes at once.
+
+This warehouse also uses GPS to locate the boxes.
+For these larger boxes, distances are measured from the edge of the map
+to the closest edge of the box in question.
+So, the box shown below has a distance of 1 from the top edge of the map
+and 5 from the left edge of the map,
+resulting in a GPS coordinate of 100 * 1 + 5 = 105.
+
+##########
+##...[]...
+##........
+
+In the scaled-up version of the larger example from above,
+after the robot has finished all of its moves,
+the warehouse would look like this:
+
+####################
+##[].......[].[][]##
+##[]...........[].##
+##[]........[][][]##
+##[]......[]....[]##
+##..##......[]....##
+##..[]............##
+##..@......[].[][]##
+##......[][]..[]..##
+####################
+
+The sum of these boxes' GPS coordinates is 9021.
+
+Predict the motion of the robot and boxes in this new, scaled-up warehouse.
+What is the sum of all boxes' final GPS coordinates?
+"""
+
+from dataclasses import dataclass
+from enum import StrEnum
+from textwrap import dedent
+
+ROBOT, BOX_LEFT, BOX_RIGHT, WALL, EMPTY = b"@[]#."
+WIDER_TILES = {"#": "##", "O": "[]", ".": "..", "@": "@."}
+
+
+class Direction(StrEnum):
+    LEFT = "<"
+    RIGHT = ">"
+    UP = "^"
+    DOWN = "v"
+
+
+@dataclass
+class Warehouse:
+    cells: bytearray  # rows glued together, a cell below is width cells further
+    width: int
+    robot: int
+
+
+def move(warehouse: Warehouse, directions: str) -> Warehouse:
+    steps = {
+        Direction.LEFT: -1,
+        Direction.RIGHT: 1,
+        Direction.UP: -warehouse.width,
+        Direction.DOWN: warehouse.width,
+    }
+
+    for direction in directions:
+        if step := steps.get(direction):
+            if step in {-1, 1}:
+                _move_robot_sideways(warehouse, step)
+            else:
+                _move_robot_vertically(warehouse, step)
+
+    return warehouse
+
+
+def sum_coordinates(warehouse: Warehouse) -> int:
+    res = 0
+    cell = warehouse.cells.find(BOX_LEFT)
+
+    while cell != -1:
+        row, col = divmod(cell, warehouse.width)
+        res += 100 * row + col
+        cell = warehouse.cells.find(BOX_LEFT, cell + 1)
+
+    return res
+
+
+def parse_warehouse(raw_map: str) -> Warehouse:
+    rows = dedent(raw_map).strip().splitlines()
+    cells = bytearray("".join(rows), "ascii")
+    return Warehouse(cells, len(rows[0]), cells.index(ROBOT))
+
+
+def widen(raw_map: str) -> str:
+    return "".join(WIDER_TILES.get(tile, tile) for tile in dedent(raw_map))
+
+
+def _move_robot_sideways(warehouse: Warehouse, step: int) -> None:
+    cells, robot = warehouse.cells, warehouse.robot
+    target = robot + step
+
+    while cells[target] in {BOX_LEFT, BOX_RIGHT}:
+        target += step
+
+    if cells[target] == WALL:
+        return
+
+    # the robot and the boxes in front of it shift by one in a single slice
+    if step > 0:
+        cells[robot + 1 : target + 1] = cells[robot:target]
+    else:
+        cells[target:robot] = cells[target + 1 : robot + 1]
+    cells[robot] = EMPTY
+    warehouse.robot = robot + step
+
+
+def _move_robot_vertically(warehouse: Warehouse, step: int) -> None:
+    cells = warehouse.cells
+    # every row of pushed cells is one step further than the previous one
+    pushed = [warehouse.robot]
+    seen = set(pushed)
+
+    for cell in pushed:
+        target = cell + step
+        if cells[target] == WALL:
+            return
+        if cells[target] == BOX_LEFT:
+            front = (target, target + 1)
+        elif cells[target] == BOX_RIGHT:
+            front = (target - 1, target)
+        else:
+            continue
+
+        for box_cell in front:
+            if box_cell not in seen:
+                seen.add(box_cell)
+                pushed.append(box_cell)
+
+    for cell in reversed(pushed):
+        cells[cell + step] = cells[cell]
+        cells[cell] = EMPTY
+
+    warehouse.robot += step
+
+
+assert widen("#O.@\n") == "##[]..@.\n"
+
+s = parse_warehouse(
+    widen(
+        """
+        #######
+        #...#.#
+        #.....#
+        #..OO@#
+        #..O..#
+        #.....#
+        #######
+        """,
+    ),
+)
+assert move(s, "<vv<<^^<<^^") == parse_warehouse(
+    """
+    ##############
+    ##...[].##..##
+    ##...@.[]...##
+    ##....[]....##
+    ##..........##
+    ##..........##
+    ##############
+    """,
+)
+
+s = parse_warehouse(
+    """
+    ########
+    ##..[]##
+    ##.[][]#
+    ##..@..#
+    ########
+    """,
+)
+assert move(s, "^") == parse_warehouse(
+    """
+    ########
+    ##..[]##
+    ##.[][]#
+    ##..@..#
+    ########
+    """,
+)
+
+s = parse_warehouse(
+    """
+    ##########
+    ##......##
+    ##.[][].##
+    ##..[]..##
+    ##..@...##
+    ##########
+    """,
+)
+assert move(s, "^") == parse_warehouse(
+    """
+    ##########
+    ##.[][].##
+    ##..[]..##
+    ##..@...##
+    ##......##
+    ##########
+    """,
+)
+
+s = parse_warehouse("##..[][]@.##")
+assert move(s, "<<<") == parse_warehouse("##[][]@...##")
+
+s = parse_warehouse(
+    widen(
+        """
+        ##########
+        #..O..O.O#
+        #......O.#
+        #.OO..O.O#
+        #..O@..O.#
+        #O#..O...#
+        #O..O..O.#
+        #.OO.O.OO#
+        #....O...#
+        ##########
+        """,
+    ),
+)
+directions = (
+    "<vv>^<v^>v>^vv^v>v<>v^v<v<^vv<<<^><<><>>v<vvv<>^v^>^<<<><<v<<<v^vv^v>^"
+    "vvv<<^>^v^^><<>>><>^<<><^vv^^<>vvv<>><^^v>^>vv<>v<<<<v<^v>^<^^>>>^<v<v"
+    "><>vv>v^v^<>><>>>><^^>vv>v<^^^>>v^v^<^^>v^^>v^<^v>v<>>v^v^<v>v^^<^^vv<"
+    "<<v<^>>^^^^>>>v^<>vvv^><v<<<>^^^vv^<vvv>^>v<^^^^v<>^>vvvv><>>v^<<^^^^^"
+    "^><^><>>><>^^<<^^v>>><^<v>^<vv>>v>>>^v><>^v><<<<v>>v<v<v>vvv>^<><<>^><"
+    "^>><>^v<><^vvv<^^<><v<<<<<><^v<<<><<<^^<v<^^^><^>>^<v^><<<^>>^v<v^v<v^"
+    ">^>>^v>vv>^<<^v<>><<><<v<<v><>v<^vv<<<>^^v^>^^>>><<^v>>v^v><^^>>^<>vv^"
+    "<><^^>^^^<><vvvvv^v<v<<>^v<v>v<<^><<><<><<<^^<<<^<<>><<><^^^>^^<>^>v<>"
+    "^^>vv<^v^v<vv>^<><v<^v>^^^>>>^^vvv^>vvv<>>>^<^>>>>>^<<^v>^vvv<>^<><<v>"
+    "v^^>>><<^^<>>^v^<v^vv<>v^<<>^<^v^v><^<<<><<^<v><v<>vv>>v><v^<vv<>v^<<^"
+)
+assert move(s, directions) == parse_warehouse(
+    """
+    ####################
+    ##[].......[].[][]##
+    ##[]...........[].##
+    ##[]........[][][]##
+    ##[]......[]....[]##
+    ##..##......[]....##
+    ##..[]............##
+    ##..@......[].[][]##
+    ##......[][]..[]..##
+    ####################
+    """,
+)
+assert sum_coordinates(s) == 9021
+
+with open("2024/15_warehouse_woes/input_map.txt") as f:
+    warehouse = parse_warehouse(widen(f.read()))
+
+with open("2024/15_warehouse_woes/input_moves.txt") as f:
+    directions = f.read()
+
+print(sum_coordinates(move(warehouse, directions)))
@@ -104,7 +104,7 @@ Once it halts, what do you get
 if you use commas to join the values it output into a single string?
 """
 
-from dataclasses import dataclass, field
+from collections.abc import Callable
 from enum import IntEnum
 from itertools import batched, chain
 from typing import NamedTuple, TypedDict
@@ -112,6 +112,12 @@ from typing import NamedTuple, TypedDict
 type Program = list[int]
 type LiteralOperand = int
 type ComboOperand = int
+type State = list[int]  # registers A, B and C
+type Output = list[int]
+type Executor = Callable[[State, Output], int | None]  # returns a jump if any
+type Runner = Callable[[int, int, int], Output]
+
+A, B, C = range(3)
 
 
 class Registers(TypedDict):
@@ -125,13 +131,6 @@ class Instruction(NamedTuple):
     operand: int
 
 
-@dataclass
-class Return:
-    registers: Registers
-    jump: int | None = field(default=None)
-    output: str = field(default="")
-
-
 class Op(IntEnum):
     ADV = 0
     BXL = 1
@@ -142,88 +141,79 @@ class Op(IntEnum):
     BDV = 6
     CDV = 7
 
-    @property
-    def executor(self):
-        return {
-            self.ADV: _adv,
-            self.BXL: _bxl,
-            self.BST: _bst,
-            self.JNZ: _jnz,
-            self.BXC: _bxc,
-            self.OUT: _out,
-            self.BDV: _bdv,
-            self.CDV: _cdv,
-        }[self]
-
 
 def compute(program: Program, registers: Registers) -> str:
-    instructions = _parse_instructions(program)
-    ip = 0
-    output = []
+    run = compile_program(program)
+    output = run(registers["A"], registers["B"], registers["C"])
+    return ",".join(map(str, output))
 
-    while True:
-        try:
-            instruction = instructions[ip]
-        except IndexError:
-            break
 
-        executor = instruction.operation.executor
-        returned = executor(instruction.operand, registers)
+def compile_program(program: Program) -> Runner:
+    executors = [
+        _compile_instruction(*instruction)
+        for instruction in _parse_instructions(program)
+    ]
+    size = len(executors)
+
+    def run(a: int, b: int = 0, c: int = 0) -> Output:
+        state = [a, b, c]
+        output = []
+        ip = 0
 
-        registers |= returned.registers
-        ip = returned.jump if returned.jump is not None else ip + 1
+        while ip < size:
+            jump = executors[ip](state, output)
+            ip = ip + 1 if jump is None else jump
 
-        if returned.output != "":
-            output.append(returned.output)
+        return output
 
-    return ",".join(output)
+    return run
 
 
-def _adv(operand: ComboOperand, registers: Registers) -> Return:
-    value = _get_operand_value(operand, registers)
-    update = {"A": registers["A"] // 2**value}
-    return Return(update)
+def _compile_instruction(operation: Op, operand: int) -> Executor:
+    read = _compile_combo(operand)
 
+    def adv(state: State, output: Output) -> None:
+        state[A] >>= read(state)
 
-def _bxl(value: LiteralOperand, registers: Registers) -> Return:
-    update = {"B": registers["B"] ^ value}
-    return Return(update)
+    def bxl(state: State, output: Output) -> None:
+        state[B] ^= operand
 
+    def bst(state: State, output: Output) -> None:
+        state[B] = read(state) & 7
 
-def _bst(operand: ComboOperand, registers: Registers) -> Return:
-    value = _get_operand_value(operand, registers)
-    update = {"B": value % 8}
-    return Return(update)
+    jump = operand // 2
 
+    def jnz(state: State, output: Output) -> int | None:
+        return jump if state[A] else None
 
-def _jnz(value: LiteralOperand, registers: Registers) -> Return:
-    if registers["A"] == 0:
-        return Return({})
+    def bxc(state: State, output: Output) -> None:
+        state[B] ^= state[C]
 
-    return Return({}, jump=value // 2)
+    def out(state: State, output: Output) -> None:
+        output.append(read(state) & 7)
 
+    def bdv(state: State, output: Output) -> None:
+        state[B] = state[A] >> read(state)
 
-def _bxc(operand: ComboOperand, registers: Registers) -> Return:
-    _get_operand_value(operand, registers)
-    update = {"B": registers["B"] ^ registers["C"]}
-    return Return(update)
+    def cdv(state: State, output: Output) -> None:
+        state[C] = state[A] >> read(state)
 
+    return [adv, bxl, bst, jnz, bxc, out, bdv, cdv][operation]
 
-def _out(operand: ComboOperand, registers: Registers) -> Return:
-    value = _get_operand_value(operand, registers)
-    return Return({}, output=str(value % 8))
 
+def _compile_combo(operand: ComboOperand) -> Callable[[State], int]:
+    if 0 <= operand <= 3:
+        return lambda state: operand
 
-def _bdv(operand: ComboOperand, registers: Registers) -> Return:
-    value = _get_operand_value(operand, registers)
-    update = {"B": registers["A"] // 2**value}
-    return Return(update)
+    if 4 <= operand <= 6:
+        register = operand - 4
+        return lambda state: state[register]
 
+    def reserved(state: State) -> int:
+        msg = "Bad operand"
+        raise ValueError(msg)
 
-def _cdv(operand: ComboOperand, registers: Registers) -> Return:
-    value = _get_operand_value(operand, registers)
-    update = {"C": registers["A"] // 2**value}
-    return Return(update)
+    return reserved
 
 
 def _parse_instructions(program: Program) -> list[Instruction]:
@@ -233,27 +223,18 @@ def _parse_instructions(program: Program) -> list[Instruction]:
     ]
 
 
-def _get_operand_value(operand: int, registers: Registers) -> int:
-    if 0 <= operand <= 3:
-        return operand
-
-    if operand == 4:
-        return registers["A"]
-
-    if operand == 5:
-        return registers["B"]
-
-    if operand == 6:
-        return registers["C"]
-
-    msg = "Bad operand"
-    raise ValueError(msg)
-
-
 def _to_program(*instructions: Instruction) -> list[int]:
     return list(chain.from_iterable(instructions))
 
 
+def _execute(
+    operation: Op, operand: int, state: State
+) -> tuple[State, Output, int | None]:
+    output = []
+    jump = _compile_instruction(operation, operand)(state, output)
+    return state, output, jump
+
+
 assert _parse_instructions([0, 1, 2, 3]) == [(Op.ADV, 1), (Op.BST, 3)]
 assert _parse_instructions([0, 1, 5, 4, 3, 0]) == [
     (Op.ADV, 1),
@@ -261,36 +242,34 @@ assert _parse_instructions([0, 1, 5, 4, 3, 0]) == [
     (Op.JNZ, 0),
 ]
 
-assert _adv(1, {"A": 4}) == Return({"A": 2})
-assert _adv(1, {"A": 5}) == Return({"A": 2})
+assert _execute(Op.ADV, 1, [4, 0, 0]) == ([2, 0, 0], [], None)
+assert _execute(Op.ADV, 1, [5, 0, 0]) == ([2, 0, 0], [], None)
 
-assert _bxl(1, {"B": 2}) == Return({"B": 3})
-assert _bxl(4, {"B": 2}) == Return({"B": 6})
+assert _execute(Op.BXL, 1, [0, 2, 0]) == ([0, 3, 0], [], None)
+assert _execute(Op.BXL, 4, [0, 2, 0]) == ([0, 6, 0], [], None)
 
-assert _bst(1, {}) == Return({"B": 1})
-assert _bst(4, {"A": 10}) == Return({"B": 2})
+assert _execute(Op.BST, 1, [0, 0, 0]) == ([0, 1, 0], [], None)
+assert _execute(Op.BST, 4, [10, 0, 0]) == ([10, 2, 0], [], None)
 
-assert _jnz(4, {"A": 0}) == Return({}, jump=None)
-assert _jnz(4, {"A": 1}) == Return({}, jump=2)
+assert _execute(Op.JNZ, 4, [0, 0, 0]) == ([0, 0, 0], [], None)
+assert _execute(Op.JNZ, 4, [1, 0, 0]) == ([1, 0, 0], [], 2)
 
-assert _bxc(1, {"B": 1, "C": 2}) == Return({"B": 3})
+assert _execute(Op.BXC, 1, [0, 1, 2]) == ([0, 3, 2], [], None)
 
-assert _out(1, {}) == Return({}, output="1")
-assert _out(4, {"A": 10}) == Return({}, output="2")
+assert _execute(Op.OUT, 1, [0, 0, 0]) == ([0, 0, 0], [1], None)
+assert _execute(Op.OUT, 4, [10, 0, 0]) == ([10, 0, 0], [2], None)
 
-assert _bdv(1, {"A": 4}) == Return({"B": 2})
-assert _bdv(1, {"A": 5}) == Return({"B": 2})
+assert _execute(Op.BDV, 1, [4, 0, 0]) == ([4, 2, 0], [], None)
+assert _execute(Op.BDV, 1, [5, 0, 0]) == ([5, 2, 0], [], None)
 
-assert _cdv(1, {"A": 4}) == Return({"C": 2})
-assert _cdv(1, {"A": 5}) == Return({"C": 2})
+assert _execute(Op.CDV, 1, [4, 0, 0]) == ([4, 0, 2], [], None)
+assert _execute(Op.CDV, 1, [5, 0, 0]) == ([5, 0, 2], [], None)
 
-assert _get_operand_value(0, {}) == 0
-assert _get_operand_value(1, {}) == 1
-assert _get_operand_value(2, {}) == 2
-assert _get_operand_value(3, {}) == 3
-assert _get_operand_value(4, {"A": 1}) == 1
-assert _get_operand_value(5, {"B": 1}) == 1
-assert _get_operand_value(6, {"C": 1}) == 1
+assert _compile_combo(0)([7, 8, 9]) == 0
+assert _compile_combo(3)([7, 8, 9]) == 3
+assert _compile_combo(4)([7, 8, 9]) == 7
+assert _compile_combo(5)([7, 8, 9]) == 8
+assert _compile_combo(6)([7, 8, 9]) == 9
 
 i = _to_program((Op.ADV, 1), (Op.OUT, 1), (Op.JNZ, 0))
 r = {"A": 4, "B": 0, "C": 0}
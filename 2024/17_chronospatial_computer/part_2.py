@@ -0,0 +1,161 @@
+"""
+Digging deeper in the device's manual, you discover the problem:
+this program is supposed to output another copy of the program!
+Unfortunately, the value in register A seems to have been corrupted.
+You'll need to find a new value to which you can initialize register A
+so that the program's output instructions produce an exact copy of the program itself.
+
+For example:
+
+Register A: 2024
+Register B: 0
+Register C: 0
+
+Program: 0,3,5,4,3,0
+
+This program outputs a copy of itself
+if register A is instead initialized to 117440.
+(The original initial value of register A, 2024, is ignored.)
+
+What is the lowest positive initial value for register A
+that causes the program to output a copy of itself?
+"""
+
+from collections.abc import Callable
+from enum import IntEnum
+from itertools import batched
+from typing import NamedTuple
+
+type Program = list[int]
+type LiteralOperand = int
+type ComboOperand = int
+type State = list[int]  # registers A, B and C
+type Output = list[int]
+type Executor = Callable[[State, Output], int | None]  # returns a jump if any
+type Runner = Callable[[int, int, int], Output]
+
+A, B, C = range(3)
+
+
+class Instruction(NamedTuple):
+    operation: Op
+    operand: int
+
+
+class Op(IntEnum):
+    ADV = 0
+    BXL = 1
+    BST = 2
+    JNZ = 3
+    BXC = 4
+    OUT = 5
+    BDV = 6
+    CDV = 7
+
+
+def find_quine(program: Program) -> int | None:
+    # every loop of the program prints one digit for the lowest 3 bits of A
+    # and shifts them out, so A is rebuilt 3 bits at a time from the last digit
+    run = compile_program(program)
+    candidates = [(0, len(program) - 1)]
+
+    while candidates:
+        a, index = candidates.pop()
+
+        if index < 0:
+            return a
+
+        # pushed in reverse so that the lowest bits are tried first
+        for bits in range(7, -1, -1):
+            candidate = a << 3 | bits
+            if candidate and run(candidate) == program[index:]:
+                candidates.append((candidate, index - 1))
+
+    return None
+
+
+def compile_program(program: Program) -> Runner:
+    executors = [
+        _compile_instruction(*instruction)
+        for instruction in _parse_instructions(program)
+    ]
+    size = len(executors)
+
+    def run(a: int, b: int = 0, c: int = 0) -> Output:
+        state = [a, b, c]
+        output = []
+        ip = 0
+
+        while ip < size:
+            jump = executors[ip](state, output)
+            ip = ip + 1 if jump is None else jump
+
+        return output
+
+    return run
+
+
+def _compile_instruction(operation: Op, operand: int) -> Executor:
+    read = _compile_combo(operand)
+
+    def adv(state: State, output: Output) -> None:
+        state[A] >>= read(state)
+
+    def bxl(state: State, output: Output) -> None:
+        state[B] ^= operand
+
+    def bst(state: State, output: Output) -> None:
+        state[B] = read(state) & 7
+
+    jump = operand // 2
+
+    def jnz(state: State, output: Output) -> int | None:
+        return jump if state[A] else None
+
+    def bxc(state: State, output: Output) -> None:
+        state[B] ^= state[C]
+
+    def out(state: State, output: Output) -> None:
+        output.append(read(state) & 7)
+
+    def bdv(state: State, output: Output) -> None:
+        state[B] = state[A] >> read(state)
+
+    def cdv(state: State, output: Output) -> None:
+        state[C] = state[A] >> read(state)
+
+    return [adv, bxl, bst, jnz, bxc, out, bdv, cdv][operation]
+
+
+def _compile_combo(operand: ComboOperand) -> Callable[[State], int]:
+    if 0 <= operand <= 3:
+        return lambda state: operand
+
+    if 4 <= operand <= 6:
+        register = operand - 4
+        return lambda state: state[register]
+
+    def reserved(state: State) -> int:
+        msg = "Bad operand"
+        raise ValueError(msg)
+
+    return reserved
+
+
+def _parse_instructions(program: Program) -> list[Instruction]:
+    return [
+        Instruction(Op(operation), operand)
+        for operation, operand in batched(program, n=2)
+    ]
+
+
+assert compile_program([0, 3, 5, 4, 3, 0])(117440) == [0, 3, 5, 4, 3, 0]
+assert compile_program([0, 1, 5, 4, 3, 0])(729) == [4, 6, 3, 5, 6, 3, 5, 2, 1, 0]
+
+assert find_quine([0, 3, 5, 4, 3, 0]) == 117440
+assert find_quine([5, 4]) is None
+
+program = [2, 4, 1, 1, 7, 5, 1, 5, 4, 3, 0, 3, 5, 5, 3, 0]
+quine = find_quine(program)
+assert compile_program(program)(quine) == program
+print(quine)
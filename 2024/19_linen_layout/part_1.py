@@ -73,24 +73,48 @@ consult your list of towel patterns and desired designs carefully.
 How many designs are possible?
 """
 
-from functools import cache
+from collections.abc import Iterable
 
 type Design = str
 type Towel = str
+type Trie = dict[str, Trie]
 
+END = ""
+
+
+def is_design_possible(trie: Trie, design: Design) -> bool:
+    # possible[i] tells whether design[i:] can be made from towels
+    possible = bytearray(len(design) + 1)
+    possible[-1] = True
+
+    for start in range(len(design) - 1, -1, -1):
+        node = trie
+        for end in range(start, len(design)):
+            node = node.get(design[end])
+            if node is None:
+                break
+            if END in node and possible[end + 1]:
+                possible[start] = True
+                break
+
+    return bool(possible[0])
+
+
+def build_trie(towels: Iterable[Towel]) -> Trie:
+    trie: Trie = {}
 
-@cache
-def is_design_possible(towels: tuple[Towel, ...], design: Design) -> bool:
     for towel in towels:
-        if design.startswith(towel):
-            cutted_design = design.removeprefix(towel)
-            if cutted_design == "" or is_design_possible(towels, cutted_design):
-                return True
+        node = trie
+        for stripe in towel:
+            node = node.setdefault(stripe, {})
+        node[END] = {}
+
+    return trie
 
-    return False
 
+assert build_trie(["r", "rb", "b"]) == {"r": {END: {}, "b": {END: {}}}, "b": {END: {}}}
 
-towels = ("r", "wr", "b", "g", "bwu", "rb", "gb", "br")
+towels = build_trie(["r", "wr", "b", "g", "bwu", "rb", "gb", "br"])
 assert is_design_possible(towels, "brwrr") is True
 assert is_design_possible(towels, "bggr") is True
 assert is_design_possible(towels, "gbbr") is True
@@ -101,7 +125,7 @@ assert is_design_possible(towels, "brgr") is True
 assert is_design_possible(towels, "bbrgwb") is False
 
 with open("2024/19_linen_layout/input_towels.txt") as f:
-    towels = tuple(f.read().split(", "))
+    towels = build_trie(f.read().strip().split(", "))
 
 with open("2024/19_linen_layout/input_designs.txt") as f:
     designs = f.read().splitlines()
@@ -30,27 +30,47 @@ They'll let you into the onsen as soon as you have the list.
 What do you get if you add up the number of different ways you could make each design?
 """
 
-from functools import cache
+from collections.abc import Iterable
 
 type Design = str
 type Towel = str
+type Trie = dict[str, Trie]
 
+END = ""
+
+
+def count_combos(trie: Trie, design: Design) -> int:
+    # combos[i] is the number of ways to make design[i:] from towels
+    combos = [0] * (len(design) + 1)
+    combos[-1] = 1
+
+    for start in range(len(design) - 1, -1, -1):
+        node = trie
+        for end in range(start, len(design)):
+            node = node.get(design[end])
+            if node is None:
+                break
+            if END in node:
+                combos[start] += combos[end + 1]
+
+    return combos[0]
+
+
+def build_trie(towels: Iterable[Towel]) -> Trie:
+    trie: Trie = {}
 
-@cache
-def count_combos(towels: tuple[Towel, ...], design: Design) -> set[list[str]]:
-    combos = 0
     for towel in towels:
-        if design.startswith(towel):
-            if towel == design:
-                combos += 1
-            else:
-                other_combos = count_combos(towels, design.removeprefix(towel))
-                combos += other_combos
+        node = trie
+        for stripe in towel:
+            node = node.setdefault(stripe, {})
+        node[END] = {}
+
+    return trie
 
-    return combos
 
+assert build_trie(["r", "rb", "b"]) == {"r": {END: {}, "b": {END: {}}}, "b": {END: {}}}
 
-towels = ("r", "wr", "b", "g", "bwu", "rb", "gb", "br")
+towels = build_trie(["r", "wr", "b", "g", "bwu", "rb", "gb", "br"])
 assert count_combos(towels, "brwrr") == 2
 assert count_combos(towels, "bggr") == 1
 assert count_combos(towels, "gbbr") == 4
@@ -61,7 +81,7 @@ assert count_combos(towels, "brgr") == 2
 assert count_combos(towels, "bbrgwb") == 0
 
 with open("2024/19_linen_layout/input_towels.txt") as f:
-    towels = tuple(f.read().split(", "))
+    towels = build_trie(f.read().strip().split(", "))
 
 with open("2024/19_linen_layout/input_designs.txt") as f:
     designs = f.read().splitlines()
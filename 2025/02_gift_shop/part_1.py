@@ -62,11 +62,21 @@ class GiftRange(NamedTuple):
     end: int
 
 
+def sum_invalid_gift_ids(ranges: str) -> int:
+    return sum(
+        _sum_repeated(gift_range, length, length // 2)
+        for gift_range in _parse_ranges(ranges)
+        for length in _get_lengths(gift_range)
+        if length % 2 == 0
+    )
+
+
 def get_invalid_gift_ids(ranges: str) -> Iterator[int]:
     for gift_range in _parse_ranges(ranges):
-        for gift_id in _gen_gift_ids(gift_range):
-            if not _is_valid(str(gift_id)):
-                yield gift_id
+        for length in _get_lengths(gift_range):
+            if length % 2 == 0:
+                patterns, multiplier = _get_patterns(gift_range, length, length // 2)
+                yield from (pattern * multiplier for pattern in patterns)
 
 
 def _is_valid(gift_id: str) -> bool:
@@ -74,8 +84,26 @@ def _is_valid(gift_id: str) -> bool:
     return gift_id[:half] != gift_id[half:]
 
 
-def _gen_gift_ids(gift_range: GiftRange) -> Iterator[int]:
-    yield from range(gift_range.start, gift_range.end + 1)
+def _sum_repeated(gift_range: GiftRange, length: int, block: int) -> int:
+    patterns, multiplier = _get_patterns(gift_range, length, block)
+    return multiplier * (patterns.start + patterns.stop - 1) * len(patterns) // 2
+
+
+def _get_patterns(
+    gift_range: GiftRange,
+    length: int,
+    block: int,
+) -> tuple[range, int]:
+    # IDs of the given length made of a repeated block are pattern * multiplier,
+    # where multiplier is 1 + 10^block + 10^(2 * block) + ...
+    multiplier = (10**length - 1) // (10**block - 1)
+    first = max(10 ** (block - 1), -(-gift_range.start // multiplier))
+    last = min(10**block - 1, gift_range.end // multiplier)
+    return range(first, last + 1), multiplier
+
+
+def _get_lengths(gift_range: GiftRange) -> range:
+    return range(len(str(gift_range.start)), len(str(gift_range.end)) + 1)
 
 
 def _parse_ranges(raw_ranges: str) -> list[GiftRange]:
@@ -90,10 +118,24 @@ assert _is_valid("121") is True
 
 assert _parse_ranges("11-22,95-115") == [GiftRange(11, 22), GiftRange(95, 115)]
 
-assert list(_gen_gift_ids(GiftRange(1, 2))) == [1, 2]
+assert _get_lengths(GiftRange(95, 115)) == range(2, 4)
+assert _get_patterns(GiftRange(95, 115), 2, 1) == (range(9, 10), 11)
+assert _get_patterns(GiftRange(1000, 1500), 4, 2) == (range(10, 15), 101)
+assert _sum_repeated(GiftRange(1000, 1500), 4, 2) == 101 * (10 + 11 + 12 + 13 + 14)
 
 assert list(get_invalid_gift_ids("11-22")) == [11, 22]
 assert list(get_invalid_gift_ids("95-115")) == [99]
+assert list(get_invalid_gift_ids("1-100000")) == [
+    gift_id for gift_id in range(1, 100001) if not _is_valid(str(gift_id))
+]
+
+assert sum_invalid_gift_ids("11-22,95-115") == 11 + 22 + 99
+assert sum_invalid_gift_ids("1-100000") == sum(get_invalid_gift_ids("1-100000"))
+assert sum_invalid_gift_ids("1-999999999999") == sum(
+    pattern * (10**length + 1)
+    for length in range(1, 7)
+    for pattern in range(10 ** (length - 1), 10**length)
+)
 
 with open("2025/02_gift_shop/input.txt") as f:
-    print(sum(get_invalid_gift_ids(f.read().strip())))
+    print(sum_invalid_gift_ids(f.read().strip()))
@@ -28,6 +28,8 @@ What do you get if you add up all of the invalid IDs using these new rules?
 
 import re
 from collections.abc import Iterator
+from itertools import combinations
+from math import prod
 from typing import NamedTuple
 
 
@@ -36,19 +38,82 @@ class GiftRange(NamedTuple):
     end: int
 
 
+def sum_invalid_gift_ids(ranges: str) -> int:
+    return sum(
+        _sum_any_repeated(gift_range, length)
+        for gift_range in _parse_ranges(ranges)
+        for length in _get_lengths(gift_range)
+    )
+
+
 def get_invalid_gift_ids(ranges: str) -> Iterator[int]:
     for gift_range in _parse_ranges(ranges):
-        for gift_id in _gen_gift_ids(gift_range):
-            if not _is_valid(gift_id):
-                yield gift_id
+        for length in _get_lengths(gift_range):
+            gift_ids = set()
+            for prime in _get_prime_factors(length):
+                patterns, multiplier = _get_patterns(
+                    gift_range, length, length // prime
+                )
+                gift_ids.update(pattern * multiplier for pattern in patterns)
+            yield from sorted(gift_ids)
+
+
+def _sum_any_repeated(gift_range: GiftRange, length: int) -> int:
+    # an ID repeated in blocks of size k is also repeated in blocks of any
+    # multiple of k, so only blocks of length / prime are needed,
+    # and IDs repeated in several of them are excluded by inclusion-exclusion
+    primes = _get_prime_factors(length)
+    res = 0
+
+    for size in range(1, len(primes) + 1):
+        sign = 1 if size % 2 else -1
+        for subset in combinations(primes, size):
+            res += sign * _sum_repeated(gift_range, length, length // prod(subset))
+
+    return res
+
+
+def _get_prime_factors(n: int) -> list[int]:
+    res = []
+    factor = 2
+
+    while factor * factor <= n:
+        if n % factor == 0:
+            res.append(factor)
+            while n % factor == 0:
+                n //= factor
+        factor += 1
+
+    if n > 1:
+        res.append(n)
+
+    return res
 
 
 def _is_valid(gift_id: int) -> bool:
     return re.fullmatch(r"(\d+)\1+", str(gift_id)) is None
 
 
-def _gen_gift_ids(gift_range: GiftRange) -> Iterator[int]:
-    yield from range(gift_range.start, gift_range.end + 1)
+def _sum_repeated(gift_range: GiftRange, length: int, block: int) -> int:
+    patterns, multiplier = _get_patterns(gift_range, length, block)
+    return multiplier * (patterns.start + patterns.stop - 1) * len(patterns) // 2
+
+
+def _get_patterns(
+    gift_range: GiftRange,
+    length: int,
+    block: int,
+) -> tuple[range, int]:
+    # IDs of the given length made of a repeated block are pattern * multiplier,
+    # where multiplier is 1 + 10^block + 10^(2 * block) + ...
+    multiplier = (10**length - 1) // (10**block - 1)
+    first = max(10 ** (block - 1), -(-gift_range.start // multiplier))
+    last = min(10**block - 1, gift_range.end // multiplier)
+    return range(first, last + 1), multiplier
+
+
+def _get_lengths(gift_range: GiftRange) -> range:
+    return range(len(str(gift_range.start)), len(str(gift_range.end)) + 1)
 
 
 def _parse_ranges(raw_ranges: str) -> list[GiftRange]:
@@ -64,10 +129,23 @@ assert _is_valid(123123123) is False
 
 assert _parse_ranges("11-22,95-115") == [GiftRange(11, 22), GiftRange(95, 115)]
 
-assert list(_gen_gift_ids(GiftRange(1, 2))) == [1, 2]
+assert _get_prime_factors(1) == []
+assert _get_prime_factors(12) == [2, 3]
+assert _get_prime_factors(7) == [7]
+
+assert _get_patterns(GiftRange(95, 115), 3, 1) == (range(1, 2), 111)
+assert _sum_any_repeated(GiftRange(1, 10**6), 6) == sum(
+    gift_id for gift_id in range(10**5, 10**6) if not _is_valid(gift_id)
+)
 
 assert list(get_invalid_gift_ids("11-22")) == [11, 22]
 assert list(get_invalid_gift_ids("95-115")) == [99, 111]
+assert list(get_invalid_gift_ids("1-100000")) == [
+    gift_id for gift_id in range(1, 100001) if not _is_valid(gift_id)
+]
+
+assert sum_invalid_gift_ids("11-22,95-115") == 11 + 22 + 99 + 111
+assert sum_invalid_gift_ids("1-100000") == sum(get_invalid_gift_ids("1-100000"))
 
 with open("2025/02_gift_shop/input.txt") as f:
-    print(sum(get_invalid_gift_ids(f.read().strip())))
+    print(sum_invalid_gift_ids(f.read().strip()))
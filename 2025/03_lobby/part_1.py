@@ -52,36 +52,52 @@ There are many batteries in front of you.
 Find the maximum joltage possible from each bank; what is the total output joltage?
 """
 
-type Battery = int
-type Bank = list[Battery]
+from collections.abc import Iterable
 
+ZERO = ord("0")
 
-def find_max_joltage(raw_bank: str) -> int:
-    bank = _parse_bank(raw_bank)
-    first, second = 0, 0
 
-    for battery in bank:
-        if second <= battery:
-            first = max(second, first)
-            second = battery
-        elif first < second:
-            second, first = battery, second
+def find_max_joltage(raw_bank: bytes, size: int = 2) -> int:
+    # keep a non-increasing stack of batteries,
+    # dropping smaller ones while there are still batteries to spare
+    spare = len(raw_bank) - size
+    if raw_bank and spare < 0:
+        msg = f"A bank of {len(raw_bank)} batteries cannot turn on {size}"
+        raise ValueError(msg)
 
-    return int(f"{first}{second}")
+    stack = bytearray()
 
+    for battery in raw_bank:
+        while spare > 0 and stack and stack[-1] < battery:
+            stack.pop()
+            spare -= 1
+        stack.append(battery)
 
-def _parse_bank(raw_bank: str) -> Bank:
-    return list(map(int, raw_bank))
+    res = 0
+    for battery in stack[:size]:
+        res = res * 10 + battery - ZERO
 
+    return res
 
-assert find_max_joltage("987654321111111") == 98
-assert find_max_joltage("811111111111119") == 89
-assert find_max_joltage("234234234234278") == 78
-assert find_max_joltage("818181911112111") == 92
 
+def get_total_joltage(raw_banks: Iterable[bytes], size: int = 2) -> int:
+    banks = (raw_bank.strip() for raw_bank in raw_banks)
+    return sum(find_max_joltage(bank, size) for bank in banks if bank)
 
-with open("2025/03_lobby/input.txt") as f:
-    res = 0
-    for line in f:
-        res += find_max_joltage(line.strip())
-    print(res)
+
+assert find_max_joltage(b"987654321111111") == 98
+assert find_max_joltage(b"811111111111119") == 89
+assert find_max_joltage(b"234234234234278") == 78
+assert find_max_joltage(b"818181911112111") == 92
+assert find_max_joltage(b"12", 2) == 12
+assert find_max_joltage(b"4321", 3) == 432
+assert find_max_joltage(b"1234", 3) == 234
+assert find_max_joltage(b"123", 3) == 123
+assert find_max_joltage(b"", 3) == 0
+
+assert get_total_joltage([b"987654321111111\n", b"811111111111119\n"]) == 98 + 89
+assert get_total_joltage([b"12\n", b"\n", b"34\n", b""]) == 12 + 34
+
+
+with open("2025/03_lobby/input.txt", "rb") as f:
+    print(get_total_joltage(f))
@@ -0,0 +1,97 @@
+"""
+The escalator doesn't move. The Elf explains that it probably needs more joltage
+to overcome the static friction of the system
+and hits the big red "joltage limit safety override" button.
+You lose count of the number of times she needs to confirm "yes, I'm sure"
+and decorate the lobby a bit while you wait.
+
+Now, you need to make the largest joltage
+by turning on exactly twelve batteries within each bank.
+
+The joltage output for the bank is still the number formed
+by the digits of the batteries you've turned on; the only difference is
+that now there will be 12 digits in each bank's joltage output instead of two.
+
+Consider again the example from before:
+
+987654321111111
+811111111111119
+234234234234278
+818181911112111
+
+Now, the joltages are much larger:
+
+-   In 987654321111111, the largest joltage can be found
+    by turning on everything except some 1s at the end to produce 987654321111.
+-   In the digit sequence 811111111111119, the largest joltage can be found
+    by turning on everything except some 1s, producing 811111111119.
+-   In 234234234234278, the largest joltage can be found by turning on everything
+    except a 2 battery, a 3 battery, and another 2 battery near the start
+    to produce 434234234278.
+-   In 818181911112111, the joltage 888911112111 is produced
+    by turning on everything except some 1s near the front.
+
+The total output joltage is now much larger:
+987654321111 + 811111111119 + 434234234278 + 888911112111 = 3121910778619.
+
+What is the new total output joltage?
+"""
+
+from collections.abc import Iterable
+
+ZERO = ord("0")
+SIZE = 12
+
+
+def find_max_joltage(raw_bank: bytes, size: int = SIZE) -> int:
+    # keep a non-increasing stack of batteries,
+    # dropping smaller ones while there are still batteries to spare
+    spare = len(raw_bank) - size
+    if raw_bank and spare < 0:
+        msg = f"A bank of {len(raw_bank)} batteries cannot turn on {size}"
+        raise ValueError(msg)
+
+    stack = bytearray()
+
+    for battery in raw_bank:
+        while spare > 0 and stack and stack[-1] < battery:
+            stack.pop()
+            spare -= 1
+        stack.append(battery)
+
+    res = 0
+    for battery in stack[:size]:
+        res = res * 10 + battery - ZERO
+
+    return res
+
+
+def get_total_joltage(raw_banks: Iterable[bytes], size: int = SIZE) -> int:
+    banks = (raw_bank.strip() for raw_bank in raw_banks)
+    return sum(find_max_joltage(bank, size) for bank in banks if bank)
+
+
+assert find_max_joltage(b"987654321111111") == 987654321111
+assert find_max_joltage(b"811111111111119") == 811111111119
+assert find_max_joltage(b"234234234234278") == 434234234278
+assert find_max_joltage(b"818181911112111") == 888911112111
+assert find_max_joltage(b"818181911112111", 2) == 92
+assert find_max_joltage(b"123", 3) == 123
+assert find_max_joltage(b"", 3) == 0
+assert get_total_joltage([b"12\n", b"\n", b"34\n", b""], 2) == 12 + 34
+
+assert (
+    get_total_joltage(
+        [
+            b"987654321111111\n",
+            b"811111111111119\n",
+            b"234234234234278\n",
+            b"818181911112111\n",
+        ],
+    )
+    == 3121910778619
+)
+
+
+with open("2025/03_lobby/input.txt", "rb") as f:
+    print(get_total_joltage(f))
@@ -139,13 +139,18 @@ Start with your original diagram.
 How many rolls of paper in total can be removed by the Elves and their forklifts?
 """
 
-from collections.abc import Iterable
+from array import array
+from collections import deque
+from collections.abc import Iterator
 from enum import StrEnum
+from itertools import chain
 from textwrap import dedent
 from typing import NamedTuple
 
 type Maze = list[list[Cell]]
 
+MAX_NEIGHBORS = 3
+
 
 class Point(NamedTuple):
     x: int
@@ -157,60 +162,102 @@ class Cell(StrEnum):
     PAPER = "@"
 
 
+class PaperGrid(NamedTuple):
+    # papers and their neighbor counts, flattened with a border of free cells
+    papers: bytearray
+    counts: array[int]
+    width: int
+
+
 def run_forklifts(maze: Maze) -> list[Point]:
+    grid = _to_paper_grid(maze)
+    papers, counts = grid.papers, grid.counts
+    offsets = _get_offsets(grid.width)
+    queue = deque(_get_accessible(grid))
     res = []
 
-    while True:
-        papers_to_remove = _get_accessible_points(maze)
+    while queue:
+        idx = queue.popleft()
+        papers[idx] = 0
+        res.append(idx)
 
-        if papers_to_remove:
-            res.extend(papers_to_remove)
-        else:
-            break
+        for offset in offsets:
+            n = idx + offset
+            if papers[n]:
+                counts[n] -= 1
+                if counts[n] == MAX_NEIGHBORS:
+                    queue.append(n)
 
-        maze = _remove_papers(maze, papers_to_remove)
+    return [_to_point(grid, idx) for idx in res]
 
-    return res
 
+def get_removal_rounds(maze: Maze) -> Iterator[list[Point]]:
+    grid = _to_paper_grid(maze)
+    papers, counts = grid.papers, grid.counts
+    offsets = _get_offsets(grid.width)
+    removed = _get_accessible(grid)
 
-def _get_accessible_points(maze: Maze) -> list[Point]:
-    res = []
+    while removed:
+        yield [_to_point(grid, idx) for idx in removed]
 
-    for i, row in enumerate(maze):
-        for j, _ in enumerate(row):
-            p = Point(i, j)
-            papers_around = (_is_paper(maze, n) for n in _get_neighbors(p))
+        for idx in removed:
+            papers[idx] = 0
 
-            if _is_paper(maze, p) and sum(papers_around) < 4:
-                res.append(p)
+        accessible = []
+        for idx in removed:
+            for offset in offsets:
+                n = idx + offset
+                if papers[n]:
+                    counts[n] -= 1
+                    if counts[n] == MAX_NEIGHBORS:
+                        accessible.append(n)
 
-    return res
+        removed = accessible
 
 
-def _remove_papers(maze: Maze, points: list[Point]) -> Maze:
-    for p in points:
-        maze[p.x][p.y] = Cell.FREE
-    return maze
+def _get_accessible(grid: PaperGrid) -> list[int]:
+    return [
+        idx
+        for idx, paper in enumerate(grid.papers)
+        if paper and grid.counts[idx] <= MAX_NEIGHBORS
+    ]
 
 
-def _get_neighbors(p: Point) -> Iterable[Point]:
-    yield Point(p.x - 1, p.y - 1)
-    yield Point(p.x - 1, p.y)
-    yield Point(p.x - 1, p.y + 1)
+def _to_paper_grid(maze: Maze) -> PaperGrid:
+    width = len(maze[0]) + 2
+    papers = bytearray(width)
 
-    yield Point(p.x, p.y - 1)
-    yield Point(p.x, p.y + 1)
+    for row in maze:
+        papers.append(0)
+        papers.extend(cell == Cell.PAPER for cell in row)
+        papers.append(0)
+    papers.extend(bytes(width))
 
-    yield Point(p.x + 1, p.y - 1)
-    yield Point(p.x + 1, p.y)
-    yield Point(p.x + 1, p.y + 1)
+    offsets = _get_offsets(width)
+    counts = array("b", bytes(len(papers)))
+    for idx in range(width, len(papers) - width):
+        if papers[idx]:
+            counts[idx] = sum(papers[idx + offset] for offset in offsets)
 
+    return PaperGrid(papers, counts, width)
 
-def _is_paper(maze: Maze, p: Point) -> bool:
-    if 0 <= p.x < len(maze) and 0 <= p.y < len(maze[p.x]):
-        return maze[p.x][p.y] == Cell.PAPER
 
-    return False
+def _get_offsets(width: int) -> tuple[int, ...]:
+    return (
+        -width - 1,
+        -width,
+        -width + 1,
+        -1,
+        1,
+        width - 1,
+        width,
+        width + 1,
+    )
+
+
+def _to_point(grid: PaperGrid, idx: int) -> Point:
+    x, y = divmod(idx, grid.width)
+    return Point(x - 1, y - 1)
 
 
 def _to_maze(s: str) -> Maze:
@@ -222,14 +269,14 @@ maze = _to_maze(
     .
     """,
 )
-assert _get_accessible_points(maze) == []
+assert next(get_removal_rounds(maze), []) == []
 
 maze = _to_maze(
     """
     @
     """,
 )
-assert _get_accessible_points(maze) == [(0, 0)]
+assert next(get_removal_rounds(maze), []) == [(0, 0)]
 
 maze = _to_maze(
     """
@@ -245,7 +292,7 @@ maze = _to_maze(
     @.@.@@@.@.
     """,
 )
-assert _get_accessible_points(maze) == [
+assert next(get_removal_rounds(maze), []) == [
     (0, 2),
     (0, 3),
     (0, 5),
@@ -276,6 +323,20 @@ maze = _to_maze(
     """,
 )
 assert len(run_forklifts(maze)) == 43
+assert sorted(run_forklifts(maze)) == sorted(
+    chain.from_iterable(get_removal_rounds(maze))
+)
+assert [len(points) for points in get_removal_rounds(maze)] == [
+    13,
+    12,
+    7,
+    5,
+    2,
+    1,
+    1,
+    1,
+    1,
+]
 
 
 with open("2025/04_printing_department/input.txt") as f:
@@ -51,6 +51,9 @@ Process the database file from the new inventory management system.
 How many of the available ingredient IDs are fresh?
 """
 
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable
 from typing import NamedTuple
 
 
@@ -59,39 +62,78 @@ class Range(NamedTuple):
     end: int
 
 
-def get_fresh_ingredients(ranges: list[Range], available_ids: list[int]) -> list[int]:
-    res = []
+class RangeIndex(NamedTuple):
+    # disjoint sorted ranges as parallel arrays of inclusive bounds
+    starts: array[int]
+    ends: array[int]
 
-    for id_ in available_ids:
-        for fresh_range in ranges:
-            if _is_in_range(id_, fresh_range):
-                res.append(id_)
-                break
 
-    return res
+def build_index(ranges: Iterable[Range]) -> RangeIndex:
+    starts, ends = array("q"), array("q")
 
+    for start, end in sorted(ranges):
+        if starts and start <= ends[-1] + 1:
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
 
-def _is_in_range(id_: int, fresh_range: Range) -> bool:
-    return fresh_range.start <= id_ <= fresh_range.end
+    return RangeIndex(starts, ends)
+
+
+def contains(index: RangeIndex, id_: int) -> bool:
+    i = bisect_right(index.starts, id_) - 1
+    return i >= 0 and id_ <= index.ends[i]
+
+
+def count_covered(index: RangeIndex) -> int:
+    return sum(index.ends) - sum(index.starts) + len(index.starts)
+
+
+def get_fresh_ingredients(
+    ranges: Iterable[Range],
+    available_ids: Iterable[int],
+) -> list[int]:
+    index = build_index(ranges)
+    return [id_ for id_ in available_ids if contains(index, id_)]
 
 
 def _parse_range(raw_range: str) -> Range:
     return Range(*map(int, raw_range.split("-")))
 
 
+assert build_index([Range(3, 5), Range(10, 14), Range(16, 20), Range(12, 18)]) == (
+    array("q", [3, 10]),
+    array("q", [5, 20]),
+)
+assert build_index([Range(3, 5), Range(6, 7)]) == (array("q", [3]), array("q", [7]))
+
+index = build_index([Range(3, 5), Range(10, 14)])
+assert [contains(index, id_) for id_ in range(2, 16)] == [
+    False,
+    True,
+    True,
+    True,
+    False,
+    False,
+    False,
+    False,
+    True,
+    True,
+    True,
+    True,
+    True,
+    False,
+]
+assert count_covered(index) == 8
+
 ranges = list(map(_parse_range, ["3-5", "10-14", "16-20", "12-18"]))
 ids = [1, 5, 8, 11, 17, 32]
 assert get_fresh_ingredients(ranges, ids) == [5, 11, 17]
 
 
 with open("2025/05_cafeteria/input_ranges.txt") as f:
-    ranges = []
-    for line in f:
-        ranges.append(_parse_range(line.strip()))
+    ranges = [_parse_range(line.strip()) for line in f]
 
 with open("2025/05_cafeteria/input_ids.txt") as f:
-    ids = []
-    for line in f:
-        ids.append(int(line.strip()))
-
-print(len(get_fresh_ingredients(ranges, ids)))
+    print(len(get_fresh_ingredients(ranges, map(int, f))))
@@ -25,6 +25,7 @@ How many ingredient IDs are considered to be fresh
 according to the fresh ingredient ID ranges?
 """
 
+from array import array
 from collections.abc import Iterable
 from typing import NamedTuple
 
@@ -34,41 +35,44 @@ class Range(NamedTuple):
     end: int
 
 
-def len_fresh_ingredients(raw_ranges: list[str]) -> int:
-    ranges = map(_parse_range, raw_ranges)
-    ranges = _collapse_ranges(ranges)
+class RangeIndex(NamedTuple):
+    # disjoint sorted ranges as parallel arrays of inclusive bounds
+    starts: array[int]
+    ends: array[int]
 
-    res = 0
-    for range_ in ranges:
-        res += range_.end - range_.start + 1
 
-    return res
+def build_index(ranges: Iterable[Range]) -> RangeIndex:
+    starts, ends = array("q"), array("q")
 
+    for start, end in sorted(ranges):
+        if starts and start <= ends[-1] + 1:
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
 
-def _collapse_ranges(ranges: Iterable[Range]) -> list[Range]:
-    res = []
-    ranges = sorted(ranges)
-    start, end = ranges[0]
+    return RangeIndex(starts, ends)
 
-    for range_ in ranges[1:]:
-        if range_.start > end:
-            res.append(Range(start, end))
-            start, end = range_
-        else:
-            end = max(end, range_.end)
 
-    res.append(Range(start, end))
+def count_covered(index: RangeIndex) -> int:
+    return sum(index.ends) - sum(index.starts) + len(index.starts)
+
 
-    return res
+def len_fresh_ingredients(raw_ranges: Iterable[str]) -> int:
+    return count_covered(build_index(map(_parse_range, raw_ranges)))
 
 
 def _parse_range(raw_range: str) -> Range:
     return Range(*map(int, raw_range.split("-")))
 
 
-assert _collapse_ranges([Range(3, 5), Range(10, 14)]) == [Range(3, 5), Range(10, 14)]
-assert _collapse_ranges([Range(3, 5), Range(4, 7)]) == [Range(3, 7)]
-assert _collapse_ranges([Range(3, 10), Range(4, 7)]) == [Range(3, 10)]
+assert build_index([Range(3, 5), Range(10, 14)]) == (
+    array("q", [3, 10]),
+    array("q", [5, 14]),
+)
+assert build_index([Range(3, 5), Range(4, 7)]) == (array("q", [3]), array("q", [7]))
+assert build_index([Range(3, 10), Range(4, 7)]) == (array("q", [3]), array("q", [10]))
+assert build_index([Range(3, 5), Range(6, 7)]) == (array("q", [3]), array("q", [7]))
 
 assert len_fresh_ingredients(["3-5", "10-14"]) == 8
 assert len_fresh_ingredients(["3-5", "4-7"]) == 5
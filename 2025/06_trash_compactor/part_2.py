@@ -36,12 +36,14 @@ import re
 from collections.abc import Iterable
 from enum import StrEnum
 from functools import reduce
-from itertools import groupby
-from operator import mul
+from operator import mul, or_
 from typing import NamedTuple
 
 type Sheet = list[Problem]
 
+SPACE = ord(" ")
+ZERO = ord("0")
+
 
 class Problem(NamedTuple):
     op: Op
@@ -67,57 +69,68 @@ def get_total(sheet: Sheet) -> int:
     return res
 
 
-def _parse_sheet(f: Iterable[str]) -> Sheet:
-    *digits, raw_ops = f
+def _parse_sheet(f: Iterable[bytes]) -> Sheet:
+    *rows, raw_ops = [line.rstrip(b"\r\n") for line in f]
+    width = max(map(len, rows))
+    rows = [row.ljust(width, b" ") for row in rows]
 
-    numbers = map(_maybe_int, zip(*digits))
-    ops = map(Op, re.split(r"\s+", raw_ops.strip()))
+    # or-ing all rows leaves a space only in separator columns,
+    # since every digit has more bits set than a space
+    columns = reduce(or_, map(int.from_bytes, rows)).to_bytes(width)
 
     res = []
 
-    for sep, args in groupby(numbers, key=lambda n: n is not None):
-        if sep:
-            res.append(Problem(next(ops), list(args)))
+    for block in re.finditer(rb"[^ ]+", columns):
+        numbers = [_decode_column(rows, i) for i in range(*block.span())]
+        res.append(Problem(Op(chr(raw_ops[block.start()])), numbers))
     return res
 
 
-def _maybe_int(chars: tuple[str]) -> int | None:
-    try:
-        return int("".join(chars).strip())
-    except ValueError:
-        return None
+def _decode_column(rows: list[bytes], i: int) -> int:
+    res = 0
+
+    for row in rows:
+        if row[i] != SPACE:
+            res = res * 10 + row[i] - ZERO
+    return res
 
 
 f = [
-    "13",
-    "2 ",
-    "+ ",
+    b"13",
+    b"2 ",
+    b"+ ",
 ]
 assert _parse_sheet(f) == [Problem(Op.ADD, [12, 3])]
 
 f = [
-    "1 ",
-    "23",
-    "+ ",
+    b"1 ",
+    b"23",
+    b"+ ",
 ]
 assert _parse_sheet(f) == [Problem(Op.ADD, [12, 3])]
 
 f = [
-    "1  12",
-    "23  2",
-    "+  * ",
+    b"1  12",
+    b"23  2",
+    b"+  * ",
 ]
 assert _parse_sheet(f) == [Problem(Op.ADD, [12, 3]), Problem(Op.MUL, [1, 22])]
 
+f = [b"12\n", b"3\n", b"*\n"]
+assert _parse_sheet(f) == [Problem(Op.MUL, [13, 2])]
+
+assert _decode_column([b"1 ", b" 2", b"34"], 0) == 13
+assert _decode_column([b"1 ", b" 2", b"34"], 1) == 24
+
 f = [
-    "123 328  51 64 ",
-    " 45 64  387 23 ",
-    "  6 98  215 314",
-    "*   +   *   +  ",
+    b"123 328  51 64 ",
+    b" 45 64  387 23 ",
+    b"  6 98  215 314",
+    b"*   +   *   +  ",
 ]
 assert get_total(_parse_sheet(f)) == 3263827
 
 
-with open("2025/06_trash_compactor/input.txt") as f:
+with open("2025/06_trash_compactor/input.txt", "rb") as f:
     sheet = _parse_sheet(f)
     print(get_total(sheet))
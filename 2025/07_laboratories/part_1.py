@@ -147,12 +147,11 @@ In this example, a tachyon beam is split a total of 21 times.
 Analyze your manifold diagram. How many times will the beam be split?
 """
 
+from collections.abc import Iterable
 from enum import StrEnum
 from textwrap import dedent
 from typing import NamedTuple
 
-type Field = list[list[Cell]]
-
 
 class Cell(StrEnum):
     START = "S"
@@ -160,113 +159,105 @@ class Cell(StrEnum):
     SPLIT = "^"
 
 
-class Pos(NamedTuple):
-    x: int
-    y: int
-
-
-def count_splits(field: Field) -> int:
-    splits = _find_splits(field)
-    res = 0
-
-    for split in splits:
-        if _is_reachable(field, split):
-            res += 1
-
-    return res
-
-
-def _find_splits(field: Field) -> list[Pos]:
-    res = []
-    for x, row in enumerate(field):
-        for y, col in enumerate(row):
-            if col == Cell.SPLIT:
-                res.append(Pos(x, y))
-    return res
-
+class Beams(NamedTuple):
+    splits: int
+    timelines: int
 
-def _is_reachable(field: Field, pos: Pos) -> bool:
-    for x in range(pos.x - 1, -1, -1):
-        left, above, right = Pos(x, pos.y - 1), Pos(x, pos.y), Pos(x, pos.y + 1)
 
-        if _is_start(field, above):
-            return True
+def sweep_beams(rows: Iterable[str]) -> Beams:
+    # beams per column, with a free column on each side of the field
+    counts: list[int] = []
+    splits = 0
 
-        if _is_split(field, above):
-            return False
+    for row in rows:
+        if not counts:
+            counts = [0] * (len(row) + 2)
 
-        if _is_split(field, left) or _is_split(field, right):
-            return True
+        # split beams land in the next row, so a splitter never splits
+        # a beam that its neighbour has just sent sideways
+        next_counts = counts.copy()
 
-    return False
+        for y, cell in enumerate(row, 1):
+            if cell == Cell.START:
+                next_counts[y] += 1
+            elif cell == Cell.SPLIT and counts[y]:
+                splits += 1
+                next_counts[y - 1] += counts[y]
+                next_counts[y + 1] += counts[y]
+                next_counts[y] -= counts[y]
 
+        counts = next_counts
 
-def _is_split(field: Field, pos: Pos) -> bool:
-    try:
-        return field[pos.x][pos.y] == Cell.SPLIT
-    except IndexError:
-        return False
+    return Beams(splits, sum(counts))
 
 
-def _is_start(field: Field, pos: Pos) -> bool:
-    try:
-        return field[pos.x][pos.y] == Cell.START
-    except IndexError:
-        return False
+def count_splits(rows: Iterable[str]) -> int:
+    return sweep_beams(rows).splits
 
 
-def _to_array(s: str) -> Field:
-    return [list(map(Cell, line)) for line in dedent(s).strip().splitlines()]
+def _to_rows(s: str) -> list[str]:
+    return dedent(s).strip().splitlines()
 
 
-field = _to_array(
+field = _to_rows(
     """
     S
     ^
     """,
 )
-assert _is_reachable(field, Pos(1, 0)) is True
+assert count_splits(field) == 1
 
-
-field = _to_array(
+field = _to_rows(
     """
-    .
-    ^
+    .S.
+    ...
+    .^.
+    .^.
     """,
 )
-assert _is_reachable(field, Pos(1, 0)) is False
+assert count_splits(field) == 1
 
-
-field = _to_array(
+field = _to_rows(
     """
-    .^
-    ^.
+    ..S..
+    ..^..
+    .^.^.
     """,
 )
-assert _is_reachable(field, Pos(1, 0)) is True
-
+assert sweep_beams(field) == Beams(3, 4)
 
-field = _to_array(
+field = _to_rows(
     """
-    ^.
-    .^
+    ..S..
+    ..^..
+    .^...
+    ...^.
+    ..^..
     """,
 )
-assert _is_reachable(field, Pos(1, 1)) is True
+assert sweep_beams(field) == Beams(4, 6)
 
+field = _to_rows(
+    """
+    .S..
+    .^^.
+    ....
+    ..^.
+    """,
+)
+assert sweep_beams(field) == Beams(2, 3)
 
-field = _to_array(
+field = _to_rows(
     """
-    ^.
-    .^
-    ..
-    .^
+    ..S..
+    ..^..
+    .^^^.
     """,
 )
-assert _is_reachable(field, Pos(3, 1)) is False
+assert sweep_beams(field) == Beams(3, 4)
 
 
-field = _to_array(
+field = _to_rows(
     """
     .......S.......
     ...............
@@ -290,4 +281,4 @@ assert count_splits(field) == 21
 
 
 with open("2025/07_laboratories/input.txt") as f:
-    print(count_splits(_to_array(f.read())))
+    print(count_splits(line.rstrip("\n") for line in f))
@@ -85,13 +85,11 @@ to your manifold diagram.
 In total, how many different timelines would a single tachyon particle end up on?
 """
 
+from collections.abc import Iterable
 from enum import StrEnum
 from textwrap import dedent
 from typing import NamedTuple
 
-type Field = list[list[Cell]]
-type Cache = dict[Pos, int]
-
 
 class Cell(StrEnum):
     START = "S"
@@ -99,61 +97,47 @@ class Cell(StrEnum):
     SPLIT = "^"
 
 
-class Pos(NamedTuple):
-    x: int
-    y: int
-
-
-def count_timelines(field: Field) -> int:
-    start = _find_start(field)
-    return _count_timelines_for_pos(field, start, {})
-
+class Beams(NamedTuple):
+    splits: int
+    timelines: int
 
-def _count_timelines_for_pos(field: Field, pos: Pos, cache: Cache) -> int:
-    below = Pos(pos.x + 1, pos.y)
 
-    if _is_split(field, below):
-        if below not in cache:
-            left, right = Pos(pos.x + 2, pos.y - 1), Pos(pos.x + 2, pos.y + 1)
-            cache[left] = _count_timelines_for_pos(field, left, cache)
-            cache[right] = _count_timelines_for_pos(field, right, cache)
-            cache[below] = cache[left] + cache[right]
+def sweep_beams(rows: Iterable[str]) -> Beams:
+    # beams per column, with a free column on each side of the field
+    counts: list[int] = []
+    splits = 0
 
-        return cache[below]
+    for row in rows:
+        if not counts:
+            counts = [0] * (len(row) + 2)
 
-    if _is_space(field, below):
-        return _count_timelines_for_pos(field, below, cache)
+        # split beams land in the next row, so a splitter never splits
+        # a beam that its neighbour has just sent sideways
+        next_counts = counts.copy()
 
-    return 1
+        for y, cell in enumerate(row, 1):
+            if cell == Cell.START:
+                next_counts[y] += 1
+            elif cell == Cell.SPLIT and counts[y]:
+                splits += 1
+                next_counts[y - 1] += counts[y]
+                next_counts[y + 1] += counts[y]
+                next_counts[y] -= counts[y]
 
+        counts = next_counts
 
-def _find_start(field: Field) -> Pos:
-    for x, row in enumerate(field):
-        for y, col in enumerate(row):
-            if col == Cell.START:
-                return Pos(x, y)
-    raise ValueError
+    return Beams(splits, sum(counts))
 
 
-def _is_split(field: Field, pos: Pos) -> bool:
-    try:
-        return field[pos.x][pos.y] == Cell.SPLIT
-    except IndexError:
-        return False
+def count_timelines(rows: Iterable[str]) -> int:
+    return sweep_beams(rows).timelines
 
 
-def _is_space(field: Field, pos: Pos) -> bool:
-    try:
-        return field[pos.x][pos.y] == Cell.SPACE
-    except IndexError:
-        return False
+def _to_rows(s: str) -> list[str]:
+    return dedent(s).strip().splitlines()
 
 
-def _to_array(s: str) -> Field:
-    return [list(map(Cell, line)) for line in dedent(s).strip().splitlines()]
-
-
-field = _to_array(
+field = _to_rows(
     """
     .S.
     .^.
@@ -162,7 +146,7 @@ field = _to_array(
 )
 assert count_timelines(field) == 2
 
-field = _to_array(
+field = _to_rows(
     """
     ..S..
     .....
@@ -174,8 +158,27 @@ field = _to_array(
 )
 assert count_timelines(field) == 4
 
+field = _to_rows(
+    """
+    .S..
+    .^^.
+    ....
+    ..^.
+    """,
+)
+assert sweep_beams(field) == Beams(2, 3)
+
+field = _to_rows(
+    """
+    ..S..
+    ..^..
+    .^^^.
+    """,
+)
+assert sweep_beams(field) == Beams(3, 4)
+
 
-field = _to_array(
+field = _to_rows(
     """
     .......S.......
     ...............
@@ -199,4 +202,4 @@ assert count_timelines(field) == 40
 
 
 with open("2025/07_laboratories/input.txt") as f:
-    print(count_timelines(_to_array(f.read())))
+    print(count_timelines(line.rstrip("\n") for line in f))
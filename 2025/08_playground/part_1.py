@@ -89,16 +89,19 @@ Afterward, what do you get
 if you multiply together the sizes of the three largest circuits?
 """
 
-from collections.abc import Iterable
+from array import array
+from collections.abc import Iterator
 from functools import reduce
+from heapq import heappop, heappush, nlargest
 from itertools import combinations, islice
 from operator import mul
 from typing import NamedTuple
 
 from parse import parse
 
-type Pair = tuple[Box, Box]
-type Circuit = set
+type Pair = tuple[int, int]
+
+LEAF_SIZE = 8
 
 
 class Box(NamedTuple):
@@ -107,37 +110,149 @@ class Box(NamedTuple):
     z: int
 
 
-def connect(boxes: list[Box], junctions: int):
-    pairs = _sort_by_distance(boxes)
-    circuits = [{box} for box in boxes]
+class Node(NamedTuple):
+    # bounding box of a k-d tree node, leaves list their boxes
+    lo: Box
+    hi: Box
+    items: list[int]
+    left: int
+    right: int
+
+
+class KdTree(NamedTuple):
+    # children come before their parents, so the root is the last node
+    boxes: list[Box]
+    nodes: list[Node]
+
+
+class Circuits(NamedTuple):
+    parents: array[int]
+    sizes: array[int]
+
+
+def connect(boxes: list[Box], junctions: int) -> int:
+    circuits = _to_circuits(len(boxes))
+
+    for i, j in islice(_iter_pairs(boxes), junctions):
+        _join(circuits, i, j)
+
+    roots = (i for i, parent in enumerate(circuits.parents) if i == parent)
+    largest = nlargest(3, (circuits.sizes[i] for i in roots))
+    return reduce(mul, largest, 1)
+
+
+def _iter_pairs(boxes: list[Box]) -> Iterator[Pair]:
+    # merges the neighbour streams of every box, each pair comes from both
+    # of its boxes and is only kept when reached from the lower one
+    tree = _build_tree(boxes)
+    streams = [_iter_neighbours(tree, i) for i in range(len(boxes))]
+    heap = []
+
+    for i, stream in enumerate(streams):
+        _push_next(heap, stream, i)
+
+    while heap:
+        _, first, second, i = heappop(heap)
+        if i == first:
+            yield first, second
+        _push_next(heap, streams[i], i)
+
+
+def _push_next(
+    heap: list[tuple[int, int, int, int]],
+    stream: Iterator[tuple[int, int]],
+    i: int,
+) -> None:
+    neighbour = next(stream, None)
+    if neighbour is not None:
+        distance, j = neighbour
+        heappush(heap, (distance, min(i, j), max(i, j), i))
 
-    for box_1, box_2 in islice(pairs, junctions):
-        circuit_1 = _pop_circuit(circuits, box_1)
-        circuit_2 = _pop_circuit(circuits, box_2) if box_2 not in circuit_1 else set()
-        circuits.append(circuit_1 | circuit_2)
 
-    largest = sorted(map(len, circuits), reverse=True)
-    return reduce(mul, islice(largest, 3), 1)
+def _iter_neighbours(tree: KdTree, i: int) -> Iterator[tuple[int, int]]:
+    # best-first search: a node comes out of the heap before any box
+    # at the same distance, so boxes come out ordered by distance and index
+    boxes, nodes = tree
+    box = boxes[i]
+    heap = [(0, 0, len(nodes) - 1)]
 
+    while heap:
+        distance, is_box, ref = heappop(heap)
 
-def _pop_circuit(circuits: list[Circuit], box: Box) -> Circuit:
-    for i, circuit in enumerate(circuits):
-        if box in circuit:
-            return circuits.pop(i)
+        if is_box:
+            yield distance, ref
+            continue
 
-    raise ValueError(box)
+        node = nodes[ref]
+        if node.left < 0:
+            for j in node.items:
+                if j != i:
+                    heappush(heap, (_get_distance(box, boxes[j]), 1, j))
+        else:
+            for child in (node.left, node.right):
+                heappush(heap, (_get_node_distance(box, nodes[child]), 0, child))
 
 
-def _sort_by_distance(boxes: list[Box]) -> Iterable[Pair]:
-    distances = ((_get_distance(*pair), pair) for pair in combinations(boxes, 2))
-    for _, pair in sorted(distances):
-        yield pair
+def _build_tree(boxes: list[Box]) -> KdTree:
+    nodes: list[Node] = []
+
+    def build(items: list[int]) -> int:
+        lo = Box(*(min(boxes[i][axis] for i in items) for axis in range(3)))
+        hi = Box(*(max(boxes[i][axis] for i in items) for axis in range(3)))
+
+        if len(items) <= LEAF_SIZE:
+            nodes.append(Node(lo, hi, items, -1, -1))
+        else:
+            axis = max(range(3), key=lambda axis: hi[axis] - lo[axis])
+            items.sort(key=lambda i: boxes[i][axis])
+            middle = len(items) // 2
+            left, right = build(items[:middle]), build(items[middle:])
+            nodes.append(Node(lo, hi, [], left, right))
+
+        return len(nodes) - 1
+
+    build(list(range(len(boxes))))
+    return KdTree(boxes, nodes)
+
+
+def _get_node_distance(box: Box, node: Node) -> int:
+    res = 0
+    for coord, lo, hi in zip(box, node.lo, node.hi):
+        if coord < lo:
+            res += (lo - coord) ** 2
+        elif coord > hi:
+            res += (coord - hi) ** 2
+    return res
 
 
 def _get_distance(p1: Box, p2: Box) -> int:
     return (p1.x - p2.x) ** 2 + (p1.y - p2.y) ** 2 + (p1.z - p2.z) ** 2
 
 
+def _to_circuits(n: int) -> Circuits:
+    return Circuits(array("l", range(n)), array("l", [1]) * n)
+
+
+def _find(circuits: Circuits, i: int) -> int:
+    parents = circuits.parents
+    while parents[i] != i:
+        parents[i] = parents[parents[i]]
+        i = parents[i]
+    return i
+
+
+def _join(circuits: Circuits, i: int, j: int) -> bool:
+    i, j = _find(circuits, i), _find(circuits, j)
+    if i == j:
+        return False
+
+    if circuits.sizes[i] < circuits.sizes[j]:
+        i, j = j, i
+    circuits.parents[j] = i
+    circuits.sizes[i] += circuits.sizes[j]
+    return True
+
+
 boxes = [
     Box(162, 817, 812),
     Box(57, 618, 57),
@@ -164,6 +279,14 @@ assert connect(boxes, 1) == 2
 assert connect(boxes, 2) == 3
 assert connect(boxes, 10) == 40
 
+assert list(_iter_pairs(boxes)) == [
+    (i, j)
+    for _, i, j in sorted(
+        (_get_distance(boxes[i], boxes[j]), i, j)
+        for i, j in combinations(range(len(boxes)), 2)
+    )
+]
+
 with open("2025/08_playground/input.txt") as f:
     boxes = [Box(*parse("{:d},{:d},{:d}", line.strip()).fixed) for line in f]
     print(connect(boxes, 1000))
@@ -16,13 +16,15 @@ What do you get if you multiply together
 the X coordinates of the last two junction boxes you need to connect?
 """
 
-from collections.abc import Iterable
-from itertools import combinations
+from array import array
+from math import inf
 from typing import NamedTuple
 
 from parse import parse
 
-type Pair = tuple[Box, Box]
+type Edge = tuple[float, int, int]
+
+LEAF_SIZE = 8
 
 
 class Box(NamedTuple):
@@ -31,34 +33,177 @@ class Box(NamedTuple):
     z: int
 
 
-def connect(boxes: list[Box]):
-    pairs = _sort_by_distance(boxes)
-    map_box_to_circuit = {box: {box} for box in boxes}
+class Node(NamedTuple):
+    # bounding box of a k-d tree node, leaves list their boxes
+    lo: Box
+    hi: Box
+    items: list[int]
+    left: int
+    right: int
+
+
+class KdTree(NamedTuple):
+    # children come before their parents, so the root is the last node
+    boxes: list[Box]
+    nodes: list[Node]
+
+
+class Circuits(NamedTuple):
+    parents: array[int]
+    sizes: array[int]
+
+
+def connect(boxes: list[Box]) -> int:
+    # the last join of Kruskal's algorithm is the longest edge of the spanning
+    # tree, which Boruvka's algorithm builds from nearest-neighbour queries
+    # over the k-d tree, skipping nodes that lie within the query's circuit
+    tree = _build_tree(boxes)
+    circuits = _to_circuits(len(boxes))
+    left = len(boxes) - 1
+    last: Edge = (-1, 0, 0)
+
+    # boxes outside a circuit only get fewer, so the nearest one found for a box
+    # stays the nearest until it joins the box's circuit
+    own: list[Edge | None] = [None] * len(boxes)
+
+    while left:
+        roots = [_find(circuits, i) for i in range(len(boxes))]
+        labels = _label_nodes(tree.nodes, roots)
+        nearest: dict[int, Edge] = {}
+
+        for i, root in enumerate(roots):
+            best = nearest.get(root, (inf, 0, 0))
+            edge = own[i]
+
+            if edge is None or roots[edge[1]] == roots[edge[2]]:
+                edge = _find_nearest_outside(tree, labels, roots, i, best)
+                own[i] = edge if i in edge[1:] else None
+
+            nearest[root] = min(best, edge)
+
+        for edge in nearest.values():
+            if _join(circuits, edge[1], edge[2]):
+                left -= 1
+                last = max(last, edge)
+
+    distance, i, j = last
+    if distance < 0:
+        raise ValueError(boxes)
+
+    return boxes[i].x * boxes[j].x
+
 
-    for box_1, box_2 in pairs:
-        circuit_1 = map_box_to_circuit[box_1]
-        circuit_2 = map_box_to_circuit[box_2]
+def _label_nodes(nodes: list[Node], roots: list[int]) -> list[int]:
+    # the circuit of all boxes below a node, or -1 if they are in several
+    labels = []
 
-        joined_circuit = circuit_1 | circuit_2
-        if len(joined_circuit) == len(boxes):
-            break
+    for node in nodes:
+        if node.left < 0:
+            circuits = {roots[i] for i in node.items}
+            labels.append(circuits.pop() if len(circuits) == 1 else -1)
+        elif labels[node.left] == labels[node.right]:
+            labels.append(labels[node.left])
+        else:
+            labels.append(-1)
 
-        for box in joined_circuit:
-            map_box_to_circuit[box] = joined_circuit
+    return labels
 
-    return box_1.x * box_2.x
 
+def _find_nearest_outside(
+    tree: KdTree,
+    labels: list[int],
+    roots: list[int],
+    i: int,
+    best: Edge,
+) -> Edge:
+    # only edges shorter than the best one of the circuit so far matter
+    boxes, nodes = tree
+    box, root = boxes[i], roots[i]
+    stack = [(0, len(nodes) - 1)]
 
-def _sort_by_distance(boxes: list[Box]) -> Iterable[Pair]:
-    distances = ((_get_distance(*pair), pair) for pair in combinations(boxes, 2))
-    for _, pair in sorted(distances):
-        yield pair
+    while stack:
+        distance, ref = stack.pop()
+        if distance > best[0]:
+            continue
+
+        node = nodes[ref]
+        if node.left < 0:
+            for j in node.items:
+                if roots[j] != root:
+                    edge = (_get_distance(box, boxes[j]), min(i, j), max(i, j))
+                    best = min(best, edge)
+            continue
+
+        children = [
+            (_get_node_distance(box, nodes[child]), child)
+            for child in (node.left, node.right)
+            if labels[child] != root
+        ]
+        stack.extend(sorted(children, reverse=True))
+
+    return best
+
+
+def _build_tree(boxes: list[Box]) -> KdTree:
+    nodes: list[Node] = []
+
+    def build(items: list[int]) -> int:
+        lo = Box(*(min(boxes[i][axis] for i in items) for axis in range(3)))
+        hi = Box(*(max(boxes[i][axis] for i in items) for axis in range(3)))
+
+        if len(items) <= LEAF_SIZE:
+            nodes.append(Node(lo, hi, items, -1, -1))
+        else:
+            axis = max(range(3), key=lambda axis: hi[axis] - lo[axis])
+            items.sort(key=lambda i: boxes[i][axis])
+            middle = len(items) // 2
+            left, right = build(items[:middle]), build(items[middle:])
+            nodes.append(Node(lo, hi, [], left, right))
+
+        return len(nodes) - 1
+
+    build(list(range(len(boxes))))
+    return KdTree(boxes, nodes)
+
+
+def _get_node_distance(box: Box, node: Node) -> int:
+    res = 0
+    for coord, lo, hi in zip(box, node.lo, node.hi):
+        if coord < lo:
+            res += (lo - coord) ** 2
+        elif coord > hi:
+            res += (coord - hi) ** 2
+    return res
 
 
 def _get_distance(p1: Box, p2: Box) -> int:
     return (p1.x - p2.x) ** 2 + (p1.y - p2.y) ** 2 + (p1.z - p2.z) ** 2
 
 
+def _to_circuits(n: int) -> Circuits:
+    return Circuits(array("l", range(n)), array("l", [1]) * n)
+
+
+def _find(circuits: Circuits, i: int) -> int:
+    parents = circuits.parents
+    while parents[i] != i:
+        parents[i] = parents[parents[i]]
+        i = parents[i]
+    return i
+
+
+def _join(circuits: Circuits, i: int, j: int) -> bool:
+    i, j = _find(circuits, i), _find(circuits, j)
+    if i == j:
+        return False
+
+    if circuits.sizes[i] < circuits.sizes[j]:
+        i, j = j, i
+    circuits.parents[j] = i
+    circuits.sizes[i] += circuits.sizes[j]
+    return True
+
+
 boxes = [
     Box(162, 817, 812),
     Box(57, 618, 57),
@@ -82,6 +227,10 @@ boxes = [
     Box(425, 690, 689),
 ]
 assert connect(boxes) == 25272
+assert connect(boxes[:2]) == 162 * 57
+assert connect(
+    [Box(0, 0, 0), Box(1, 0, 0), Box(10**7, 0, 0), Box(10**7 + 1, 0, 0)]
+) == (1 * 10**7)
 
 with open("2025/08_playground/input.txt") as f:
     boxes = [Box(*parse("{:d},{:d},{:d}", line.strip()).fixed) for line in f]
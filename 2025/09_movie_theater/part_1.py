@@ -90,7 +90,7 @@ Using two red tiles as opposite corners,
 what is the largest area of any rectangle you can make?
 """
 
-from itertools import combinations
+from itertools import chain, combinations, product
 from typing import NamedTuple
 
 
@@ -99,13 +99,31 @@ class Tile(NamedTuple):
     y: int
 
 
-def find_biggest_rectangle(tiles: list[Tile]):
-    max_area = 0
+def find_biggest_rectangle(tiles: list[Tile]) -> int:
+    # a tile with another one beyond it in both directions of a diagonal
+    # can be swapped for it, so only the staircases at the corners are paired
+    lower_left = _get_staircase(tiles, 1, 1)
+    upper_right = _get_staircase(tiles, -1, -1)
+    lower_right = _get_staircase(tiles, -1, 1)
+    upper_left = _get_staircase(tiles, 1, -1)
 
-    for comb in combinations(tiles, 2):
-        max_area = max(max_area, _get_area(*comb))
+    pairs = chain(
+        product(lower_left, upper_right),
+        product(lower_right, upper_left),
+    )
+    return max((_get_area(*pair) for pair in pairs), default=0)
 
-    return max_area
+
+def _get_staircase(tiles: list[Tile], dx: int, dy: int) -> list[Tile]:
+    res = []
+    lowest = None
+
+    for tile in sorted(tiles, key=lambda t: (dx * t.x, dy * t.y)):
+        if lowest is None or dy * tile.y < lowest:
+            res.append(tile)
+            lowest = dy * tile.y
+
+    return res
 
 
 def _get_area(tile_1: Tile, tile_2: Tile) -> int:
@@ -133,7 +151,15 @@ tiles = [
     Tile(2, 3),
     Tile(7, 3),
 ]
+assert _get_staircase(tiles, 1, 1) == [Tile(2, 3), Tile(7, 1)]
+assert _get_staircase(tiles, -1, -1) == [Tile(11, 7)]
 assert find_biggest_rectangle(tiles) == 50
+assert find_biggest_rectangle([Tile(1, 1)]) == 1
+
+tiles = [Tile(x, (x * 7919) % 101) for x in range(100)]
+assert find_biggest_rectangle(tiles) == max(
+    _get_area(*pair) for pair in combinations(tiles, 2)
+)
 
 
 with open("2025/09_movie_theater/input.txt") as f:
@@ -0,0 +1,215 @@
+"""
+The Elves just remembered: they can only switch out tiles that are red or green.
+So, your rectangle can only include red or green tiles.
+
+In your list, every red tile is connected to the red tile before and after it
+by a straight line of green tiles.
+The list wraps, so the first red tile is also connected to the last red tile.
+Tiles that are adjacent in your list will always be on either the same row
+or the same column.
+
+Using the same example as before, the tiles marked X would be green:
+
+..............
+.......#XXX#..
+.......X...X..
+..#XXXX#...X..
+..X........X..
+..#XXXXXX#.X..
+.........X.X..
+.........#X#..
+..............
+
+In addition, all of the tiles inside this loop of red and green tiles
+are also green. So, in this example, these are the green tiles:
+
+..............
+.......#XXX#..
+.......XXXXX..
+..#XXXX#XXXX..
+..XXXXXXXXXX..
+..#XXXXXX#XX..
+.........XXX..
+.........#X#..
+..............
+
+The remaining tiles are never red nor green.
+
+The rectangle you choose still must have red tiles in opposite corners,
+but any other tiles it includes must now be red or green.
+This significantly limits your options.
+
+For example, you could make a rectangle out of red and green tiles
+with an area of 15 between 7,3 and 11,1:
+
+..............
+.......OOOOO..
+.......OOOOO..
+..#XXXXOOOOO..
+..XXXXXXXXXX..
+..#XXXXXX#XX..
+.........XXX..
+.........#X#..
+..............
+
+Or, you could make a thin rectangle with an area of 3 between 9,7 and 9,5:
+
+..............
+.......#XXX#..
+.......XXXXX..
+..#XXXX#XXXX..
+..XXXXXXXXXX..
+..#XXXXXXOXX..
+.........OXX..
+.........OX#..
+..............
+
+The largest rectangle you can make in this example using only red and green tiles
+has area 24. One way to do this is between 9,5 and 2,3:
+
+..............
+.......#XXX#..
+.......XXXXX..
+..OOOOOOOOXX..
+..OOOOOOOOXX..
+..OOOOOOOOXX..
+.........XXX..
+.........#X#..
+..............
+
+Using two red tiles as opposite corners, what is the largest area of any rectangle
+you can make using only red and green tiles?
+"""
+
+from array import array
+from itertools import combinations
+from typing import NamedTuple
+
+FREE = 0
+BORDER = 1
+OUTSIDE = 2
+
+
+class Tile(NamedTuple):
+    x: int
+    y: int
+
+
+class Floor(NamedTuple):
+    # compressed grid where odd indices stand for coordinates of red tiles
+    # and even ones for the gaps between them,
+    # with prefix sums of red and green cells over it
+    xs: dict[int, int]
+    ys: dict[int, int]
+    counts: array[int]
+    width: int
+
+
+def find_biggest_rectangle(tiles: list[Tile]) -> int:
+    # every pair of tiles is still a candidate and the compressed floor
+    # has (2n + 1)^2 cells, so this stays quadratic in the number of tiles
+    floor = _to_floor(tiles)
+    res = 0
+
+    for tile_1, tile_2 in combinations(tiles, 2):
+        area = _get_area(tile_1, tile_2)
+        if area > res and _is_inside(floor, tile_1, tile_2):
+            res = area
+
+    return res
+
+
+def _is_inside(floor: Floor, tile_1: Tile, tile_2: Tile) -> bool:
+    x1, x2 = sorted((floor.xs[tile_1.x], floor.xs[tile_2.x]))
+    y1, y2 = sorted((floor.ys[tile_1.y], floor.ys[tile_2.y]))
+
+    stride, counts = floor.width + 1, floor.counts
+    inside = (
+        counts[(y2 + 1) * stride + x2 + 1]
+        - counts[y1 * stride + x2 + 1]
+        - counts[(y2 + 1) * stride + x1]
+        + counts[y1 * stride + x1]
+    )
+    return inside == (x2 - x1 + 1) * (y2 - y1 + 1)
+
+
+def _to_floor(tiles: list[Tile]) -> Floor:
+    xs = {x: 2 * i + 1 for i, x in enumerate(sorted({tile.x for tile in tiles}))}
+    ys = {y: 2 * i + 1 for i, y in enumerate(sorted({tile.y for tile in tiles}))}
+    width, height = 2 * len(xs) + 1, 2 * len(ys) + 1
+    cells = bytearray(width * height)
+
+    for tile_1, tile_2 in zip(tiles, tiles[1:] + tiles[:1]):
+        x1, x2 = sorted((xs[tile_1.x], xs[tile_2.x]))
+        y1, y2 = sorted((ys[tile_1.y], ys[tile_2.y]))
+        for y in range(y1, y2 + 1):
+            cells[y * width + x1 : y * width + x2 + 1] = bytes([BORDER]) * (x2 - x1 + 1)
+
+    _fill_outside(cells, width)
+
+    stride = width + 1
+    counts = array("l", [0]) * (stride * (height + 1))
+    for y in range(height):
+        row_sum = 0
+        for x in range(width):
+            row_sum += cells[y * width + x] != OUTSIDE
+            counts[(y + 1) * stride + x + 1] = counts[y * stride + x + 1] + row_sum
+
+    return Floor(xs, ys, counts, width)
+
+
+def _fill_outside(cells: bytearray, width: int) -> None:
+    # the first cell is a gap before the first column, so it is always outside
+    cells[0] = OUTSIDE
+    stack = [0]
+
+    while stack:
+        idx = stack.pop()
+        x = idx % width
+
+        neighbors = (
+            idx - 1 if x > 0 else -1,
+            idx + 1 if x < width - 1 else -1,
+            idx - width,
+            idx + width,
+        )
+        for n in neighbors:
+            if 0 <= n < len(cells) and cells[n] == FREE:
+                cells[n] = OUTSIDE
+                stack.append(n)
+
+
+def _get_area(tile_1: Tile, tile_2: Tile) -> int:
+    dx = abs(tile_1.x - tile_2.x) + 1
+    dy = abs(tile_1.y - tile_2.y) + 1
+    return dx * dy
+
+
+def _parse_tile(raw_tile: str) -> Tile:
+    return Tile(*map(int, raw_tile.split(",")))
+
+
+tiles = [
+    Tile(7, 1),
+    Tile(11, 1),
+    Tile(11, 7),
+    Tile(9, 7),
+    Tile(9, 5),
+    Tile(2, 5),
+    Tile(2, 3),
+    Tile(7, 3),
+]
+floor = _to_floor(tiles)
+assert floor.xs == {2: 1, 7: 3, 9: 5, 11: 7}
+assert floor.ys == {1: 1, 3: 3, 5: 5, 7: 7}
+assert _is_inside(floor, Tile(7, 3), Tile(11, 1)) is True
+assert _is_inside(floor, Tile(9, 7), Tile(9, 5)) is True
+assert _is_inside(floor, Tile(9, 5), Tile(2, 3)) is True
+assert _is_inside(floor, Tile(2, 5), Tile(11, 1)) is False
+assert _is_inside(floor, Tile(2, 3), Tile(7, 1)) is False
+assert find_biggest_rectangle(tiles) == 24
+
+
+with open("2025/09_movie_theater/input.txt") as f:
+    tiles = [_parse_tile(line.strip()) for line in f]
+    print(find_biggest_rectangle(tiles))
@@ -89,34 +89,97 @@ What is the fewest button presses required to correctly configure the indicator
 on all of the machines?
 """
 
-from itertools import permutations
+from collections.abc import Iterator
+from typing import NamedTuple
 
 type State = int
 type Button = int
 
 
-def find_buttons(raw_input: str) -> list[Button]:
+class System(NamedTuple):
+    # buttons reduced over GF(2), one row per pivot button:
+    # it is pressed if the free buttons in its row and the target lights
+    # in its combination toggle an odd number of times
+    pivots: list[tuple[int, int, int]]
+    free: int
+    checks: list[int]
+
+
+def find_buttons(raw_input: str) -> tuple[Button, ...]:
     raw_target, *raw_buttons, _ = raw_input.split(" ")
 
     target = _parse_target(raw_target)
     buttons = list(map(_parse_button, raw_buttons))
+    system = _eliminate(buttons, len(raw_target) - 2)
 
-    for r in range(len(buttons)):
-        for pressed_buttons in permutations(buttons, r):
-            state = _press_buttons(pressed_buttons)
-            if state == target:
-                return pressed_buttons
+    presses = min(
+        _iter_solutions(system, target),
+        key=lambda presses: (presses.bit_count(), _get_pressed(presses)),
+        default=None,
+    )
+    if presses is None:
+        raise ValueError(target)
 
-    raise ValueError(target)
+    return tuple(buttons[i] for i in _get_pressed(presses))
 
 
-def _press_buttons(buttons: list[Button]) -> State:
-    state = 0
+def _get_pressed(presses: int) -> list[int]:
+    return [i for i in range(presses.bit_length()) if presses >> i & 1]
 
-    for button in buttons:
-        state ^= button
 
-    return state
+def _eliminate(buttons: list[Button], size: int) -> System:
+    pivots: dict[int, tuple[int, int]] = {}
+    checks = []
+
+    for light in range(size):
+        row = sum(1 << i for i, button in enumerate(buttons) if button >> light & 1)
+        combo = 1 << light
+
+        for col, (pivot_row, pivot_combo) in pivots.items():
+            if row >> col & 1:
+                row ^= pivot_row
+                combo ^= pivot_combo
+
+        if not row:
+            checks.append(combo)
+            continue
+
+        col = (row & -row).bit_length() - 1
+        for other, (pivot_row, pivot_combo) in pivots.items():
+            if pivot_row >> col & 1:
+                pivots[other] = (pivot_row ^ row, pivot_combo ^ combo)
+        pivots[col] = (row, combo)
+
+    free = (1 << len(buttons)) - 1
+    for col in pivots:
+        free &= ~(1 << col)
+
+    return System(
+        [(col, row & free, combo) for col, (row, combo) in pivots.items()],
+        free,
+        checks,
+    )
+
+
+def _iter_solutions(system: System, target: State) -> Iterator[int]:
+    if any(_parity(combo & target) for combo in system.checks):
+        return
+
+    free_presses = system.free
+    while True:
+        presses = free_presses
+        for col, row, combo in system.pivots:
+            if _parity(row & free_presses) != _parity(combo & target):
+                presses |= 1 << col
+        yield presses
+
+        if not free_presses:
+            return
+        free_presses = (free_presses - 1) & system.free
+
+
+def _parity(n: int) -> int:
+    return n.bit_count() & 1
 
 
 def _parse_target(raw_target: str) -> State:
@@ -143,6 +206,12 @@ assert _parse_target("[...#.]") == 8
 assert _parse_button("(0,1)") == 3
 assert _parse_button("(0,2,3,4)") == 29
 
+system = _eliminate([0b0011, 0b0110, 0b0101], 4)
+assert system.free == 0b100
+assert sorted(_iter_solutions(system, 0b0101)) == [0b011, 0b100]
+assert list(_iter_solutions(system, 0b1000)) == []
+assert _get_pressed(0b1011) == [0, 1, 3]
+
 machine = "[.##.] (3) (1,3) (2) (2,3) (0,2) (0,1) {3,5,4,7}"
 assert find_buttons(machine) == (10, 12)
 
@@ -0,0 +1,224 @@
+"""
+All of the machines are starting to come online!
+Now, it's time to worry about the joltage requirements.
+
+Each machine needs to be configured to exactly the specified joltage levels
+to function properly. Below the buttons on each machine is a big lever
+that you can use to switch the buttons from configuring indicator lights
+to increasing joltage levels. (Ignore the indicator light diagrams.)
+
+The machines each have a set of numeric counters tracking its joltage levels,
+one counter per joltage requirement. The counters are all initially set to zero.
+
+So, joltage requirements like {3,5,4,7} mean
+that the machine has four counters which are initially 0
+and that the goal is to simultaneously configure the first counter to be 3,
+the second counter to be 5, the third to be 4, and the fourth to be 7.
+
+The button wiring schematics are still relevant:
+in this new joltage configuration mode,
+each button now indicates which counters it affects,
+where 0 means the first counter, 1 means the second counter, and so on.
+When you push a button, each listed counter is increased by 1.
+
+So, a button wiring schematic like (1,3) means that each time you push that button,
+the second and fourth counters would each increase by 1.
+If the current joltage levels were {0,1,2,3},
+pushing the button would change them to be {0,2,2,4}.
+
+You can push each button as many times as you like.
+However, your finger is getting sore from all of the button pushing,
+and so you will need to determine the fewest total presses required
+to correctly configure each machine's joltage level counters
+to match the specified joltage requirements.
+
+Configuring the first machine's counters requires a minimum of 10 button presses.
+One way to do this is by pressing (3) once, (1,3) three times, (2,3) three times,
+(0,2) once, and (0,1) twice.
+
+Configuring the second machine's counters requires a minimum of 12 button presses.
+One way to do this is by pressing (0,2,3,4) twice, (2,3) five times,
+and (0,1,2) five times.
+
+Configuring the third machine's counters requires a minimum of 11 button presses.
+One way to do this is by pressing (0,1,2,3,4) five times, (0,1,2,4,5) five times,
+and (1,2) once.
+
+So, the fewest button presses required to correctly configure
+the joltage level counters on all of the machines is 10 + 12 + 11 = 33.
+
+Analyze each machine's joltage requirements and button wiring schematics.
+What is the fewest button presses required to correctly configure
+the joltage level counters on all of the machines?
+"""
+
+from collections.abc import Iterator
+from math import inf
+from typing import NamedTuple
+
+type State = int
+type Button = int
+type Joltage = tuple[int, ...]
+type Cache = dict[Joltage, float]
+
+
+class System(NamedTuple):
+    # buttons reduced over GF(2), one row per pivot button:
+    # it is pressed if the free buttons in its row and the target lights
+    # in its combination toggle an odd number of times
+    pivots: list[tuple[int, int, int]]
+    free: int
+    checks: list[int]
+
+
+class Machine(NamedTuple):
+    buttons: list[Joltage]
+    system: System
+
+
+def count_presses(raw_input: str) -> int:
+    _, *raw_buttons, raw_joltage = raw_input.split(" ")
+
+    joltage = _parse_joltage(raw_joltage)
+    buttons = list(map(_parse_button, raw_buttons))
+    machine = Machine(
+        [_to_increments(button, len(joltage)) for button in buttons],
+        _eliminate(buttons, len(joltage)),
+    )
+
+    res = _count_presses(machine, joltage, {})
+    if res == inf:
+        raise ValueError(raw_input)
+
+    return int(res)
+
+
+def _count_presses(machine: Machine, joltage: Joltage, cache: Cache) -> float:
+    # the buttons pressed an odd number of times must fix the parity of every
+    # counter, what is left is pressed twice as often as for half the joltage
+    if not any(joltage):
+        return 0
+
+    if joltage in cache:
+        return cache[joltage]
+
+    res = inf
+
+    for presses in _iter_solutions(machine.system, _to_parity(joltage)):
+        count = presses.bit_count()
+        if count >= res:
+            continue
+
+        rest = list(joltage)
+        for i, increments in enumerate(machine.buttons):
+            if presses >> i & 1:
+                for counter, increment in enumerate(increments):
+                    rest[counter] -= increment
+
+        if min(rest) >= 0:
+            half = tuple(level // 2 for level in rest)
+            res = min(res, count + 2 * _count_presses(machine, half, cache))
+
+    cache[joltage] = res
+    return res
+
+
+def _eliminate(buttons: list[Button], size: int) -> System:
+    pivots: dict[int, tuple[int, int]] = {}
+    checks = []
+
+    for light in range(size):
+        row = sum(1 << i for i, button in enumerate(buttons) if button >> light & 1)
+        combo = 1 << light
+
+        for col, (pivot_row, pivot_combo) in pivots.items():
+            if row >> col & 1:
+                row ^= pivot_row
+                combo ^= pivot_combo
+
+        if not row:
+            checks.append(combo)
+            continue
+
+        col = (row & -row).bit_length() - 1
+        for other, (pivot_row, pivot_combo) in pivots.items():
+            if pivot_row >> col & 1:
+                pivots[other] = (pivot_row ^ row, pivot_combo ^ combo)
+        pivots[col] = (row, combo)
+
+    free = (1 << len(buttons)) - 1
+    for col in pivots:
+        free &= ~(1 << col)
+
+    return System(
+        [(col, row & free, combo) for col, (row, combo) in pivots.items()],
+        free,
+        checks,
+    )
+
+
+def _iter_solutions(system: System, target: State) -> Iterator[int]:
+    if any(_parity(combo & target) for combo in system.checks):
+        return
+
+    free_presses = system.free
+    while True:
+        presses = free_presses
+        for col, row, combo in system.pivots:
+            if _parity(row & free_presses) != _parity(combo & target):
+                presses |= 1 << col
+        yield presses
+
+        if not free_presses:
+            return
+        free_presses = (free_presses - 1) & system.free
+
+
+def _parity(n: int) -> int:
+    return n.bit_count() & 1
+
+
+def _to_parity(joltage: Joltage) -> State:
+    return sum(1 << i for i, level in enumerate(joltage) if level % 2)
+
+
+def _to_increments(button: Button, size: int) -> Joltage:
+    return tuple(button >> i & 1 for i in range(size))
+
+
+def _parse_joltage(raw_joltage: str) -> Joltage:
+    return tuple(map(int, raw_joltage.strip("{}").split(",")))
+
+
+def _parse_button(raw_button: str) -> Button:
+    btn = 0
+
+    for i in raw_button.strip("()").split(","):
+        btn |= 1 << int(i)
+
+    return btn
+
+
+assert _parse_joltage("{3,5,4,7}") == (3, 5, 4, 7)
+assert _to_parity((3, 5, 4, 7)) == 0b1011
+assert _to_increments(0b1010, 4) == (0, 1, 0, 1)
+
+machine = "[.##.] (3) (1,3) (2) (2,3) (0,2) (0,1) {3,5,4,7}"
+assert count_presses(machine) == 10
+
+machine = "[...#.] (0,2,3,4) (2,3) (0,4) (0,1,2) (1,2,3,4) {7,5,12,7,2}"
+assert count_presses(machine) == 12
+
+machine = "[.###.#] (0,1,2,3,4) (0,3,4) (0,1,2,4,5) (1,2) {10,11,11,5,10,5}"
+assert count_presses(machine) == 11
+
+machine = "[#.] (0) (0,1) {4,3}"
+assert count_presses(machine) == 4
+
+
+with open("2025/10_factory/input.txt") as f:
+    presses = 0
+    for line in f:
+        presses += count_presses(line.strip())
+
+    print(presses)
@@ -61,43 +61,114 @@ In total, there are 5 different paths leading from you to out.
 How many different paths lead from you to out?
 """
 
-from collections import defaultdict, deque
+from array import array
+from collections.abc import Iterable
+from typing import NamedTuple
 
-type Path = list[Device]
 type Device = str
 
 START, END = "you", "out"
 
 
-def find_paths(raw_devices: list[str]) -> set[Path]:
-    devices_map = _parse_devices(raw_devices)
-    res = set()
+class DeviceGraph(NamedTuple):
+    names: list[Device]
+    ids: dict[Device, int]
+    outputs: list[list[int]]
+    inputs: list[list[int]]
 
-    queue = deque([[START]])
 
-    while queue:
-        *history, device = queue.pop()
+def count_paths(graph: DeviceGraph, start: Device, end: Device) -> int:
+    counts = [0] * len(graph.names)
+    counts[graph.ids[start]] = 1
 
-        for next_device in devices_map[device]:
-            path = (*history, device, next_device)
+    for device in _sort_between(graph, start, end):
+        for output in graph.outputs[device]:
+            counts[output] += counts[device]
 
-            if next_device == END:
-                res.add(path)
-            elif next_device not in path[:-1]:
-                queue.append(path)
+    return counts[graph.ids[end]]
 
-    return res
 
+def build_graph(raw_devices: Iterable[str]) -> DeviceGraph:
+    names: list[Device] = []
+    ids: dict[Device, int] = {}
+    outputs: list[list[int]] = []
+    inputs: list[list[int]] = []
+
+    def intern(name: Device) -> int:
+        if name not in ids:
+            ids[name] = len(names)
+            names.append(name)
+            outputs.append([])
+            inputs.append([])
+        return ids[name]
 
-def _parse_devices(raw_devices: list[str]) -> dict[Device, list[Device]]:
-    res = defaultdict(list)
     for raw_device in raw_devices:
         from_, to_ = raw_device.split(": ")
-        res[from_] = to_.split(" ")
+        device = intern(from_)
+        outputs[device] = [intern(name) for name in to_.split(" ")]
+        for output in outputs[device]:
+            inputs[output].append(device)
+
+    return DeviceGraph(names, ids, outputs, inputs)
+
+
+def _sort_between(graph: DeviceGraph, start: Device, end: Device) -> list[int]:
+    # only devices on some path from start to end are sorted,
+    # so cycles elsewhere in the graph do not matter
+    start_id, end_id = graph.ids[start], graph.ids[end]
+    from_start = _get_reachable(graph.outputs, start_id)
+    to_end = _get_reachable(graph.inputs, end_id)
+    between = bytes(a & b for a, b in zip(from_start, to_end))
+
+    pending = array("l", [0]) * len(between)
+    for device, is_between in enumerate(between):
+        if is_between:
+            for output in graph.outputs[device]:
+                pending[output] += between[output]
+
+    res = [start_id] if between[start_id] and not pending[start_id] else []
+
+    for device in res:
+        for output in graph.outputs[device]:
+            if between[output]:
+                pending[output] -= 1
+                if not pending[output]:
+                    res.append(output)
+
+    if len(res) < sum(between):
+        msg = f"Devices between {start} and {end} form a cycle"
+        raise ValueError(msg)
+
     return res
 
 
-assert _parse_devices(["aaa: you hhh"]) == {"aaa": ["you", "hhh"]}
+def _get_reachable(edges: list[list[int]], device: int) -> bytearray:
+    res = bytearray(len(edges))
+    res[device] = 1
+    stack = [device]
+
+    while stack:
+        for other in edges[stack.pop()]:
+            if not res[other]:
+                res[other] = 1
+                stack.append(other)
+
+    return res
+
+
+assert build_graph(["aaa: you hhh"]) == DeviceGraph(
+    ["aaa", "you", "hhh"],
+    {"aaa": 0, "you": 1, "hhh": 2},
+    [[1, 2], [], []],
+    [[], [0], [0]],
+)
+
+assert _get_reachable([[1], [2], [], [0]], 0) == bytearray([1, 1, 1, 0])
+
+graph = build_graph(["aaa: bbb ccc", "bbb: ddd", "ccc: ccc ddd", "eee: aaa bbb"])
+assert _sort_between(graph, "aaa", "bbb") == [0, 1]
+assert _sort_between(graph, "bbb", "aaa") == []
+assert count_paths(graph, "eee", "bbb") == 2
 
 devices = [
     "aaa: you hhh",
@@ -111,15 +182,15 @@ devices = [
     "hhh: ccc fff iii",
     "iii: out",
 ]
-assert find_paths(devices) == {
-    ("you", "bbb", "ddd", "ggg", "out"),
-    ("you", "bbb", "eee", "out"),
-    ("you", "ccc", "ddd", "ggg", "out"),
-    ("you", "ccc", "eee", "out"),
-    ("you", "ccc", "fff", "out"),
-}
+graph = build_graph(devices)
+assert count_paths(graph, START, END) == 5
+assert count_paths(graph, "aaa", END) == 5 + 5
+assert count_paths(graph, END, START) == 0
+
+graph = build_graph([*devices, "hhh: ccc fff iii jjj", "jjj: kkk", "kkk: jjj"])
+assert count_paths(graph, "aaa", END) == 5 + 5
 
 
 with open("2025/11_reactor/input.txt") as f:
-    lines = [line.strip() for line in f]
-    print(len(find_paths(lines)))
+    graph = build_graph(line.strip() for line in f)
+    print(count_paths(graph, START, END))
@@ -0,0 +1,195 @@
+"""
+Thanks in part to your analysis, the Elves have figured out
+a little bit about the issue. They now know that the problematic data path
+passes through both dac (a digital-to-analog converter)
+and fft (a device which performs a fast Fourier transform).
+
+They're still not sure which specific path is the problem,
+and so they now need you to find every path from svr (the server rack) to out.
+However, the paths you find must all also visit both dac and fft (in any order).
+
+For example:
+
+svr: aaa bbb
+aaa: fft
+fft: ccc
+bbb: tty
+tty: ccc
+ccc: ddd eee
+ddd: hub
+hub: fff
+eee: dac
+dac: fff
+fff: ggg hhh
+ggg: out
+hhh: out
+
+This new list of devices contains many paths from svr to out:
+
+svr,aaa,fft,ccc,ddd,hub,fff,ggg,out
+svr,aaa,fft,ccc,ddd,hub,fff,hhh,out
+svr,aaa,fft,ccc,eee,dac,fff,ggg,out
+svr,aaa,fft,ccc,eee,dac,fff,hhh,out
+svr,bbb,tty,ccc,ddd,hub,fff,ggg,out
+svr,bbb,tty,ccc,ddd,hub,fff,hhh,out
+svr,bbb,tty,ccc,eee,dac,fff,ggg,out
+svr,bbb,tty,ccc,eee,dac,fff,hhh,out
+
+However, only 2 paths from svr to out visit both dac and fft.
+
+Find all of the paths that lead from svr to out.
+How many of those paths visit both dac and fft?
+"""
+
+from array import array
+from collections.abc import Iterable
+from itertools import pairwise
+from math import prod
+from typing import NamedTuple
+
+type Device = str
+
+START, END = "svr", "out"
+VISITS = ("dac", "fft")
+
+
+class DeviceGraph(NamedTuple):
+    names: list[Device]
+    ids: dict[Device, int]
+    outputs: list[list[int]]
+    inputs: list[list[int]]
+
+
+def count_paths(graph: DeviceGraph, start: Device, end: Device) -> int:
+    counts = [0] * len(graph.names)
+    counts[graph.ids[start]] = 1
+
+    for device in _sort_between(graph, start, end):
+        for output in graph.outputs[device]:
+            counts[output] += counts[device]
+
+    return counts[graph.ids[end]]
+
+
+def build_graph(raw_devices: Iterable[str]) -> DeviceGraph:
+    names: list[Device] = []
+    ids: dict[Device, int] = {}
+    outputs: list[list[int]] = []
+    inputs: list[list[int]] = []
+
+    def intern(name: Device) -> int:
+        if name not in ids:
+            ids[name] = len(names)
+            names.append(name)
+            outputs.append([])
+            inputs.append([])
+        return ids[name]
+
+    for raw_device in raw_devices:
+        from_, to_ = raw_device.split(": ")
+        device = intern(from_)
+        outputs[device] = [intern(name) for name in to_.split(" ")]
+        for output in outputs[device]:
+            inputs[output].append(device)
+
+    return DeviceGraph(names, ids, outputs, inputs)
+
+
+def _sort_between(graph: DeviceGraph, start: Device, end: Device) -> list[int]:
+    # only devices on some path from start to end are sorted,
+    # so cycles elsewhere in the graph do not matter
+    start_id, end_id = graph.ids[start], graph.ids[end]
+    from_start = _get_reachable(graph.outputs, start_id)
+    to_end = _get_reachable(graph.inputs, end_id)
+    between = bytes(a & b for a, b in zip(from_start, to_end))
+
+    pending = array("l", [0]) * len(between)
+    for device, is_between in enumerate(between):
+        if is_between:
+            for output in graph.outputs[device]:
+                pending[output] += between[output]
+
+    res = [start_id] if between[start_id] and not pending[start_id] else []
+
+    for device in res:
+        for output in graph.outputs[device]:
+            if between[output]:
+                pending[output] -= 1
+                if not pending[output]:
+                    res.append(output)
+
+    if len(res) < sum(between):
+        msg = f"Devices between {start} and {end} form a cycle"
+        raise ValueError(msg)
+
+    return res
+
+
+def _get_reachable(edges: list[list[int]], device: int) -> bytearray:
+    res = bytearray(len(edges))
+    res[device] = 1
+    stack = [device]
+
+    while stack:
+        for other in edges[stack.pop()]:
+            if not res[other]:
+                res[other] = 1
+                stack.append(other)
+
+    return res
+
+
+def count_paths_through(
+    graph: DeviceGraph,
+    start: Device,
+    end: Device,
+    visits: Iterable[Device],
+) -> int:
+    # in a DAG the devices to visit can only come in topological order,
+    # so the paths are the product of the paths between consecutive stops
+    order = _sort_between(graph, start, end)
+    position = {graph.names[device]: i for i, device in enumerate(order)}
+
+    stops = list(visits)
+    if any(stop not in position for stop in stops):
+        return 0
+
+    stops.sort(key=position.__getitem__)
+    return prod(
+        count_paths(graph, *segment) for segment in pairwise([start, *stops, end])
+    )
+
+
+devices = [
+    "svr: aaa bbb",
+    "aaa: fft",
+    "fft: ccc",
+    "bbb: tty",
+    "tty: ccc",
+    "ccc: ddd eee",
+    "ddd: hub",
+    "hub: fff",
+    "eee: dac",
+    "dac: fff",
+    "fff: ggg hhh",
+    "ggg: out",
+    "hhh: out",
+]
+graph = build_graph(devices)
+assert count_paths(graph, START, END) == 8
+assert count_paths_through(graph, START, END, []) == 8
+assert count_paths_through(graph, START, END, ["dac"]) == 4
+assert count_paths_through(graph, START, END, VISITS) == 2
+assert count_paths_through(graph, START, END, ["fft", "dac"]) == 2
+assert count_paths_through(graph, START, END, ["hub", "dac"]) == 0
+assert count_paths_through(graph, START, END, ["svr"]) == 8
+assert count_paths_through(graph, "aaa", END, ["dac"]) == 2
+assert count_paths_through(graph, "eee", END, ["hub"]) == 0
+
+graph = build_graph([*devices, "dac: fff iii", "iii: iii"])
+assert count_paths_through(graph, START, END, VISITS) == 2
+
+
+with open("2025/11_reactor/input.txt") as f:
+    graph = build_graph(line.strip() for line in f)
+    print(count_paths_through(graph, START, END, VISITS))